@@ -0,0 +1,345 @@
+"""
+비동기 OpenAI 클라이언트 모듈
+전용 이벤트 루프 스레드와 공유 HTTP 연결 풀을 사용하여 OpenAI API를 호출합니다.
+동기 코드에서는 call_openai_batch / run_sync로 여러 호출을 동시에 실행할 수 있습니다.
+"""
+
+import os
+import time
+import atexit
+import asyncio
+import contextlib
+import threading
+import concurrent.futures
+from typing import Dict, List, Any, Tuple, Union, Optional, Coroutine
+import aiohttp
+import openai
+from config import Config
+from utils.token_utils import (
+    calculate_token_cost,
+    build_cache_hit_token_info,
+    estimate_request_tokens,
+)
+from utils.logging import logger
+from api.response_cache import response_cache
+from api.rate_limiter import rate_limiter
+from api.llm_scheduler import llm_scheduler
+from utils.usage_ledger import usage_ledger, current_usage_owner
+from utils.job_queue import current_job, JobCancelledError
+
+
+# 재시도 대상 오류 (서버 오류, 과부하(503), 연결 실패, 제한 시간 초과)
+RETRYABLE_ERRORS = (
+    openai.error.APIError,
+    openai.error.ServiceUnavailableError,
+    openai.error.APIConnectionError,
+    openai.error.Timeout,
+)
+
+
+class _EventLoopRunner:
+    """백그라운드 스레드에서 이벤트 루프와 공유 aiohttp 세션을 관리합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._pid: Optional[int] = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """이벤트 루프 스레드를 필요할 때 시작합니다. (fork 후에는 새로 시작)"""
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._session = None
+                self._pid = os.getpid()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="openai-event-loop",
+                    daemon=True,
+                )
+                self._thread.start()
+                logger.info("OpenAI 비동기 이벤트 루프 시작")
+            return self._loop
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """루프 안에서 공유 세션을 반환합니다. (연결 재사용)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=Config.OPENAI_POOL_SIZE, keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """
+        코루틴을 이벤트 루프에 제출하고 기다리지 않고 Future를 반환합니다.
+        호출 스레드의 컨텍스트 변수는 코루틴으로 전달됩니다.
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "이벤트 루프 스레드 안에서는 동기 래퍼를 사용할 수 없습니다. await를 사용하세요."
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """코루틴을 이벤트 루프에서 실행하고 결과를 기다립니다."""
+        return self.submit(coro).result(timeout)
+
+    def shutdown(self) -> None:
+        """세션을 닫고 이벤트 루프를 정지합니다."""
+        if self._loop is None or self._pid != os.getpid():
+            return
+        if self._session is not None and not self._session.closed:
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self._session.close(), self._loop
+                ).result(5)
+            except Exception as e:
+                logger.warning(f"OpenAI 세션 종료 중 오류: {str(e)}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+_runner = _EventLoopRunner()
+atexit.register(_runner.shutdown)
+
+
+def run_sync(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """동기 코드에서 코루틴을 공유 이벤트 루프로 실행하고 결과를 반환합니다."""
+    return _runner.run(coro, timeout)
+
+
+def submit_async(coro: Coroutine) -> concurrent.futures.Future:
+    """
+    동기 코드에서 코루틴을 공유 이벤트 루프에 제출합니다.
+    완료를 기다리지 않으며, 반환된 Future를 취소하면 코루틴도 취소됩니다.
+    """
+    return _runner.submit(coro)
+
+
+async def acall_openai_api(
+    messages: List[Dict[str, str]],
+    model: str = Config.OPENAI_MODEL,
+    temperature: float = 0.2,
+    max_tokens: int = None,
+    max_retries: int = 3,
+    initial_retry_delay: float = 1.0,
+    use_cache: Optional[bool] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Union[int, float, str]]]:
+    """
+    OpenAI API를 비동기로 호출하여 응답을 받아옵니다.
+
+    Args:
+        messages: 메시지 리스트
+        model: 사용할 모델
+        temperature: 생성 다양성 조절
+        max_tokens: 최대 생성 토큰 수
+        max_retries: 최대 재시도 횟수
+        initial_retry_delay: 초기 재시도 지연 시간(초)
+        use_cache: 응답 캐시 사용 여부 (None이면 낮은 temperature 호출에만 사용)
+        timeout: 시도별 제한 시간(초), None이면 설정값 사용
+
+    Returns:
+        응답 내용과 토큰 사용량 정보를 포함한 튜플
+    """
+    retry_delay = initial_retry_delay
+    timeout = timeout or Config.OPENAI_CALL_TIMEOUT
+    request_args = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+    }
+
+    if max_tokens:
+        request_args["max_tokens"] = max_tokens
+
+    if use_cache is None:
+        use_cache = temperature <= Config.LLM_CACHE_MAX_TEMPERATURE
+    cache = response_cache if use_cache else None
+
+    # 캐시/속도 제한 DB 조회는 블로킹(SQLite 잠금 대기)이므로 루프 밖 스레드에서 수행
+    loop = asyncio.get_running_loop()
+
+    cache_key = None
+    if cache:
+        cache_key = cache.make_key(request_args)
+        if cached := await loop.run_in_executor(None, cache.get, cache_key):
+            token_info = build_cache_hit_token_info(cached["token_info"])
+            logger.info(
+                f"OpenAI 응답 캐시 적중: 모델={model}, "
+                f"절감 비용(KRW)={token_info['saved_cost_krw']:.2f}원"
+            )
+            return {
+                "content": cached["content"],
+                "usage": cached["usage"],
+                "cached": True,
+            }, token_info
+
+    # 이 태스크에서 만드는 요청은 공유 연결 풀을 사용
+    openai.aiosession.set(await _runner.get_session())
+
+    if usage_ledger:
+        # 예산 초과 요청은 호출 전에 거부 (누적 비용 조회는 블로킹이므로 루프 밖에서 수행)
+        await loop.run_in_executor(
+            None, usage_ledger.check_budget, current_usage_owner.get()
+        )
+
+    start_time = time.time()
+    estimated_tokens = estimate_request_tokens(messages, model, max_tokens)
+
+    for attempt in range(max_retries):
+        try:
+            logger.info(
+                f"OpenAI API 호출 시작: 모델={model}, 시도={attempt + 1}/{max_retries}"
+            )
+
+            # 사용자/우선순위별 공정 순서로 호출 슬롯을 받은 뒤 실행 (재시도 대기 중에는 반납)
+            async with (
+                llm_scheduler.aslot(estimated_tokens / 1000)
+                if llm_scheduler
+                else contextlib.nullcontext()
+            ):
+                # 대기 중에 취소된 작업의 호출은 비용을 쓰기 전에 중단
+                job = current_job.get()
+                if job is not None:
+                    job.check_cancelled()
+
+                if rate_limiter:
+                    # 속도 제한 대기는 블로킹이므로 루프 밖 스레드에서 수행
+                    await loop.run_in_executor(
+                        None, rate_limiter.acquire, estimated_tokens
+                    )
+
+                try:
+                    try:
+                        response = await asyncio.wait_for(
+                            openai.ChatCompletion.acreate(**request_args), timeout
+                        )
+                    except asyncio.TimeoutError:
+                        raise openai.error.Timeout(
+                            f"OpenAI API 응답이 {timeout}초 안에 도착하지 않음"
+                        )
+                except (openai.error.RateLimitError, *RETRYABLE_ERRORS):
+                    # 실패한 시도에 차감한 토큰은 돌려줌 (재시도에서 다시 확보)
+                    if rate_limiter:
+                        await loop.run_in_executor(
+                            None, rate_limiter.reconcile, estimated_tokens, 0
+                        )
+                    raise
+
+            result = {
+                "content": response.choices[0].message.content.strip(),
+                "usage": response.usage,
+            }
+
+            input_tokens = result["usage"]["prompt_tokens"]
+            output_tokens = result["usage"]["completion_tokens"]
+            token_info = calculate_token_cost(input_tokens, output_tokens, model)
+
+            if rate_limiter:
+                await loop.run_in_executor(
+                    None,
+                    rate_limiter.reconcile,
+                    estimated_tokens,
+                    input_tokens + output_tokens,
+                )
+            if usage_ledger:
+                usage_ledger.record(token_info)
+
+            processing_time = time.time() - start_time
+            logger.info(
+                f"OpenAI API 응답 수신: 처리 시간={processing_time:.2f}초, "
+                f"입력 토큰={input_tokens}, 출력 토큰={output_tokens}, "
+                f"비용(KRW)={token_info['cost_krw']:.2f}원"
+            )
+
+            if cache:
+                await loop.run_in_executor(
+                    None,
+                    cache.set,
+                    cache_key,
+                    {
+                        "content": result["content"],
+                        "usage": dict(result["usage"]),
+                        "token_info": token_info,
+                    },
+                )
+
+            return result, token_info
+
+        except openai.error.RateLimitError:
+            if attempt < max_retries - 1:
+                logger.warning(
+                    f"API 속도 제한, {retry_delay}초 후 재시도 ({attempt + 1}/{max_retries})"
+                )
+                await asyncio.sleep(retry_delay)
+                retry_delay *= 2
+            else:
+                logger.error("API 속도 제한으로 최대 재시도 횟수 초과")
+                raise
+
+        except RETRYABLE_ERRORS as e:
+            logger.error(f"OpenAI API 오류: {str(e)}")
+            if attempt < max_retries - 1:
+                logger.warning(
+                    f"API 오류, {retry_delay}초 후 재시도 ({attempt + 1}/{max_retries})"
+                )
+                await asyncio.sleep(retry_delay)
+                retry_delay *= 2
+            else:
+                raise
+
+        except JobCancelledError:
+            raise
+
+        except Exception as e:
+            logger.error(f"예상치 못한 오류: {str(e)}")
+            raise
+
+
+async def agather_openai(
+    requests: List[Dict[str, Any]],
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = True,
+) -> List[Any]:
+    """
+    여러 OpenAI 호출을 동시에 실행하고 입력 순서대로 결과를 반환합니다.
+
+    Args:
+        requests: acall_openai_api 키워드 인자 사전 목록 (messages 필수)
+        max_concurrency: 동시 실행 한도 (None이면 설정값 사용)
+        return_exceptions: True이면 실패한 호출 자리에 예외 객체를 반환
+
+    Returns:
+        (결과, 토큰 정보) 튜플 또는 예외 객체의 목록
+    """
+    semaphore = asyncio.Semaphore(
+        max(1, max_concurrency or Config.OPENAI_BATCH_CONCURRENCY)
+    )
+
+    async def call_one(kwargs: Dict[str, Any]):
+        async with semaphore:
+            return await acall_openai_api(**kwargs)
+
+    return await asyncio.gather(
+        *(call_one(kwargs) for kwargs in requests),
+        return_exceptions=return_exceptions,
+    )
+
+
+def call_openai_batch(
+    requests: List[Dict[str, Any]],
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = True,
+) -> List[Any]:
+    """
+    agather_openai의 동기 래퍼입니다.
+    하나의 워커 스레드에서 여러 OpenAI 호출을 공유 연결 풀로 동시에 실행합니다.
+    """
+    if not requests:
+        return []
+    return run_sync(agather_openai(requests, max_concurrency, return_exceptions))
@@ -0,0 +1,660 @@
+"""
+초안 일괄 생성 모듈
+같은 템플릿으로 여러 사용자 입력(CSV 행)의 초안을 한 번에 생성합니다.
+공유 템플릿 컨텍스트는 배치를 만들 때 한 번만 구성해 저장하고, 행별 호출은 공유 이벤트
+루프에서 속도 제한 안에서 동시에 실행합니다. 완료된 행은 체크포인트 파일에 바로 덧붙이므로
+프로세스가 중단되어도 남은 행부터 이어서 실행할 수 있고, 결과는 ZIP으로 스트리밍합니다.
+
+CLI 사용 예:
+    python -m api.batch_drafts --rows rows.csv --templates search.json -o drafts.zip
+    python -m api.batch_drafts --resume <batch_id> -o drafts.zip
+"""
+
+import os
+import io
+import csv
+import json
+import time
+import uuid
+import queue
+import shutil
+import asyncio
+import zipfile
+import argparse
+import hashlib
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, IO
+from slugify import slugify
+from config import Config
+from utils.logging import logger
+from utils.usage_ledger import BudgetExceededError
+from api.async_openai import acall_openai_api, submit_async
+from api.openai_api import (
+    DRAFT_SYSTEM_PROMPT,
+    build_template_context,
+    format_user_requirements,
+)
+
+try:
+    import fcntl
+except ImportError:
+    # Windows 등 fcntl이 없으면 프로세스 안에서만 중복 실행을 막음
+    fcntl = None
+
+# 결과 상태
+ROW_SUCCEEDED = "succeeded"
+ROW_FAILED = "failed"
+
+# 배치 실행 잠금 파일 (배치 디렉터리 안, 실행 중인 프로세스가 flock으로 점유)
+LOCK_FILE = "run.lock"
+
+# 행 결과를 기다리며 생성 코루틴의 비정상 종료를 확인하는 간격(초)
+OUTCOME_POLL_INTERVAL = 1.0
+
+
+class BatchNotFoundError(Exception):
+    """배치를 찾을 수 없을 때 발생하는 예외"""
+
+
+class BatchBusyError(Exception):
+    """같은 배치가 이미 실행 중일 때 발생하는 예외"""
+
+
+def parse_rows_csv(text: str) -> List[Dict[str, str]]:
+    """
+    CSV 텍스트를 사용자 입력 행 목록으로 변환합니다.
+    user_input 열이 있으면 제목(title)으로 사용하고, 나머지 열은 추가 요구사항으로 넣습니다.
+    """
+    reader = csv.DictReader(io.StringIO(text.lstrip("\ufeff")))
+    rows = []
+    for record in reader:
+        values = {
+            (key or "").strip(): (value or "").strip()
+            for key, value in record.items()
+            if key
+        }
+        if "user_input" in values:
+            values = {"title": values.pop("user_input"), **values}
+        if any(values.values()):
+            rows.append(values)
+    return rows
+
+
+def normalize_rows(rows: List[Any]) -> List[Dict[str, str]]:
+    """JSON 요청의 행(문자열 또는 사전)을 사용자 입력 사전 목록으로 변환합니다."""
+    normalized = []
+    for row in rows:
+        if isinstance(row, dict):
+            values = {str(k): str(v).strip() for k, v in row.items() if v is not None}
+            if "user_input" in values:
+                values = {"title": values.pop("user_input"), **values}
+        else:
+            values = {"title": str(row).strip()}
+        if any(values.values()):
+            normalized.append(values)
+    return normalized
+
+
+def build_batch_messages(
+    user_input: Dict[str, str], template_context: str
+) -> List[Dict[str, str]]:
+    """
+    배치 행별 프롬프트 메시지를 구성합니다.
+    모든 행이 같은 참고 템플릿을 시스템 메시지 앞부분에 공유하므로
+    제공자의 프롬프트 접두사 캐시를 적용받을 수 있습니다.
+    """
+    return [
+        {
+            "role": "system",
+            "content": f"{DRAFT_SYSTEM_PROMPT}\n\n## 참고 템플릿\n{template_context}",
+        },
+        {
+            "role": "user",
+            "content": f"""## 사용자 요구사항
+{format_user_requirements(user_input)}
+
+위 요구사항과 참고 템플릿을 기반으로 보고서를 작성해주세요.""",
+        },
+    ]
+
+
+def row_title(user_input: Dict[str, str]) -> str:
+    """행의 보고서 제목 (title이 없으면 첫 번째 값)"""
+    return user_input.get("title") or next(
+        (value for value in user_input.values() if value), "제목 없음"
+    )
+
+
+class _ChunkWriter(io.RawIOBase):
+    """ZipFile이 쓴 바이트를 모아 두었다가 꺼내 주는 탐색 불가 스트림"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class BatchDraftStore:
+    """
+    배치 디렉터리 저장소
+    배치마다 manifest.json(설정), context.json(공유 템플릿 컨텍스트), rows.jsonl(입력),
+    results.jsonl(행별 결과 체크포인트, 덧붙이기 전용)을 보관합니다.
+    """
+
+    def __init__(self, root_dir: str, retention_seconds: int = 30 * 24 * 3600):
+        self.root_dir = root_dir
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        # 이 프로세스에서 실행 중인 배치 ID와 점유한 잠금 파일
+        self._running: Dict[str, Optional[IO]] = {}
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _path(self, batch_id: str, name: str = "") -> str:
+        # 배치 ID는 uuid hex만 허용 (경로 조작 방지)
+        if not batch_id or not all(c in "0123456789abcdef" for c in batch_id):
+            raise BatchNotFoundError(batch_id)
+        return os.path.join(self.root_dir, batch_id, name)
+
+    @staticmethod
+    def _write_json(path: str, data: Any) -> None:
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def create(
+        self,
+        templates: List[Dict[str, Any]],
+        rows: List[Dict[str, str]],
+        owner: Optional[int] = None,
+        use_cache: bool = False,
+        redundant_templates: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        배치를 만들고 공유 템플릿 컨텍스트를 한 번 구성하여 저장합니다.
+
+        Returns:
+            배치 설정 (manifest)
+        """
+        self._purge_expired()
+        batch_id = uuid.uuid4().hex
+        os.makedirs(self._path(batch_id))
+
+        template_context = build_template_context(templates)
+        manifest = {
+            "id": batch_id,
+            "owner": owner,
+            "created_at": time.time(),
+            "template_ids": [template.get("id") for template in templates],
+            "redundant_templates": redundant_templates or [],
+            "context_hash": hashlib.sha256(template_context.encode()).hexdigest(),
+            "total": len(rows),
+            "use_cache": use_cache,
+        }
+        self._write_json(
+            self._path(batch_id, "context.json"),
+            {
+                "templates": [
+                    {"id": t.get("id"), "title": t.get("title", "")} for t in templates
+                ],
+                "template_context": template_context,
+            },
+        )
+        with open(self._path(batch_id, "rows.jsonl"), "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        # manifest를 마지막에 써서 입력이 다 저장된 배치만 조회되도록 함
+        self._write_json(self._path(batch_id, "manifest.json"), manifest)
+
+        logger.info(
+            f"초안 배치 생성: ID={batch_id}, 행 수={len(rows)}, "
+            f"템플릿={manifest['template_ids']}, 컨텍스트 {len(template_context)}자"
+        )
+        return manifest
+
+    def get(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """배치 설정을 반환합니다. 없으면 None을 반환합니다."""
+        try:
+            with open(self._path(batch_id, "manifest.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (BatchNotFoundError, FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def require(self, batch_id: str) -> Dict[str, Any]:
+        """배치 설정을 반환합니다. 없으면 BatchNotFoundError를 발생시킵니다."""
+        manifest = self.get(batch_id)
+        if manifest is None:
+            raise BatchNotFoundError(batch_id)
+        return manifest
+
+    def load_context(self, batch_id: str) -> Dict[str, Any]:
+        with open(self._path(batch_id, "context.json"), encoding="utf-8") as f:
+            return json.load(f)
+
+    def load_rows(self, batch_id: str) -> List[Dict[str, str]]:
+        with open(self._path(batch_id, "rows.jsonl"), encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def append_result(self, batch_id: str, record: Dict[str, Any]) -> None:
+        """행 결과를 체크포인트 파일에 덧붙이고 디스크에 반영합니다."""
+        with open(self._path(batch_id, "results.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def repair_results(self, batch_id: str) -> None:
+        """중단 중에 잘린 마지막 줄을 잘라내어 다음 결과가 새 줄에서 시작하도록 합니다."""
+        path = self._path(batch_id, "results.jsonl")
+        try:
+            with open(path, "rb+") as f:
+                data = f.read()
+                if data and not data.endswith(b"\n"):
+                    f.truncate(data.rfind(b"\n") + 1)
+                    logger.warning(f"초안 배치 체크포인트의 잘린 줄 제거: {batch_id}")
+        except FileNotFoundError:
+            pass
+
+    def latest_results(self, batch_id: str) -> Dict[int, Dict[str, Any]]:
+        """
+        행 번호별 마지막 결과를 반환합니다.
+        중단 중에 잘린 마지막 줄은 완료되지 않은 것으로 보고 건너뜁니다.
+        """
+        results = {}
+        try:
+            with open(self._path(batch_id, "results.jsonl"), encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    results[record["index"]] = record
+        except FileNotFoundError:
+            pass
+        return results
+
+    def status(self, batch_id: str) -> Dict[str, Any]:
+        """배치 설정과 행 상태별 개수를 반환합니다."""
+        manifest = self.require(batch_id)
+        results = self.latest_results(batch_id)
+        succeeded = sum(1 for r in results.values() if r["status"] == ROW_SUCCEEDED)
+        failed = len(results) - succeeded
+        running = self.is_running(batch_id)
+        return {
+            **manifest,
+            "succeeded": succeeded,
+            "failed": failed,
+            "pending": manifest["total"] - succeeded - failed,
+            "running": running,
+            "complete": succeeded == manifest["total"],
+            "cost_krw": round(
+                sum(
+                    r.get("token_info", {}).get("cost_krw", 0) for r in results.values()
+                ),
+                2,
+            ),
+        }
+
+    def claim(self, batch_id: str) -> None:
+        """
+        배치 실행을 시작합니다. 이미 실행 중이면 BatchBusyError를 발생시킵니다.
+        배치 디렉터리의 잠금 파일을 flock으로 점유하므로 여러 워커 프로세스나 CLI가
+        같은 배치를 동시에 실행하지 않으며, 프로세스가 죽으면 잠금은 자동으로 풀립니다.
+        """
+        with self._lock:
+            if batch_id in self._running:
+                raise BatchBusyError(batch_id)
+            lock_file = None
+            if fcntl is not None:
+                lock_file = open(
+                    self._path(batch_id, LOCK_FILE), "a+", encoding="utf-8"
+                )
+                try:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    lock_file.close()
+                    raise BatchBusyError(batch_id)
+                # 진단용으로 점유한 프로세스 정보 기록
+                lock_file.seek(0)
+                lock_file.truncate()
+                lock_file.write(
+                    json.dumps({"pid": os.getpid(), "claimed_at": time.time()})
+                )
+                lock_file.flush()
+            self._running[batch_id] = lock_file
+
+    def release(self, batch_id: str) -> None:
+        with self._lock:
+            lock_file = self._running.pop(batch_id, None)
+        if lock_file is not None:
+            lock_file.truncate(0)
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            lock_file.close()
+
+    def is_running(self, batch_id: str) -> bool:
+        """이 프로세스나 다른 프로세스에서 배치를 실행 중인지 확인합니다."""
+        with self._lock:
+            if batch_id in self._running:
+                return True
+        if fcntl is None:
+            return False
+        try:
+            lock_file = open(self._path(batch_id, LOCK_FILE), "r", encoding="utf-8")
+        except (BatchNotFoundError, FileNotFoundError):
+            return False
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except OSError:
+            return True
+        finally:
+            # 공유 잠금은 파일을 닫으면 풀림
+            lock_file.close()
+        return False
+
+    def iter_archive(self, batch_id: str) -> Iterator[bytes]:
+        """
+        성공한 행의 초안을 ZIP으로 묶어 조각 단위로 반환합니다.
+        파일을 만들지 않고 행마다 압축한 바이트를 바로 내보내므로
+        실행 중인 배치도 그때까지 완료된 결과로 내려받을 수 있습니다.
+        """
+        manifest = self.require(batch_id)
+        rows = self.load_rows(batch_id)
+        results = self.latest_results(batch_id)
+
+        out = _ChunkWriter()
+        summary = io.StringIO()
+        writer = csv.writer(summary)
+        writer.writerow(["index", "title", "status", "file", "error", "cost_krw"])
+
+        with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+            for index, row in enumerate(rows):
+                record = results.get(index)
+                title = row_title(row)
+                if record is None:
+                    writer.writerow([index, title, "pending", "", "", ""])
+                    continue
+                if record["status"] != ROW_SUCCEEDED:
+                    writer.writerow(
+                        [index, title, record["status"], "", record.get("error"), ""]
+                    )
+                    continue
+
+                name = f"drafts/{index + 1:04d}_{slugify(title, allow_unicode=True)[:50] or 'draft'}.md"
+                archive.writestr(
+                    name,
+                    f"# {record['report']['title']}\n\n{record['report']['content']}\n",
+                )
+                writer.writerow(
+                    [
+                        index,
+                        title,
+                        record["status"],
+                        name,
+                        "",
+                        record.get("token_info", {}).get("cost_krw", ""),
+                    ]
+                )
+                yield out.drain()
+
+            archive.writestr("summary.csv", "\ufeff" + summary.getvalue())
+            archive.writestr(
+                "manifest.json", json.dumps(manifest, ensure_ascii=False, indent=2)
+            )
+        yield out.drain()
+
+    def _purge_expired(self) -> None:
+        """보관 기간이 지난 배치 디렉터리를 삭제합니다. (실행 중인 배치 제외)"""
+        cutoff = time.time() - self.retention_seconds
+        for batch_id in os.listdir(self.root_dir):
+            manifest = self.get(batch_id)
+            if self.is_running(batch_id):
+                continue
+            if manifest is not None and manifest["created_at"] >= cutoff:
+                continue
+            path = os.path.join(self.root_dir, batch_id)
+            # manifest 없이 만든 지 오래된 디렉터리는 생성 중 중단된 배치로 보고 정리
+            if manifest is None and os.path.getmtime(path) >= cutoff:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            logger.info(f"만료된 초안 배치 삭제: {batch_id}")
+
+
+async def _agenerate_rows(
+    pending: List[tuple],
+    template_context: str,
+    use_cache: bool,
+    concurrency: int,
+    outcomes: "queue.Queue",
+) -> None:
+    """행별 초안을 동시에 생성하고 완료되는 대로 (행 번호, 결과 또는 예외)를 넣습니다."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def generate_one(index: int, row: Dict[str, str]) -> None:
+        async with semaphore:
+            try:
+                outcome = await acall_openai_api(
+                    build_batch_messages(row, template_context),
+                    temperature=0.7,
+                    max_tokens=2000,
+                    use_cache=use_cache,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                outcome = e
+        outcomes.put((index, outcome))
+
+    await asyncio.gather(*(generate_one(index, row) for index, row in pending))
+
+
+def _next_outcome(outcomes: "queue.Queue", future) -> tuple:
+    """
+    다음 행 결과를 기다립니다. 생성 코루틴이 모든 결과를 넣지 못하고 끝났으면
+    (루프 종료로 취소, generate_one 밖의 오류 등) 그 오류를 발생시킵니다.
+    """
+    while True:
+        try:
+            return outcomes.get(timeout=OUTCOME_POLL_INTERVAL)
+        except queue.Empty:
+            if not future.done():
+                continue
+        # 코루틴이 끝나기 직전에 넣은 결과가 있으면 먼저 처리
+        try:
+            return outcomes.get_nowait()
+        except queue.Empty:
+            future.result()
+            raise RuntimeError("초안 생성이 일부 행의 결과 없이 종료되었습니다.")
+
+
+def run_batch(
+    batch_id: str,
+    store: Optional[BatchDraftStore] = None,
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    배치의 남은 행(성공하지 않은 행)을 생성합니다. 이미 성공한 행은 건너뛰므로
+    중단된 배치를 같은 함수로 이어서 실행할 수 있습니다.
+
+    Args:
+        batch_id: 배치 ID
+        store: 배치 저장소 (None이면 기본 저장소)
+        progress_callback: 진행률(0-100)과 메시지를 받는 함수 (예외를 발생시키면 실행 중단)
+        concurrency: 동시 생성 수 (None이면 설정값 사용)
+
+    Returns:
+        배치 상태 (status와 같은 형식)
+    """
+    store = store or batch_draft_store
+    manifest = store.require(batch_id)
+    store.claim(batch_id)
+    try:
+        store.repair_results(batch_id)
+        context = store.load_context(batch_id)
+        rows = store.load_rows(batch_id)
+        done = {
+            index
+            for index, record in store.latest_results(batch_id).items()
+            if record["status"] == ROW_SUCCEEDED
+        }
+        pending = [(index, row) for index, row in enumerate(rows) if index not in done]
+        total = len(rows)
+        logger.info(
+            f"초안 배치 실행: ID={batch_id}, 남은 행={len(pending)}/{total} "
+            f"(이미 완료 {len(done)}행 건너뜀)"
+        )
+
+        outcomes: "queue.Queue" = queue.Queue()
+        future = submit_async(
+            _agenerate_rows(
+                pending,
+                context["template_context"],
+                manifest.get("use_cache", False),
+                concurrency or Config.BATCH_DRAFT_CONCURRENCY,
+                outcomes,
+            )
+        )
+        completed = len(done)
+        try:
+            for _ in range(len(pending)):
+                index, outcome = _next_outcome(outcomes, future)
+                if isinstance(outcome, BudgetExceededError):
+                    # 남은 행도 모두 거부되므로 중단 (기록하지 않아 이어서 실행 가능)
+                    raise outcome
+
+                record = {"index": index, "finished_at": time.time()}
+                if isinstance(outcome, Exception):
+                    logger.error(
+                        f"초안 배치 행 실패: ID={batch_id}, 행={index}, 오류={outcome}"
+                    )
+                    record.update(status=ROW_FAILED, error=str(outcome))
+                else:
+                    result, token_info = outcome
+                    record.update(
+                        status=ROW_SUCCEEDED,
+                        report={
+                            "title": row_title(rows[index]),
+                            "content": result["content"],
+                            "timestamp": datetime.now().isoformat(),
+                        },
+                        token_info=token_info,
+                    )
+                    completed += 1
+                store.append_result(batch_id, record)
+
+                if progress_callback:
+                    progress_callback(
+                        int(completed * 100 / max(total, 1)),
+                        f"초안 {completed}/{total}건 생성",
+                    )
+        finally:
+            # 중단(취소/예산 초과/오류) 시 아직 실행 중인 호출을 취소
+            if not future.done():
+                future.cancel()
+
+        status = store.status(batch_id)
+        logger.info(
+            f"초안 배치 완료: ID={batch_id}, 성공={status['succeeded']}, "
+            f"실패={status['failed']}, 비용(KRW)={status['cost_krw']}원"
+        )
+        return status
+    finally:
+        store.release(batch_id)
+
+
+batch_draft_store = BatchDraftStore(
+    Config.BATCH_DRAFT_DIR, retention_seconds=Config.ARTIFACT_RETENTION_SECONDS
+)
+
+
+def _load_templates(
+    path: str, template_ids: Optional[List[str]]
+) -> List[Dict[str, Any]]:
+    """검색 결과 JSON(/api/search 응답 또는 항목 목록)에서 템플릿을 읽습니다."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    items = data.get("items", []) if isinstance(data, dict) else data
+    if template_ids:
+        by_id = {item.get("id"): item for item in items}
+        missing = [tid for tid in template_ids if tid not in by_id]
+        if missing:
+            raise SystemExit(f"템플릿을 찾을 수 없습니다: {missing}")
+        items = [by_id[tid] for tid in template_ids]
+    return items
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="초안 일괄 생성")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--rows", help="사용자 입력 CSV 파일 (user_input 열)")
+    source.add_argument("--resume", metavar="BATCH_ID", help="중단된 배치 이어서 실행")
+    parser.add_argument("--templates", help="템플릿 JSON 파일 (검색 결과)")
+    parser.add_argument("--template-ids", help="사용할 템플릿 ID (쉼표 구분)")
+    parser.add_argument("--concurrency", type=int, default=None)
+    parser.add_argument("--use-cache", action="store_true", help="응답 캐시 사용")
+    parser.add_argument("-o", "--output", help="결과 ZIP 파일 경로")
+    args = parser.parse_args(argv)
+
+    # 사용량 장부 저장 등 앱 설정을 초기화
+    from app import app
+
+    with app.app_context():
+        if args.resume:
+            batch_id = args.resume
+        else:
+            if not args.templates:
+                parser.error("--rows에는 --templates가 필요합니다.")
+            template_ids = (
+                [tid.strip() for tid in args.template_ids.split(",") if tid.strip()]
+                if args.template_ids
+                else None
+            )
+            templates = _load_templates(args.templates, template_ids)
+            with open(args.rows, encoding="utf-8-sig") as f:
+                rows = parse_rows_csv(f.read())
+            if not templates or not rows:
+                parser.error("템플릿과 입력 행이 모두 필요합니다.")
+            batch_id = batch_draft_store.create(
+                templates, rows, use_cache=args.use_cache
+            )["id"]
+            print(f"배치 ID: {batch_id}")
+
+        try:
+            status = run_batch(
+                batch_id,
+                progress_callback=lambda pct, msg: print(f"[{pct:3d}%] {msg}"),
+                concurrency=args.concurrency,
+            )
+        except BatchNotFoundError:
+            print(f"배치를 찾을 수 없습니다: {batch_id}")
+            return 1
+        except KeyboardInterrupt:
+            print(
+                f"중단됨. 이어서 실행: python -m api.batch_drafts --resume {batch_id}"
+            )
+            return 130
+
+        print(
+            f"성공 {status['succeeded']}건, 실패 {status['failed']}건, "
+            f"비용 {status['cost_krw']}원"
+        )
+        if args.output:
+            with open(args.output, "wb") as f:
+                for chunk in batch_draft_store.iter_archive(batch_id):
+                    f.write(chunk)
+            print(f"결과 저장: {args.output}")
+        return 0 if status["complete"] else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,8 +3,10 @@
 정부 문서 데이터를 검색하고 처리하는 기능을 제공합니다.
 """
 
+import os
 import json
 import time
+import hashlib
 import requests
 from config import Config
 from utils.logging import logger
@@ -28,6 +30,62 @@ def mask_api_key(url: str) -> str:
     return url
 
 
+def fixture_key(endpoint: str, params: dict) -> str:
+    """
+    요청 엔드포인트와 파라미터(인증키 제외)로 픽스처 키를 계산합니다.
+    기록 모드와 재생 서버가 같은 키를 사용합니다.
+
+    Args:
+        endpoint: API 엔드포인트 이름
+        params: 요청 파라미터
+
+    Returns:
+        SHA-256 해시 문자열
+    """
+    normalized = {
+        key: str(value) for key, value in params.items() if key != "serviceKey"
+    }
+    payload = json.dumps(
+        {"endpoint": endpoint, "params": normalized}, ensure_ascii=False, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def record_response(
+    endpoint: str, params: dict, data: dict, elapsed: float, api_key: str
+) -> None:
+    """
+    API 응답을 재생용 픽스처 파일로 저장합니다. 인증키는 파라미터와 응답에서 제거합니다.
+
+    Args:
+        endpoint: API 엔드포인트 이름
+        params: 요청 파라미터
+        data: API 응답 데이터
+        elapsed: 응답 시간(초)
+        api_key: 제거할 인증키
+    """
+    try:
+        os.makedirs(Config.GOV_API_RECORD_DIR, exist_ok=True)
+        fixture = {
+            "endpoint": endpoint,
+            "params": {k: v for k, v in params.items() if k != "serviceKey"},
+            "elapsed": round(elapsed, 3),
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "response": data,
+        }
+        text = json.dumps(fixture, ensure_ascii=False, indent=2)
+        if api_key:
+            text = text.replace(api_key, "")
+
+        key = fixture_key(endpoint, params)
+        path = os.path.join(Config.GOV_API_RECORD_DIR, f"{endpoint}_{key[:16]}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        logger.info(f"API 응답 픽스처 저장: {path}")
+    except Exception as e:
+        logger.warning(f"API 응답 픽스처 저장 실패: {str(e)}")
+
+
 def process_result_list(result_list, doc_type):
     """결과 리스트를 처리하여 표준화된 아이템으로 변환"""
     items = []
@@ -283,6 +341,14 @@ def fetch_government_templates(
 
             try:
                 data = response.json()
+                if Config.GOV_API_RECORD_DIR:
+                    record_response(
+                        endpoint,
+                        params,
+                        data,
+                        response.elapsed.total_seconds(),
+                        api_key,
+                    )
                 return parse_api_response(data, doc_type)
             except json.JSONDecodeError:
                 # JSON 파싱 실패 시 응답 내용 로깅
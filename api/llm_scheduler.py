@@ -0,0 +1,287 @@
+"""
+LLM 호출 스케줄러 모듈
+프로세스 안의 동시 OpenAI 호출 수를 제한하고, 대기 중인 호출을 사용자별 대기열에서
+가중 공정 큐잉(start-time fair queuing)으로 꺼내 실행합니다.
+한 사용자가 긴 분석을 여러 개 제출해도 다른 사용자의 요청이 뒤로 밀리지 않고,
+대화형 요청(초안 생성)은 백그라운드 작업(템플릿 분석, 일괄 생성)보다 큰 몫과
+예약 슬롯을 받아 대기 시간이 짧게 유지됩니다.
+"""
+
+import math
+import time
+import heapq
+import asyncio
+import itertools
+import threading
+import contextlib
+import contextvars
+from collections import defaultdict, deque
+from typing import Any, Callable, Dict, Optional
+from config import Config
+from utils.logging import logger
+from utils.job_queue import current_job
+from utils.usage_ledger import current_usage_owner
+
+# 우선순위 등급
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+# 추측 실행: 다른 등급의 대기 호출이 없을 때만 남는 슬롯으로 실행
+PRIORITY_SPECULATIVE = "speculative"
+
+# 호출 등급을 직접 지정할 때 사용
+# (None이면 백그라운드 작업 안에서는 작업의 priority 또는 background, 그 외 interactive)
+current_llm_priority: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "current_llm_priority", default=None
+)
+
+
+def resolve_priority() -> str:
+    """현재 컨텍스트의 LLM 호출 우선순위 등급을 반환합니다."""
+    priority = current_llm_priority.get()
+    if priority is not None:
+        return priority
+    job = current_job.get()
+    if job is None:
+        return PRIORITY_INTERACTIVE
+    return job.priority or PRIORITY_BACKGROUND
+
+
+class _Waiter:
+    """대기 중이거나 실행 중인 호출 하나"""
+
+    __slots__ = (
+        "priority",
+        "owner",
+        "start_tag",
+        "enqueued_at",
+        "granted",
+        "cancelled",
+        "notify",
+    )
+
+    def __init__(self, priority: str, owner: Optional[int], notify: Callable):
+        self.priority = priority
+        self.owner = owner
+        self.start_tag = 0.0
+        self.enqueued_at = time.perf_counter()
+        self.granted = False
+        self.cancelled = False
+        self.notify = notify
+
+
+class FairLLMScheduler:
+    """사용자별 가중 공정 큐잉 기반 LLM 호출 스케줄러
+
+    흐름(우선순위 등급, 사용자)마다 직전 호출의 가상 종료 시각을 기록하고, 새 호출의
+    시작 태그를 max(가상 시각, 직전 종료 시각)으로 정합니다. 종료 시각은 시작 태그에
+    예상 토큰 수 / 등급 가중치를 더한 값이므로, 호출을 많이 쌓은 사용자일수록 뒤 호출의
+    태그가 커지고 처음 요청한 사용자는 현재 가상 시각에서 바로 순서를 받습니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        weights: Optional[Dict[str, float]] = None,
+        interactive_reserve: int = 2,
+        metrics_window: int = 1000,
+    ):
+        """
+        Args:
+            max_concurrency: 동시에 실행할 최대 호출 수
+            weights: 등급별 가중치 (클수록 대기 호출 중 더 큰 몫을 받음)
+            interactive_reserve: 대화형 호출에만 쓰는 예약 슬롯 수
+            metrics_window: 등급별로 보관할 최근 대기 시간 수
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.weights = weights or {
+            PRIORITY_INTERACTIVE: 8.0,
+            PRIORITY_BACKGROUND: 1.0,
+            PRIORITY_SPECULATIVE: 0.25,
+        }
+        self.interactive_reserve = min(interactive_reserve, self.max_concurrency - 1)
+
+        self._lock = threading.Lock()
+        self._queues: Dict[str, list] = defaultdict(list)
+        self._sequence = itertools.count()
+        self._finish_tags: Dict[tuple, float] = {}
+        self._virtual_time = 0.0
+        self._active: Dict[str, int] = defaultdict(int)
+        self._queued: Dict[str, int] = defaultdict(int)
+        self._granted: Dict[str, int] = defaultdict(int)
+        self._waits: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=metrics_window)
+        )
+
+    def _can_start(self, priority: str) -> bool:
+        active = sum(self._active.values())
+        if active >= self.max_concurrency:
+            return False
+        if priority == PRIORITY_INTERACTIVE:
+            return True
+        if priority == PRIORITY_SPECULATIVE and any(
+            count for other, count in self._queued.items() if other != priority
+        ):
+            return False
+        return active < self.max_concurrency - self.interactive_reserve
+
+    def _grant(self, waiter: _Waiter) -> None:
+        waiter.granted = True
+        self._virtual_time = max(self._virtual_time, waiter.start_tag)
+        self._active[waiter.priority] += 1
+        self._granted[waiter.priority] += 1
+        wait = time.perf_counter() - waiter.enqueued_at
+        self._waits[waiter.priority].append(wait)
+        if wait >= 1.0:
+            logger.info(
+                f"LLM 호출 대기: 등급={waiter.priority}, 사용자={waiter.owner}, "
+                f"대기 시간={wait:.2f}초"
+            )
+        waiter.notify()
+
+    def _dispatch(self) -> None:
+        """실행 가능한 등급의 대기열 맨 앞 중 시작 태그가 가장 작은 호출부터 실행합니다."""
+        while True:
+            best = None
+            for priority, queue in self._queues.items():
+                while queue and queue[0][2].cancelled:
+                    heapq.heappop(queue)
+                if queue and self._can_start(priority):
+                    if best is None or queue[0] < self._queues[best][0]:
+                        best = priority
+            if best is None:
+                return
+            _, _, waiter = heapq.heappop(self._queues[best])
+            self._queued[best] -= 1
+            self._grant(waiter)
+
+    def _enqueue(self, cost: float, notify: Callable) -> _Waiter:
+        waiter = _Waiter(resolve_priority(), current_usage_owner.get(), notify)
+        weight = self.weights.get(waiter.priority, 1.0)
+        flow = (waiter.priority, waiter.owner)
+        with self._lock:
+            waiter.start_tag = max(self._virtual_time, self._finish_tags.get(flow, 0.0))
+            self._finish_tags[flow] = waiter.start_tag + max(cost, 1.0) / weight
+            if len(self._finish_tags) > 10000:
+                # 가상 시각보다 이전에 끝난 흐름은 기록이 없는 것과 같으므로 정리
+                self._finish_tags = {
+                    key: tag
+                    for key, tag in self._finish_tags.items()
+                    if tag > self._virtual_time
+                }
+            heapq.heappush(
+                self._queues[waiter.priority],
+                (waiter.start_tag, next(self._sequence), waiter),
+            )
+            self._queued[waiter.priority] += 1
+            self._dispatch()
+        return waiter
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """대기 중 취소된 호출을 대기열에서 빼거나, 이미 슬롯을 받았으면 반납합니다."""
+        with self._lock:
+            if not waiter.granted:
+                waiter.cancelled = True
+                self._queued[waiter.priority] -= 1
+                return
+        self.release(waiter)
+
+    def acquire(self, cost: float = 1.0) -> _Waiter:
+        """실행 순서가 될 때까지 현재 스레드를 대기시킵니다. (동기 호출용)"""
+        event = threading.Event()
+        waiter = self._enqueue(cost, event.set)
+        try:
+            event.wait()
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        return waiter
+
+    async def acquire_async(self, cost: float = 1.0) -> _Waiter:
+        """실행 순서가 될 때까지 현재 태스크를 대기시킵니다. (이벤트 루프용)"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def wake() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        # 다른 스레드의 release에서 깨울 수 있으므로 루프를 통해 결과 설정
+        waiter = self._enqueue(cost, lambda: loop.call_soon_threadsafe(wake))
+        try:
+            await future
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        return waiter
+
+    def release(self, waiter: _Waiter) -> None:
+        """실행이 끝난 호출의 슬롯을 반납하고 다음 호출을 실행합니다."""
+        with self._lock:
+            self._active[waiter.priority] -= 1
+            self._dispatch()
+
+    @contextlib.contextmanager
+    def slot(self, cost: float = 1.0):
+        """동기 코드에서 호출 슬롯을 점유하는 컨텍스트 매니저"""
+        waiter = self.acquire(cost)
+        try:
+            yield waiter
+        finally:
+            self.release(waiter)
+
+    @contextlib.asynccontextmanager
+    async def aslot(self, cost: float = 1.0):
+        """비동기 코드에서 호출 슬롯을 점유하는 컨텍스트 매니저"""
+        waiter = await self.acquire_async(cost)
+        try:
+            yield waiter
+        finally:
+            self.release(waiter)
+
+    def stats(self) -> Dict[str, Any]:
+        """등급별 실행/대기 수와 최근 대기 시간(밀리초) 통계를 반환합니다."""
+        with self._lock:
+            priorities = sorted(
+                set(self.weights) | set(self._active) | set(self._queued)
+            )
+            classes = {}
+            for priority in priorities:
+                waits = sorted(self._waits[priority])
+                classes[priority] = {
+                    "weight": self.weights.get(priority, 1.0),
+                    "active": self._active[priority],
+                    "queued": self._queued[priority],
+                    "granted": self._granted[priority],
+                    "wait_p50_ms": _percentile_ms(waits, 0.50),
+                    "wait_p95_ms": _percentile_ms(waits, 0.95),
+                    "wait_max_ms": round(waits[-1] * 1000, 1) if waits else 0.0,
+                }
+        return {
+            "max_concurrency": self.max_concurrency,
+            "interactive_reserve": self.interactive_reserve,
+            "classes": classes,
+        }
+
+
+def _percentile_ms(ordered, fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    # nearest-rank 방식
+    index = max(1, math.ceil(fraction * len(ordered))) - 1
+    return round(ordered[index] * 1000, 1)
+
+
+# 프로세스 전체 LLM 호출 스케줄러 (비활성화 시 None)
+llm_scheduler = (
+    FairLLMScheduler(
+        max_concurrency=Config.LLM_SCHEDULER_CONCURRENCY,
+        weights={
+            PRIORITY_INTERACTIVE: Config.LLM_WEIGHT_INTERACTIVE,
+            PRIORITY_BACKGROUND: Config.LLM_WEIGHT_BACKGROUND,
+            PRIORITY_SPECULATIVE: Config.LLM_WEIGHT_SPECULATIVE,
+        },
+        interactive_reserve=Config.LLM_SCHEDULER_INTERACTIVE_RESERVE,
+    )
+    if Config.LLM_SCHEDULER_ENABLED
+    else None
+)
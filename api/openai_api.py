@@ -7,14 +7,34 @@ import os
 import re
 import json
 import time
+import hashlib
+import contextlib
 import logging
-from typing import Dict, List, Any, Tuple, Union
+from typing import Dict, List, Any, Tuple, Union, Optional, Iterator, Callable
 from datetime import datetime
 import openai
 from dotenv import load_dotenv
 from config import Config
-from utils.token_utils import calculate_token_cost
+from utils.token_utils import (
+    calculate_token_cost,
+    build_cache_hit_token_info,
+    merge_token_infos,
+    estimate_request_tokens,
+)
 from utils.logging import logger
+from utils.html_utils import chunk_document
+from utils.doc_structure import get_document_structure, template_skeleton
+from utils.job_queue import JobCancelledError
+from api.response_cache import response_cache
+from api.rate_limiter import rate_limiter, RateLimitWaitTimeout
+from api.llm_scheduler import llm_scheduler
+from utils.usage_ledger import usage_ledger, BudgetExceededError
+from api.async_openai import (
+    RETRYABLE_ERRORS,
+    acall_openai_api,
+    call_openai_batch,
+    run_sync,
+)
 
 # 환경 변수 로드
 load_dotenv()
@@ -35,6 +55,10 @@ else:
     openai.api_key = OPENAI_API_KEY
     logger.info(f"OpenAI 모델: {OPENAI_MODEL}")
 
+if Config.OPENAI_API_BASE:
+    openai.api_base = Config.OPENAI_API_BASE
+    logger.info(f"OpenAI API 주소: {Config.OPENAI_API_BASE}")
+
 
 def call_openai_api(
     messages: List[Dict[str, str]],
@@ -43,9 +67,11 @@ def call_openai_api(
     max_tokens: int = None,
     max_retries: int = 3,
     initial_retry_delay: float = 1.0,
+    use_cache: Optional[bool] = None,
 ) -> Tuple[Dict[str, Any], Dict[str, Union[int, float, str]]]:
     """
     OpenAI API를 호출하여 응답을 받아옵니다.
+    공유 이벤트 루프에서 실행되는 acall_openai_api의 동기 래퍼입니다.
 
     Args:
         messages: 메시지 리스트
@@ -54,77 +80,185 @@ def call_openai_api(
         max_tokens: 최대 생성 토큰 수
         max_retries: 최대 재시도 횟수
         initial_retry_delay: 초기 재시도 지연 시간(초)
+        use_cache: 응답 캐시 사용 여부 (None이면 낮은 temperature 호출에만 사용)
 
     Returns:
         응답 내용과 토큰 사용량 정보를 포함한 튜플
     """
-    retry_delay = initial_retry_delay
-    request_args = {
-        "model": model,
-        "messages": messages,
-        "temperature": temperature,
-    }
+    return run_sync(
+        acall_openai_api(
+            messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            max_retries=max_retries,
+            initial_retry_delay=initial_retry_delay,
+            use_cache=use_cache,
+        )
+    )
+
+
+def _strip_tags(text: str) -> str:
+    """HTML 태그와 연속 공백을 제거합니다."""
+    clean_text = re.sub(r"<.*?>", " ", text) if text else ""
+    return re.sub(r"\s+", " ", clean_text).strip()
+
+
+DOCUMENT_CHUNK_PROMPT = """문서의 일부(청크)를 분석하여 다음 JSON 형식으로만 응답하세요:
+{"tone": {"formality": 0.0, "sentiment": 0.0, "objectivity": 0.0},
+ "keywords": ["핵심 키워드 (10개)"],
+ "summary": "요약 (200자 이내)"}"""
+
+
+def _analyze_document_chunks(
+    chunks: List[str],
+) -> List[Tuple[Optional[Dict[str, Any]], Dict[str, Union[int, float, str]]]]:
+    """
+    문서 청크들을 동시에 분석합니다.
+    실패한 청크는 (None, 오류 정보)로 반환합니다.
+    """
+    requests = [
+        {
+            "messages": [
+                {"role": "system", "content": DOCUMENT_CHUNK_PROMPT},
+                {"role": "user", "content": _strip_tags(chunk)},
+            ]
+        }
+        for chunk in chunks
+    ]
+    responses = call_openai_batch(requests, Config.DOCUMENT_ANALYSIS_CONCURRENCY)
+
+    results = []
+    for response in responses:
+        if isinstance(response, Exception):
+            logger.error(f"문서 청크 분석 실패: {str(response)}")
+            results.append((None, {"error": str(response)}))
+        else:
+            result, token_info = response
+            results.append((parse_json_response(result["content"]), token_info))
+    return results
+
+
+def _weighted_average(values: List[Tuple[Any, float]]) -> float:
+    """(값, 가중치) 목록의 가중 평균을 계산합니다. 숫자가 아닌 값은 무시합니다."""
+    numeric = [
+        (float(value), weight)
+        for value, weight in values
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    ]
+    total_weight = sum(weight for _, weight in numeric)
+    if not total_weight:
+        return 0
+    return round(sum(value * weight for value, weight in numeric) / total_weight, 3)
 
-    if max_tokens:
-        request_args["max_tokens"] = max_tokens
 
+def _merge_chunk_keywords(keyword_lists: List[List[Any]], limit: int = 10) -> List[str]:
+    """청크별 키워드를 순위 가중치로 합산하여 상위 키워드를 반환합니다."""
+    scores: Dict[str, float] = {}
+    for keywords in keyword_lists:
+        for rank, keyword in enumerate(keywords or []):
+            if isinstance(keyword, dict):
+                keyword = keyword.get("keyword") or keyword.get("word") or ""
+            keyword = str(keyword).strip()
+            if keyword:
+                scores[keyword] = scores.get(keyword, 0) + (len(keywords) - rank)
+    return [
+        keyword
+        for keyword, _ in sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+    ][:limit]
+
+
+def _summarize_chunk_summaries(
+    summaries: List[str],
+) -> Tuple[str, Dict[str, Union[int, float, str]]]:
+    """청크 요약들을 하나의 요약(200자 이내)으로 합칩니다."""
+    messages = [
+        {
+            "role": "system",
+            "content": "다음은 한 문서를 부분별로 요약한 내용입니다. 전체 문서의 요약을 200자 이내로 작성하세요. 요약문만 출력하세요.",
+        },
+        {
+            "role": "user",
+            "content": "\n".join(
+                f"{i + 1}. {summary}" for i, summary in enumerate(summaries)
+            ),
+        },
+    ]
+    try:
+        result, token_info = call_openai_api(messages)
+        return result["content"], token_info
+    except Exception as e:
+        logger.error(f"청크 요약 병합 실패: {str(e)}")
+        return " ".join(summaries)[:200], {"error": str(e)}
+
+
+def _analyze_document_chunked(text: str, chunks: List[str]) -> Dict[str, Any]:
+    """긴 문서를 청크 단위로 병렬 분석한 뒤 구조, 어조, 키워드, 요약을 병합합니다."""
     start_time = time.time()
+    logger.info(
+        f"청크 문서 분석 시작: 길이={len(text)}자, 청크={len(chunks)}개, "
+        f"동시 실행={Config.DOCUMENT_ANALYSIS_CONCURRENCY}"
+    )
 
-    for attempt in range(max_retries):
-        try:
-            logger.info(
-                f"OpenAI API 호출 시작: 모델={model}, 시도={attempt + 1}/{max_retries}"
-            )
+    chunk_results = _analyze_document_chunks(chunks)
 
-            response = openai.ChatCompletion.create(**request_args)
-            result = {
-                "content": response.choices[0].message.content.strip(),
-                "usage": response.usage,
-            }
+    token_infos = [token_info for _, token_info in chunk_results]
+    analyzed = [
+        (analysis, len(chunk))
+        for chunk, (analysis, _) in zip(chunks, chunk_results)
+        if analysis
+    ]
 
-            input_tokens = result["usage"]["prompt_tokens"]
-            output_tokens = result["usage"]["completion_tokens"]
-            token_info = calculate_token_cost(input_tokens, output_tokens, model)
+    tones = [(analysis.get("tone") or {}, w) for analysis, w in analyzed]
 
-            processing_time = time.time() - start_time
-            logger.info(
-                f"OpenAI API 응답 수신: 처리 시간={processing_time:.2f}초, "
-                f"입력 토큰={input_tokens}, 출력 토큰={output_tokens}, "
-                f"비용(KRW)={token_info['cost_krw']:.2f}원"
-            )
+    merged_tone = {
+        key: _weighted_average([(tone.get(key), w) for tone, w in tones])
+        for key in ("formality", "sentiment", "objectivity")
+    }
 
-            return result, token_info
+    summaries = [
+        analysis.get("summary")
+        for analysis, _ in analyzed
+        if isinstance(analysis.get("summary"), str) and analysis.get("summary")
+    ]
+    if len(summaries) > 1:
+        summary, summary_token_info = _summarize_chunk_summaries(summaries)
+        token_infos.append(summary_token_info)
+    else:
+        summary = summaries[0] if summaries else "분석 실패"
 
-        except openai.error.RateLimitError:
-            if attempt < max_retries - 1:
-                logger.warning(
-                    f"API 속도 제한, {retry_delay}초 후 재시도 ({attempt + 1}/{max_retries})"
-                )
-                time.sleep(retry_delay)
-                retry_delay *= 2
-            else:
-                logger.error("API 속도 제한으로 최대 재시도 횟수 초과")
-                raise
+    token_info = merge_token_infos(token_infos)
+    logger.info(
+        f"청크 문서 분석 완료: 성공 청크={len(analyzed)}/{len(chunks)}, "
+        f"처리 시간={time.time() - start_time:.2f}초"
+    )
 
-        except openai.error.APIError as e:
-            logger.error(f"OpenAI API 오류: {str(e)}")
-            if attempt < max_retries - 1:
-                logger.warning(
-                    f"API 오류, {retry_delay}초 후 재시도 ({attempt + 1}/{max_retries})"
-                )
-                time.sleep(retry_delay)
-                retry_delay *= 2
-            else:
-                raise
+    return {
+        "structure": _document_structure_stats(text),
+        "tone": merged_tone,
+        "keywords": _merge_chunk_keywords(
+            [analysis.get("keywords") for analysis, _ in analyzed]
+        ),
+        "summary": summary,
+        "chunk_count": len(chunks),
+        "failed_chunks": len(chunks) - len(analyzed),
+        "token_info": token_info,
+    }
 
-        except Exception as e:
-            logger.error(f"예상치 못한 오류: {str(e)}")
-            raise
+
+def _document_structure_stats(text: str) -> Dict[str, Any]:
+    """문서 구조 통계를 규칙 기반 파서로 계산합니다. (LLM 호출 없음)"""
+    stats = dict(get_document_structure(text or "")["stats"])
+    stats.pop("table_count", None)
+    return stats
 
 
 def analyze_document_with_ai(text: str) -> Dict[str, Any]:
     """
     OpenAI를 사용하여 문서를 분석합니다.
+    DOCUMENT_CHUNK_CHARS보다 긴 문서는 □/○ 문단과 표 단위 청크로 나누어
+    병렬로 분석한 뒤 결과를 병합합니다.
+    문서 구조 통계는 규칙 기반 파서로 계산하고, LLM에는 어조/키워드/요약만 요청합니다.
 
     Args:
         text: 분석할 문서 내용
@@ -132,23 +266,22 @@ def analyze_document_with_ai(text: str) -> Dict[str, Any]:
     Returns:
         Dict: 분석 결과 (구조, 어조, 핵심 키워드 등)
     """
-    # HTML 태그 제거 및 텍스트 정제
-    clean_text = re.sub(r"<.*?>", " ", text) if text else ""
-    clean_text = re.sub(r"\s+", " ", clean_text).strip()
+    # 청크 크기를 넘는 긴 문서는 구조 단위로 나누어 병렬 분석
+    chunks = chunk_document(text or "", Config.DOCUMENT_CHUNK_CHARS)
+    if len(chunks) > 1:
+        return _analyze_document_chunked(text, chunks)
 
-    # 토큰 한도를 고려하여 텍스트 길이 제한
-    max_text_length = 15000
-    if len(clean_text) > max_text_length:
-        clean_text = clean_text[:max_text_length] + "..."
+    # HTML 태그 제거 및 텍스트 정제
+    clean_text = _strip_tags(text)
+    structure = _document_structure_stats(text)
 
     prompt = [
         {
             "role": "system",
             "content": """문서를 분석하여 다음 카테고리에 따라 JSON 형식으로 결과를 제공하세요:
-1. 문서 구조 (paragraph_count, sentence_count, avg_sentence_length, has_table, has_list, has_image)
-2. 어조 분석 (formality, sentiment, objectivity)
-3. 핵심 키워드 (10개)
-4. 요약 (200자 이내)""",
+1. 어조 분석 (tone: formality, sentiment, objectivity)
+2. 핵심 키워드 (keywords: 10개)
+3. 요약 (summary: 200자 이내)""",
         },
         {"role": "user", "content": clean_text},
     ]
@@ -160,6 +293,7 @@ def analyze_document_with_ai(text: str) -> Dict[str, Any]:
         try:
             # JSON 직접 파싱 시도
             analysis_result = json.loads(content)
+            analysis_result["structure"] = structure
             analysis_result["token_info"] = token_info
             return analysis_result
         except json.JSONDecodeError:
@@ -169,6 +303,7 @@ def analyze_document_with_ai(text: str) -> Dict[str, Any]:
             if match and (json_str := match.group(1)):
                 try:
                     analysis_result = json.loads(json_str)
+                    analysis_result["structure"] = structure
                     analysis_result["token_info"] = token_info
                     return analysis_result
                 except json.JSONDecodeError:
@@ -176,16 +311,7 @@ def analyze_document_with_ai(text: str) -> Dict[str, Any]:
 
             # 기본 응답 생성
             return {
-                "structure": {
-                    "paragraph_count": 0,
-                    "sentence_count": 0,
-                    "avg_sentence_length": 0,
-                    "has_table": "<table>" in text.lower(),
-                    "has_list": any(
-                        tag in text.lower() for tag in ["<ul>", "<ol>", "<li>"]
-                    ),
-                    "has_image": "<img" in text.lower(),
-                },
+                "structure": structure,
                 "tone": {"formality": 0.5, "sentiment": 0, "objectivity": 0.5},
                 "keywords": [],
                 "summary": "분석 실패",
@@ -196,16 +322,7 @@ def analyze_document_with_ai(text: str) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"문서 분석 중 오류: {str(e)}")
         return {
-            "structure": {
-                "paragraph_count": 0,
-                "sentence_count": 0,
-                "avg_sentence_length": 0,
-                "has_table": "<table>" in text.lower(),
-                "has_list": any(
-                    tag in text.lower() for tag in ["<ul>", "<ol>", "<li>"]
-                ),
-                "has_image": "<img" in text.lower(),
-            },
+            "structure": structure,
             "tone": {"formality": 0.5, "sentiment": 0, "objectivity": 0.5},
             "keywords": [],
             "summary": "분석 실패",
@@ -213,24 +330,375 @@ def analyze_document_with_ai(text: str) -> Dict[str, Any]:
         }
 
 
+# 템플릿별 분석 프롬프트 버전 (프롬프트 변경 시 캐시 무효화를 위해 갱신)
+TEMPLATE_MAP_PROMPT_VERSION = "v1"
+
+
+def parse_json_response(content: str) -> Optional[Dict[str, Any]]:
+    """
+    모델 응답에서 JSON 객체를 추출합니다.
+    직접 파싱, 코드 블록, 중괄호 범위 순서로 시도합니다.
+
+    Args:
+        content: 모델 응답 내용
+
+    Returns:
+        파싱된 사전 (실패 시 None)
+    """
+    candidates = [content]
+    if match := re.search(r"```(?:json)?\n([\s\S]*?)\n```", content):
+        candidates.append(match.group(1))
+    if match := re.search(r"({.*})", content, re.DOTALL):
+        candidates.append(match.group(1))
+
+    for candidate in candidates:
+        try:
+            parsed = json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, dict):
+            return parsed
+    return None
+
+
+def _template_content_hash(template: Dict[str, Any]) -> str:
+    """템플릿 제목과 내용으로 콘텐츠 해시를 계산합니다."""
+    payload = f"{template.get('title', '')}\n{template.get('content', '')}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def template_set_hash(templates: List[Dict[str, Any]]) -> str:
+    """
+    템플릿 묶음의 메모 키를 계산합니다.
+    정렬한 템플릿 ID와 템플릿별 콘텐츠 해시로 만들므로 선택 순서와 무관하고,
+    템플릿 내용이 바뀌면 키도 바뀌어 이전 결과를 재사용하지 않습니다.
+    """
+    pairs = sorted(
+        (str(template.get("id", "")), _template_content_hash(template))
+        for template in templates
+    )
+    return hashlib.sha256(json.dumps(pairs).encode("utf-8")).hexdigest()
+
+
+def template_analysis_memo_key(set_hash: str) -> str:
+    """템플릿 묶음 해시에 분석 결과를 바꾸는 설정(모델, 분석 방식, 프롬프트)을 더한 메모 키"""
+    payload = json.dumps(
+        [
+            set_hash,
+            TEMPLATE_MAP_PROMPT_VERSION,
+            OPENAI_MODEL,
+            Config.TEMPLATE_ANALYSIS_MODE,
+            Config.TEMPLATE_PROMPT_FORMAT,
+        ]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_complete_template_analysis(analysis: Dict[str, Any]) -> bool:
+    """
+    템플릿 분석 결과가 오류 없이 모두 성공했는지 확인합니다.
+    일부 템플릿 분석 실패나 병합 실패가 있는 결과는 메모로 재사용하지 않습니다.
+    """
+    return not any(
+        key in analysis for key in ("error", "failed_templates", "merge_error")
+    )
+
+
+def _template_map_cache_key(template: Dict[str, Any]) -> Optional[str]:
+    """템플릿 분석 결과의 캐시 키를 계산합니다. 캐시가 비활성화되면 None을 반환합니다."""
+    if not response_cache:
+        return None
+    return response_cache.make_key(
+        {
+            "kind": "template_map",
+            "version": TEMPLATE_MAP_PROMPT_VERSION,
+            "format": Config.TEMPLATE_PROMPT_FORMAT,
+            "model": OPENAI_MODEL,
+            "content_hash": _template_content_hash(template),
+        }
+    )
+
+
+def _get_cached_template_analysis(
+    template: Dict[str, Any], cache_key: Optional[str]
+) -> Optional[Tuple[Dict[str, Any], Dict[str, Union[int, float, str]]]]:
+    """캐시된 템플릿 분석 결과를 반환합니다. 없으면 None을 반환합니다."""
+    if not cache_key:
+        return None
+    cached = response_cache.get(cache_key)
+    if not cached:
+        return None
+
+    template_id = template.get("id", "unknown")
+    logger.info(f"템플릿 분석 캐시 적중: ID={template_id}")
+    analysis = {**cached["analysis"], "id": template_id}
+    return analysis, build_cache_hit_token_info(cached["token_info"])
+
+
+def _template_prompt_body(template: Dict[str, Any]) -> str:
+    """
+    프롬프트에 넣을 템플릿 본문을 반환합니다.
+    TEMPLATE_PROMPT_FORMAT이 "skeleton"이면 원문 대신 구조 골격(제목/글머리표/표 요약)을 사용합니다.
+    """
+    if Config.TEMPLATE_PROMPT_FORMAT == "skeleton":
+        return template_skeleton(template)
+    return template.get("content", "")
+
+
+def _build_template_map_messages(template: Dict[str, Any]) -> List[Dict[str, str]]:
+    """템플릿 하나를 분석하기 위한 메시지를 구성합니다."""
+    template_id = template.get("id", "unknown")
+    title = template.get("title", "제목 없음")
+    content = _template_prompt_body(template)
+
+    if len(content) > Config.TEMPLATE_MAX_CHARS:
+        logger.warning(
+            f"템플릿 내용이 너무 길어 {Config.TEMPLATE_MAX_CHARS}자로 자름: "
+            f"ID={template_id}, 길이={len(content)}자"
+        )
+        content = content[: Config.TEMPLATE_MAX_CHARS] + "..."
+
+    return [
+        {
+            "role": "system",
+            "content": """당신은 문서 템플릿 분석 전문가입니다. 제공된 정부 문서 템플릿 하나를 분석하여 다음 JSON 형식으로만 응답하세요:
+{"title": "템플릿 제목",
+ "structure": [{"name": "항목명", "description": "항목 설명", "example": "작성 예시"}],
+ "tips": ["좋은 작성 방법에 대한 간략한 조언"],
+ "keywords": ["핵심 키워드"]}""",
+        },
+        {"role": "user", "content": f"제목: {title}\n내용:\n{content}"},
+    ]
+
+
+def _finalize_template_analysis(
+    template: Dict[str, Any],
+    result: Dict[str, Any],
+    token_info: Dict[str, Union[int, float, str]],
+    cache_key: Optional[str],
+) -> Dict[str, Any]:
+    """모델 응답을 템플릿 분석 결과로 변환하고 캐시에 저장합니다."""
+    analysis = parse_json_response(result["content"])
+    if analysis is None:
+        raise ValueError("템플릿 분석 결과를 파싱할 수 없음")
+
+    analysis.setdefault("title", template.get("title", "제목 없음"))
+    analysis.setdefault("structure", [])
+    analysis.setdefault("keywords", [])
+    analysis["id"] = template.get("id", "unknown")
+
+    if cache_key:
+        response_cache.set(cache_key, {"analysis": analysis, "token_info": token_info})
+
+    return analysis
+
+
+def analyze_single_template(
+    template: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Union[int, float, str]]]:
+    """
+    템플릿 하나를 분석합니다. (map 단계)
+    결과는 템플릿 콘텐츠 해시로 캐시되어 같은 템플릿을 다시 분석할 때 재사용됩니다.
+
+    Args:
+        template: 분석할 템플릿 (id, title, content)
+
+    Returns:
+        템플릿 분석 결과와 토큰 사용량 정보를 포함한 튜플
+    """
+    cache_key = _template_map_cache_key(template)
+    if cached := _get_cached_template_analysis(template, cache_key):
+        return cached
+
+    # 파싱된 결과를 직접 캐시하므로 원본 응답 캐시는 사용하지 않음
+    result, token_info = call_openai_api(
+        _build_template_map_messages(template), use_cache=False
+    )
+    analysis = _finalize_template_analysis(template, result, token_info, cache_key)
+    return analysis, token_info
+
+
+def _map_templates(
+    template_contents: List[Dict[str, Any]],
+) -> List[Tuple[Optional[Dict[str, Any]], Dict[str, Union[int, float, str]]]]:
+    """
+    캐시되지 않은 템플릿들을 한 번의 배치 호출로 동시에 분석합니다.
+    실패한 템플릿은 (None, 오류 정보)로 반환합니다.
+    """
+    results: List[Any] = [None] * len(template_contents)
+    pending = []
+    for index, template in enumerate(template_contents):
+        cache_key = _template_map_cache_key(template)
+        cached = _get_cached_template_analysis(template, cache_key)
+        if cached:
+            results[index] = cached
+        else:
+            pending.append((index, template, cache_key))
+
+    responses = call_openai_batch(
+        [
+            {
+                "messages": _build_template_map_messages(template),
+                "use_cache": False,
+            }
+            for _, template, _ in pending
+        ],
+        Config.TEMPLATE_ANALYSIS_CONCURRENCY,
+    )
+
+    for (index, template, cache_key), response in zip(pending, responses):
+        try:
+            if isinstance(response, Exception):
+                raise response
+            result, token_info = response
+            analysis = _finalize_template_analysis(
+                template, result, token_info, cache_key
+            )
+            results[index] = (analysis, token_info)
+        except (BudgetExceededError, JobCancelledError):
+            # 예산 초과와 취소는 개별 템플릿 실패가 아니라 작업 전체를 중단
+            raise
+        except Exception as e:
+            logger.error(
+                f"템플릿 개별 분석 실패: ID={template.get('id', 'unknown')}, {str(e)}"
+            )
+            results[index] = (None, {"error": str(e)})
+
+    return results
+
+
+def reduce_template_analyses(
+    analyses: List[Dict[str, Any]],
+) -> Tuple[Dict[str, Any], Dict[str, Union[int, float, str]]]:
+    """
+    템플릿별 분석 결과를 공통 구조와 키워드로 병합합니다. (reduce 단계)
+    원문 대신 구조화된 분석 결과만 전달하므로 입력이 작습니다.
+
+    Args:
+        analyses: 템플릿별 분석 결과 목록
+
+    Returns:
+        병합 결과와 토큰 사용량 정보를 포함한 튜플
+    """
+    summaries = [
+        {
+            "title": analysis.get("title", ""),
+            "structure": [
+                section.get("name", "") if isinstance(section, dict) else str(section)
+                for section in analysis.get("structure", [])
+            ],
+            "keywords": analysis.get("keywords", []),
+        }
+        for analysis in analyses
+    ]
+
+    messages = [
+        {
+            "role": "system",
+            "content": """여러 정부 문서 템플릿의 분석 결과를 병합하세요. 다음 JSON 형식으로만 응답하세요:
+{"common_structure": [{"name": "공통 항목명", "description": "항목 설명"}],
+ "common_keywords": ["공통 핵심 키워드"],
+ "writing_tips": ["템플릿 전반에 적용되는 작성 조언"]}""",
+        },
+        {
+            "role": "user",
+            "content": json.dumps(summaries, ensure_ascii=False),
+        },
+    ]
+
+    result, token_info = call_openai_api(messages)
+    merged = parse_json_response(result["content"])
+    if merged is None:
+        raise ValueError("병합 결과를 파싱할 수 없음")
+    return merged, token_info
+
+
+def _analyze_templates_map_reduce(
+    template_contents: List[Dict[str, Any]],
+) -> Tuple[Dict[str, Any], Dict[str, Union[int, float, str]]]:
+    """템플릿별 병렬 분석(map) 후 결과를 병합(reduce)합니다."""
+    start_time = time.time()
+    logger.info(
+        f"템플릿 map-reduce 분석 시작: {len(template_contents)}개 템플릿, "
+        f"동시 실행={Config.TEMPLATE_ANALYSIS_CONCURRENCY}"
+    )
+
+    map_results = _map_templates(template_contents)
+
+    analyses = []
+    failed_templates = []
+    token_infos = []
+    for template, (analysis, token_info) in zip(template_contents, map_results):
+        token_infos.append(token_info)
+        if analysis is None:
+            failed_templates.append(
+                {
+                    "id": template.get("id", "unknown"),
+                    "title": template.get("title", "제목 없음"),
+                    "error": token_info.get("error", "분석 실패"),
+                }
+            )
+        else:
+            analyses.append(analysis)
+
+    analysis_result = {"templates": analyses}
+    if failed_templates:
+        analysis_result["failed_templates"] = failed_templates
+
+    # 두 개 이상의 템플릿이 분석된 경우에만 병합 호출
+    if len(analyses) > 1:
+        try:
+            merged, reduce_token_info = reduce_template_analyses(analyses)
+            for key in ("common_structure", "common_keywords", "writing_tips"):
+                if key in merged:
+                    analysis_result[key] = merged[key]
+            token_infos.append(reduce_token_info)
+        except (BudgetExceededError, JobCancelledError):
+            raise
+        except Exception as e:
+            logger.error(f"템플릿 분석 결과 병합 실패: {str(e)}")
+            analysis_result["merge_error"] = str(e)
+    elif not analyses:
+        analysis_result["error"] = "분석 결과를 파싱할 수 없음"
+
+    token_info = merge_token_infos(token_infos)
+    logger.info(
+        f"템플릿 map-reduce 분석 완료: 성공={len(analyses)}, 실패={len(failed_templates)}, "
+        f"처리 시간={time.time() - start_time:.2f}초, 캐시 적중={token_info['cache_hits']}"
+    )
+    return analysis_result, token_info
+
+
 def analyze_templates(
     template_contents: List[Dict[str, Any]],
+    mode: Optional[str] = None,
 ) -> Tuple[Dict[str, Any], Dict[str, Union[int, float, str]]]:
     """
     여러 문서 템플릿을 분석하여 표준 항목과 내용을 추출합니다.
 
     Args:
         template_contents: 분석할 템플릿 내용 목록
+        mode: 분석 방식 ("map_reduce" 또는 "single", 기본값은 설정값)
 
     Returns:
         분석 결과와 토큰 사용량 정보를 포함한 튜플
     """
+    mode = mode or Config.TEMPLATE_ANALYSIS_MODE
+    if mode == "map_reduce":
+        try:
+            return _analyze_templates_map_reduce(template_contents)
+        except (BudgetExceededError, JobCancelledError):
+            raise
+        except Exception as e:
+            logger.error(f"템플릿 분석 중 오류 발생: {str(e)}")
+            return {"error": f"템플릿 분석 중 오류: {str(e)}"}, {"error": str(e)}
+
     try:
         logger.info(f"템플릿 분석 시작: {len(template_contents)}개 템플릿")
 
         # 템플릿 내용을 문자열로 변환
         templates_text = "\n\n===== 템플릿 구분선 =====\n\n".join(
-            f"템플릿 ID: {item.get('id', 'unknown')}\n제목: {item.get('title', '제목 없음')}\n내용:\n{item.get('content', '')}"
+            f"템플릿 ID: {item.get('id', 'unknown')}\n제목: {item.get('title', '제목 없음')}\n내용:\n{_template_prompt_body(item)}"
             for item in template_contents
         )
 
@@ -276,31 +744,54 @@ def analyze_templates(
         logger.info(f"템플릿 분석 완료: {len(template_contents)}개 템플릿")
         return analysis_result, token_info
 
+    except (BudgetExceededError, JobCancelledError):
+        raise
+
     except Exception as e:
         logger.error(f"템플릿 분석 중 오류 발생: {str(e)}")
         return {"error": f"템플릿 분석 중 오류: {str(e)}"}, {"error": str(e)}
 
 
-def analyze_templates_from_json(json_file_path: str, output_file_path: str) -> bool:
+def estimate_template_analysis_cost(templates: List[Dict[str, Any]]) -> float:
     """
-    JSON 파일에서 템플릿 데이터를 읽고 분석 결과를 저장합니다.
+    템플릿 분석(템플릿별 map 호출)의 예상 비용(KRW)을 계산합니다.
+    응답 캐시 적중과 병합 호출은 고려하지 않은 대략적인 값입니다.
+    """
+    completion_tokens = Config.OPENAI_DEFAULT_COMPLETION_TOKENS
+    prompt_tokens = sum(
+        estimate_request_tokens(
+            _build_template_map_messages(template), OPENAI_MODEL, completion_tokens
+        )
+        - completion_tokens
+        for template in templates
+    )
+    return calculate_token_cost(
+        prompt_tokens, completion_tokens * len(templates), OPENAI_MODEL
+    )["cost_krw"]
+
+
+def analyze_template_records(
+    templates: List[Dict[str, Any]],
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    token_info_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    템플릿 데이터 목록을 분석합니다.
 
     Args:
-        json_file_path: 템플릿 데이터가 저장된 JSON 파일 경로
-        output_file_path: 분석 결과를 저장할 JSON 파일 경로
+        templates: 템플릿 데이터 목록 (제목/내용 또는 title/content 필드)
+        progress_callback: 진행률(0~100)과 단계 설명을 받는 콜백 (선택)
+        token_info_callback: 분석에 사용한 토큰 정보를 받는 콜백 (선택)
 
     Returns:
-        bool: 성공 여부
+        분석 결과, 실패 시 None
     """
-    try:
-        with open(json_file_path, "r", encoding="utf-8") as f:
-            templates = json.load(f)
+    report_progress = progress_callback or (lambda progress, message: None)
 
+    try:
         if not isinstance(templates, list) or not templates:
-            logger.error(
-                f"템플릿 데이터가 없거나 유효하지 않은 형식입니다: {json_file_path}"
-            )
-            return False
+            logger.error("템플릿 데이터가 없거나 유효하지 않은 형식입니다.")
+            return None
 
         # 템플릿 기본 필드 정규화
         for i, template in enumerate(templates):
@@ -308,23 +799,116 @@ def analyze_templates_from_json(json_file_path: str, output_file_path: str) -> b
             template.setdefault("title", template.get("제목", "제목 없음"))
             template.setdefault("content", template.get("내용", ""))
 
-        # 템플릿 분석 및 결과 저장
-        analysis_results, _ = analyze_templates(templates)
-        with open(output_file_path, "w", encoding="utf-8") as f:
-            json.dump(analysis_results, f, ensure_ascii=False, indent=2)
+        report_progress(20, f"템플릿 {len(templates)}개 분석 중")
+        analysis_results, token_info = analyze_templates(templates)
+        if token_info_callback:
+            token_info_callback(token_info)
 
-        logger.info(
-            f"템플릿 분석 완료: {len(templates)}개 분석됨, 결과 저장: {output_file_path}"
-        )
-        return True
+        logger.info(f"템플릿 분석 완료: {len(templates)}개 분석됨")
+        return analysis_results
+
+    except JobCancelledError:
+        logger.info("템플릿 분석 작업 취소")
+        raise
+
+    except BudgetExceededError:
+        raise
 
     except Exception as e:
         logger.error(f"템플릿 분석 중 오류: {str(e)}")
+        return None
+
+
+def analyze_templates_from_json(
+    json_file_path: str,
+    output_file_path: str,
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+) -> bool:
+    """
+    JSON 파일에서 템플릿 데이터를 읽고 분석 결과를 저장합니다.
+
+    Args:
+        json_file_path: 템플릿 데이터가 저장된 JSON 파일 경로
+        output_file_path: 분석 결과를 저장할 JSON 파일 경로
+        progress_callback: 진행률(0~100)과 단계 설명을 받는 콜백 (선택)
+
+    Returns:
+        bool: 성공 여부
+    """
+    try:
+        with open(json_file_path, "r", encoding="utf-8") as f:
+            templates = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"템플릿 데이터 로드 실패: {json_file_path} ({str(e)})")
         return False
 
+    analysis_results = analyze_template_records(templates, progress_callback)
+    if analysis_results is None:
+        return False
+
+    with open(output_file_path, "w", encoding="utf-8") as f:
+        json.dump(analysis_results, f, ensure_ascii=False, indent=2)
+
+    logger.info(f"템플릿 분석 결과 저장: {output_file_path}")
+    return True
+
+
+DRAFT_SYSTEM_PROMPT = """당신은 한국의 정부 문서 작성을 돕는 전문가입니다. 
+사용자가 제공한 템플릿과 요구사항을 기반으로 고품질의 보고서를 작성해주세요.
+주어진 템플릿의 구조와 형식을 참고하되, 요구사항에 맞게 내용을 조정하세요."""
+
+
+def build_template_context(selected_templates: List[Dict[str, Any]]) -> str:
+    """초안 생성 프롬프트에 넣을 참고 템플릿 본문을 구성합니다."""
+    return "\n".join(
+        f"### {template.get('title', '제목 없음')}\n{_template_prompt_body(template)}"
+        for template in selected_templates
+    )
+
+
+def format_user_requirements(user_input: Dict[str, str]) -> str:
+    """사용자 입력을 "항목: 값" 줄 목록으로 변환합니다. (빈 값 제외)"""
+    return "\n".join(f"{key}: {value}" for key, value in user_input.items() if value)
+
+
+def build_draft_messages(
+    user_input: Dict[str, str],
+    selected_templates: List[Dict[str, Any]],
+    template_context: Optional[str] = None,
+) -> List[Dict[str, str]]:
+    """
+    초안 생성용 프롬프트 메시지를 구성합니다.
+
+    Args:
+        user_input: 사용자가 입력한 보고서 정보
+        selected_templates: 선택된 템플릿 목록
+        template_context: 미리 구성한 참고 템플릿 본문 (None이면 selected_templates로 구성)
+
+    Returns:
+        OpenAI 메시지 리스트
+    """
+    if template_context is None:
+        template_context = build_template_context(selected_templates)
+
+    return [
+        {"role": "system", "content": DRAFT_SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": f"""## 사용자 요구사항
+{format_user_requirements(user_input)}
+
+## 참고 템플릿
+{template_context}
+
+위 요구사항과 참고 템플릿을 기반으로 보고서를 작성해주세요.""",
+        },
+    ]
+
 
 def generate_draft(
-    user_input: Dict[str, str], selected_templates: List[Dict[str, Any]]
+    user_input: Dict[str, str],
+    selected_templates: List[Dict[str, Any]],
+    use_cache: bool = False,
 ) -> Tuple[Dict[str, Any], Dict[str, Union[int, float, str]]]:
     """
     사용자 입력과 선택된 템플릿을 기반으로 문서 초안을 생성합니다.
@@ -332,6 +916,7 @@ def generate_draft(
     Args:
         user_input: 사용자가 입력한 보고서 정보
         selected_templates: 선택된 템플릿 목록
+        use_cache: 동일 요청에 대한 응답 캐시 사용 여부 (기본값: 사용 안 함)
 
     Returns:
         생성된 초안 결과와 토큰 사용량 정보를 포함한 튜플
@@ -340,36 +925,11 @@ def generate_draft(
     start_time = time.time()
 
     try:
-        # 템플릿 내용 추출 및 요구사항 구성
-        template_contents = [
-            f"### {template.get('title', '제목 없음')}\n{template.get('content', '')}"
-            for template in selected_templates
-        ]
+        messages = build_draft_messages(user_input, selected_templates)
 
-        user_requirements = [
-            f"{key}: {value}" for key, value in user_input.items() if value
-        ]
-
-        messages = [
-            {
-                "role": "system",
-                "content": """당신은 한국의 정부 문서 작성을 돕는 전문가입니다. 
-사용자가 제공한 템플릿과 요구사항을 기반으로 고품질의 보고서를 작성해주세요.
-주어진 템플릿의 구조와 형식을 참고하되, 요구사항에 맞게 내용을 조정하세요.""",
-            },
-            {
-                "role": "user",
-                "content": f"""## 사용자 요구사항
-{chr(10).join(user_requirements)}
-
-## 참고 템플릿
-{chr(10).join(template_contents)}
-
-위 요구사항과 참고 템플릿을 기반으로 보고서를 작성해주세요.""",
-            },
-        ]
-
-        result, token_info = call_openai_api(messages, temperature=0.7, max_tokens=2000)
+        result, token_info = call_openai_api(
+            messages, temperature=0.7, max_tokens=2000, use_cache=use_cache
+        )
 
         response = {
             "title": user_input.get("title", "제목 없음"),
@@ -385,6 +945,9 @@ def generate_draft(
 
         return response, token_info
 
+    except (BudgetExceededError, RateLimitWaitTimeout):
+        raise
+
     except Exception as e:
         logger.error(f"초안 생성 중 오류 발생: {str(e)}")
         return {
@@ -393,3 +956,178 @@ def generate_draft(
             "content": "",
             "timestamp": datetime.now().isoformat(),
         }, {"error": str(e)}
+
+
+def stream_openai_api(
+    messages: List[Dict[str, str]],
+    model: str = OPENAI_MODEL,
+    temperature: float = 0.7,
+    max_tokens: int = None,
+    max_retries: int = 3,
+    initial_retry_delay: float = 1.0,
+) -> Iterator[Dict[str, Any]]:
+    """
+    OpenAI API를 스트리밍 모드로 호출하여 생성되는 토큰을 순차적으로 반환합니다.
+    재시도는 첫 토큰을 받기 전(요청 생성 단계)에만 수행합니다.
+
+    Args:
+        messages: 메시지 리스트
+        model: 사용할 모델
+        temperature: 생성 다양성 조절
+        max_tokens: 최대 생성 토큰 수
+        max_retries: 최대 재시도 횟수
+        initial_retry_delay: 초기 재시도 지연 시간(초)
+
+    Yields:
+        {"type": "delta", "content": 조각} 이벤트들과
+        마지막 {"type": "done", "content": 전체 내용, "token_info": 토큰 정보} 이벤트
+    """
+    retry_delay = initial_retry_delay
+    request_args = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "stream": True,
+        "stream_options": {"include_usage": True},
+    }
+
+    if max_tokens:
+        request_args["max_tokens"] = max_tokens
+
+    if usage_ledger:
+        usage_ledger.check_budget()
+
+    start_time = time.time()
+    estimated_tokens = estimate_request_tokens(messages, model, max_tokens)
+
+    # 스트림을 모두 받을 때까지 호출 슬롯을 점유 (사용자/우선순위별 공정 순서)
+    with (
+        llm_scheduler.slot(estimated_tokens / 1000)
+        if llm_scheduler
+        else contextlib.nullcontext()
+    ):
+        for attempt in range(max_retries):
+            acquired = False
+            try:
+                logger.info(
+                    f"OpenAI 스트리밍 호출 시작: 모델={model}, 시도={attempt + 1}/{max_retries}"
+                )
+                if rate_limiter:
+                    rate_limiter.acquire(estimated_tokens)
+                    acquired = True
+                response_stream = openai.ChatCompletion.create(**request_args)
+                break
+            except (openai.error.RateLimitError, *RETRYABLE_ERRORS) as e:
+                # 스트림을 열지 못한 시도에 차감한 토큰은 돌려줌 (재시도에서 다시 확보)
+                if acquired:
+                    rate_limiter.reconcile(estimated_tokens, 0)
+                if attempt < max_retries - 1:
+                    logger.warning(
+                        f"API 오류({type(e).__name__}), {retry_delay}초 후 재시도 "
+                        f"({attempt + 1}/{max_retries})"
+                    )
+                    time.sleep(retry_delay)
+                    retry_delay *= 2
+                else:
+                    logger.error(f"스트리밍 호출 최대 재시도 횟수 초과: {str(e)}")
+                    raise
+
+        content_parts = []
+        usage = None
+        first_token_time = None
+        completed = False
+
+        try:
+            for chunk in response_stream:
+                if chunk.get("usage"):
+                    usage = chunk["usage"]
+                if not chunk.get("choices"):
+                    continue
+
+                delta = chunk["choices"][0].get("delta", {}).get("content")
+                if delta:
+                    if first_token_time is None:
+                        first_token_time = time.time() - start_time
+                        logger.info(f"OpenAI 첫 토큰 수신: {first_token_time:.2f}초")
+                    content_parts.append(delta)
+                    yield {"type": "delta", "content": delta}
+            completed = True
+        finally:
+            # 클라이언트 연결이 끊겨 중단되어도 이미 생성된 토큰은 과금되므로 사용량을 기록
+            content = "".join(content_parts).strip()
+            if usage:
+                token_info = calculate_token_cost(
+                    usage["prompt_tokens"], usage["completion_tokens"], model
+                )
+            else:
+                # 사용량 정보가 없는 경우(중단 포함) 받은 내용까지 tiktoken으로 추정
+                prompt_text = "\n".join(message["content"] for message in messages)
+                token_info = calculate_token_cost(prompt_text, content, model)
+
+            if rate_limiter:
+                rate_limiter.reconcile(
+                    estimated_tokens,
+                    token_info["input_tokens"] + token_info["output_tokens"],
+                )
+            if usage_ledger:
+                usage_ledger.record(token_info)
+
+            if not completed:
+                # 응답 스트림을 닫아 서버의 생성도 중단
+                if hasattr(response_stream, "close"):
+                    response_stream.close()
+                logger.warning(
+                    f"OpenAI 스트리밍 중단: 받은 출력까지 추정 사용량 기록, "
+                    f"출력 토큰={token_info['output_tokens']}"
+                )
+
+    logger.info(
+        f"OpenAI 스트리밍 완료: 처리 시간={time.time() - start_time:.2f}초, "
+        f"입력 토큰={token_info['input_tokens']}, 출력 토큰={token_info['output_tokens']}, "
+        f"비용(KRW)={token_info['cost_krw']:.2f}원"
+    )
+
+    yield {"type": "done", "content": content, "token_info": token_info}
+
+
+def generate_draft_stream(
+    user_input: Dict[str, str], selected_templates: List[Dict[str, Any]]
+) -> Iterator[Dict[str, Any]]:
+    """
+    초안을 스트리밍 방식으로 생성합니다.
+
+    Args:
+        user_input: 사용자가 입력한 보고서 정보
+        selected_templates: 선택된 템플릿 목록
+
+    Yields:
+        {"type": "delta", "content": 조각} 이벤트들과
+        마지막 {"type": "done", "report": 초안 결과, "token_info": 토큰 정보} 이벤트
+        (오류 시 {"type": "error", "error": 메시지})
+    """
+    logger.info(f"스트리밍 초안 생성 시작: {len(selected_templates)}개 템플릿 사용")
+
+    try:
+        messages = build_draft_messages(user_input, selected_templates)
+
+        # 클라이언트 연결이 끊기면 내부 스트림도 바로 닫아 사용량을 기록
+        with contextlib.closing(
+            stream_openai_api(messages, temperature=0.7, max_tokens=2000)
+        ) as events:
+            for event in events:
+                if event["type"] == "delta":
+                    yield event
+                else:
+                    yield {
+                        "type": "done",
+                        "report": {
+                            "title": user_input.get("title", "제목 없음"),
+                            "content": event["content"],
+                            "timestamp": datetime.now().isoformat(),
+                        },
+                        "token_info": event["token_info"],
+                    }
+
+    except Exception as e:
+        logger.error(f"스트리밍 초안 생성 중 오류 발생: {str(e)}")
+        yield {"type": "error", "error": f"초안 생성 중 오류: {str(e)}"}
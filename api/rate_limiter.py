@@ -0,0 +1,255 @@
+"""
+OpenAI 호출 속도 제한 모듈
+SQLite 파일을 공유 상태로 사용하여 여러 워커 프로세스가 함께 지키는
+분당 요청 수(RPM) / 분당 토큰 수(TPM) 토큰 버킷을 제공합니다.
+"""
+
+import os
+import time
+import random
+import sqlite3
+from typing import Optional
+from config import Config
+from utils.logging import logger
+
+
+class RateLimitWaitTimeout(Exception):
+    """최대 대기 시간 안에 호출 용량을 확보하지 못했을 때 발생하는 예외"""
+
+
+class TokenBucketRateLimiter:
+    """프로세스 간 공유되는 RPM/TPM 토큰 버킷
+
+    대기 중인 호출은 티켓 순서(FIFO)대로 용량을 할당받습니다.
+    버킷 상태와 대기열은 모두 SQLite 트랜잭션(BEGIN IMMEDIATE)으로 갱신되므로
+    같은 파일을 사용하는 모든 프로세스가 하나의 한도를 공유합니다.
+    """
+
+    # 용량이 부족할 때 최소/최대 재확인 간격(초)
+    MIN_POLL_INTERVAL = 0.05
+    MAX_POLL_INTERVAL = 1.0
+    # 이 시간(초) 동안 재확인하지 않은 티켓은 비정상 종료된 프로세스가 남긴 것으로 보고 정리
+    STALE_TICKET_SECONDS = MAX_POLL_INTERVAL * 5
+
+    def __init__(
+        self,
+        db_path: str,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        max_wait_seconds: float = 60.0,
+        name: str = "openai",
+    ):
+        self.db_path = db_path
+        self.name = name
+        self.request_capacity = float(requests_per_minute)
+        self.token_capacity = float(tokens_per_minute)
+        self.request_rate = self.request_capacity / 60.0
+        self.token_rate = self.token_capacity / 60.0
+        self.max_wait_seconds = max_wait_seconds
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS buckets (
+                    name TEXT PRIMARY KEY,
+                    requests REAL NOT NULL,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )"""
+            )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS waiters (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_seen REAL NOT NULL DEFAULT 0
+                )"""
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(waiters)")}
+            if "last_seen" not in columns:
+                conn.execute(
+                    "ALTER TABLE waiters ADD COLUMN last_seen REAL NOT NULL DEFAULT 0"
+                )
+            conn.execute(
+                "INSERT OR IGNORE INTO buckets (name, requests, tokens, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (self.name, self.request_capacity, self.token_capacity, time.time()),
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """트랜잭션을 직접 제어하는 새 연결을 생성합니다."""
+        return sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+
+    def _refill(self, conn: sqlite3.Connection, now: float):
+        """경과 시간만큼 버킷을 채운 뒤 (요청 잔량, 토큰 잔량)을 반환합니다."""
+        requests, tokens, updated_at = conn.execute(
+            "SELECT requests, tokens, updated_at FROM buckets WHERE name = ?",
+            (self.name,),
+        ).fetchone()
+        elapsed = max(0.0, now - updated_at)
+        requests = min(self.request_capacity, requests + elapsed * self.request_rate)
+        tokens = min(self.token_capacity, tokens + elapsed * self.token_rate)
+        return requests, tokens
+
+    def _enqueue(self) -> int:
+        """대기열에 티켓을 등록하고 티켓 ID를 반환합니다."""
+        conn = self._connect()
+        try:
+            now = time.time()
+            cursor = conn.execute(
+                "INSERT INTO waiters (name, created_at, last_seen) VALUES (?, ?, ?)",
+                (self.name, now, now),
+            )
+            return cursor.lastrowid
+        finally:
+            conn.close()
+
+    def _dequeue(self, ticket: int) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM waiters WHERE id = ?", (ticket,))
+        finally:
+            conn.close()
+
+    def _try_acquire(self, ticket: int, tokens: float) -> float:
+        """
+        대기열 맨 앞 티켓이고 용량이 충분하면 용량을 차감합니다.
+
+        Returns:
+            0이면 획득 성공, 양수이면 다시 시도하기까지 기다릴 시간(초)
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+
+            # 재확인할 때마다 티켓의 마지막 확인 시각을 갱신하고,
+            # 확인이 끊긴 티켓(비정상 종료된 프로세스)은 정리
+            updated = conn.execute(
+                "UPDATE waiters SET last_seen = ? WHERE id = ?", (now, ticket)
+            ).rowcount
+            if not updated:
+                # DB 잠금 대기 등으로 확인이 늦어 정리된 경우 같은 순번으로 다시 등록
+                conn.execute(
+                    "INSERT INTO waiters (id, name, created_at, last_seen) "
+                    "VALUES (?, ?, ?, ?)",
+                    (ticket, self.name, now, now),
+                )
+            conn.execute(
+                "DELETE FROM waiters WHERE name = ? AND last_seen < ?",
+                (self.name, now - self.STALE_TICKET_SECONDS),
+            )
+            head = conn.execute(
+                "SELECT MIN(id) FROM waiters WHERE name = ?", (self.name,)
+            ).fetchone()[0]
+            if head is not None and head != ticket:
+                conn.execute("COMMIT")
+                return self.MIN_POLL_INTERVAL
+
+            requests, available_tokens = self._refill(conn, now)
+            if requests >= 1 and available_tokens >= tokens:
+                conn.execute(
+                    "UPDATE buckets SET requests = ?, tokens = ?, updated_at = ? "
+                    "WHERE name = ?",
+                    (requests - 1, available_tokens - tokens, now, self.name),
+                )
+                conn.execute("DELETE FROM waiters WHERE id = ?", (ticket,))
+                conn.execute("COMMIT")
+                return 0.0
+
+            conn.execute("COMMIT")
+            wait_requests = (1 - requests) / self.request_rate if requests < 1 else 0
+            wait_tokens = (
+                (tokens - available_tokens) / self.token_rate
+                if available_tokens < tokens
+                else 0
+            )
+            return max(wait_requests, wait_tokens, self.MIN_POLL_INTERVAL)
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def acquire(self, tokens: int, timeout: Optional[float] = None) -> float:
+        """
+        예상 토큰 수만큼의 용량을 확보할 때까지 대기합니다.
+
+        Args:
+            tokens: 호출에 필요한 예상 토큰 수 (입력 + 최대 출력)
+            timeout: 최대 대기 시간(초), None이면 기본값 사용
+
+        Returns:
+            대기한 시간(초)
+
+        Raises:
+            RateLimitWaitTimeout: 최대 대기 시간 안에 용량을 확보하지 못한 경우
+        """
+        tokens = min(float(tokens), self.token_capacity)
+        timeout = self.max_wait_seconds if timeout is None else timeout
+        start = time.time()
+        ticket = self._enqueue()
+
+        try:
+            while True:
+                wait = self._try_acquire(ticket, tokens)
+                waited = time.time() - start
+                if wait == 0:
+                    if waited > 1:
+                        logger.info(
+                            f"속도 제한 대기 후 호출 용량 확보: 대기={waited:.2f}초, "
+                            f"예상 토큰={int(tokens)}"
+                        )
+                    return waited
+                if waited + wait > timeout:
+                    raise RateLimitWaitTimeout(
+                        f"{timeout}초 안에 OpenAI 호출 용량을 확보하지 못했습니다."
+                    )
+                # 여러 프로세스가 동시에 깨어나지 않도록 약간의 지터 추가
+                time.sleep(min(wait, self.MAX_POLL_INTERVAL) * random.uniform(0.9, 1.1))
+        finally:
+            self._dequeue(ticket)
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """
+        호출 후 실제 사용 토큰 수로 버킷을 보정합니다.
+        예상보다 적게 사용했으면 돌려주고, 많이 사용했으면 추가로 차감합니다.
+        """
+        difference = float(estimated_tokens) - float(actual_tokens)
+        if not difference:
+            return
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            requests, tokens = self._refill(conn, time.time())
+            tokens = min(self.token_capacity, tokens + difference)
+            conn.execute(
+                "UPDATE buckets SET requests = ?, tokens = ?, updated_at = ? "
+                "WHERE name = ?",
+                (requests, tokens, time.time(), self.name),
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.warning(f"속도 제한 버킷 보정 실패: {str(e)}")
+        finally:
+            conn.close()
+
+
+# 싱글톤 속도 제한기 (RPM 또는 TPM이 0이면 비활성화)
+rate_limiter = (
+    TokenBucketRateLimiter(
+        Config.RATE_LIMIT_DB_PATH,
+        requests_per_minute=Config.OPENAI_RPM_LIMIT * Config.RATE_LIMIT_HEADROOM,
+        tokens_per_minute=Config.OPENAI_TPM_LIMIT * Config.RATE_LIMIT_HEADROOM,
+        max_wait_seconds=Config.RATE_LIMIT_MAX_WAIT,
+    )
+    if Config.OPENAI_RPM_LIMIT > 0 and Config.OPENAI_TPM_LIMIT > 0
+    else None
+)
@@ -0,0 +1,186 @@
+"""
+OpenAI 응답 캐시 모듈
+모델, 메시지, 샘플링 파라미터의 해시를 키로 하는 영구 응답 캐시를 제공합니다.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import contextlib
+from typing import Any, Dict, Iterator, Optional
+from config import Config
+from utils.logging import logger
+
+
+class ResponseCache:
+    """SQLite 기반 콘텐츠 주소 응답 캐시 (크기/기간 기반 제거 지원)"""
+
+    # 제거 작업을 수행할 쓰기 횟수 간격
+    EVICT_EVERY = 50
+
+    def __init__(
+        self,
+        db_path: str,
+        max_entries: int = 5000,
+        max_bytes: int = 200 * 1024 * 1024,
+        ttl_seconds: int = 7 * 24 * 3600,
+    ):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )"""
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_last_access "
+                "ON responses (last_access)"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        스레드/프로세스 간 공유를 위해 호출마다 새 연결을 생성합니다.
+        블록이 끝나면 커밋(예외 시 롤백)하고 연결을 닫습니다.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """
+        요청 페이로드를 정규화하여 SHA-256 캐시 키를 생성합니다.
+
+        Args:
+            payload: 모델, 메시지, 샘플링 파라미터 등 응답을 결정하는 값
+
+        Returns:
+            16진수 해시 문자열
+        """
+        canonical = json.dumps(
+            payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 값을 조회합니다. 만료되었거나 없으면 None을 반환합니다."""
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if not row:
+                    return None
+
+                value, created_at = row
+                if now - created_at > self.ttl_seconds:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+
+                conn.execute(
+                    "UPDATE responses SET last_access = ?, hits = hits + 1 "
+                    "WHERE key = ?",
+                    (now, key),
+                )
+            return json.loads(value)
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            logger.warning(f"응답 캐시 조회 실패: {str(e)}")
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """값을 캐시에 저장하고 주기적으로 제거 작업을 수행합니다."""
+        now = time.time()
+        serialized = json.dumps(value, ensure_ascii=False)
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, value, size, created_at, last_access, hits) "
+                    "VALUES (?, ?, ?, ?, ?, 0)",
+                    (key, serialized, len(serialized.encode("utf-8")), now, now),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"응답 캐시 저장 실패: {str(e)}")
+            return
+
+        with self._lock:
+            self._writes += 1
+            should_evict = self._writes % self.EVICT_EVERY == 0
+        if should_evict:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        만료된 항목과 용량 초과 항목(가장 오래 사용되지 않은 순)을 제거합니다.
+
+        Returns:
+            제거된 항목 수
+        """
+        removed = 0
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?",
+                    (time.time() - self.ttl_seconds,),
+                )
+                removed += cursor.rowcount
+
+                count, total_size = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                ).fetchone()
+
+                if count > self.max_entries or total_size > self.max_bytes:
+                    rows = conn.execute(
+                        "SELECT key, size FROM responses ORDER BY last_access ASC"
+                    ).fetchall()
+                    stale_keys = []
+                    for key, size in rows:
+                        if count <= self.max_entries and total_size <= self.max_bytes:
+                            break
+                        stale_keys.append((key,))
+                        count -= 1
+                        total_size -= size
+                    conn.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+                    removed += len(stale_keys)
+        except sqlite3.Error as e:
+            logger.warning(f"응답 캐시 정리 실패: {str(e)}")
+
+        if removed:
+            logger.info(f"응답 캐시 정리 완료: {removed}개 항목 제거")
+        return removed
+
+
+# 싱글톤 캐시 인스턴스
+response_cache = (
+    ResponseCache(
+        Config.LLM_CACHE_PATH,
+        max_entries=Config.LLM_CACHE_MAX_ENTRIES,
+        max_bytes=Config.LLM_CACHE_MAX_BYTES,
+        ttl_seconds=Config.LLM_CACHE_TTL,
+    )
+    if Config.LLM_CACHE_ENABLED
+    else None
+)
@@ -9,12 +9,16 @@ from flask_cors import CORS
 from config import Config, db
 from routes import register_routes
 from utils.logging import logger
+from utils.db_engine import init_db_engine
 from routes.main import (
     format_date_filter,
     format_content_filter,
     get_meta_fields,
 )  # 필터 및 헬퍼 함수 임포트
 from routes.member import User
+from utils.usage_ledger import usage_ledger
+from utils.user_cache import user_cache
+from utils.write_behind import last_login_writer
 import os
 
 
@@ -32,6 +36,7 @@ def create_app(config_class=Config):
     CORS(app, resources={r"/api/*": {"origins": "*"}})
 
     db.init_app(app)
+    init_db_engine(app, db)
 
     login_manager = LoginManager()
     login_manager.init_app(app)
@@ -40,10 +45,20 @@ def create_app(config_class=Config):
 
     @login_manager.user_loader
     def load_user(user_id):
-        return User.query.get(int(user_id))
+        return User.get_cached(int(user_id))
 
     register_routes(app)
 
+    # 마지막 로그인 시각은 일괄 저장 후 사용자 캐시 무효화
+    if last_login_writer:
+        last_login_writer.init_app(
+            app, User, on_flush=user_cache.invalidate_many if user_cache else None
+        )
+
+    # 사용량 장부는 이 앱의 데이터베이스에 일괄 저장
+    if usage_ledger:
+        usage_ledger.init_app(app)
+
     # Jinja 환경에 필터 및 헬퍼 함수 등록
     app.jinja_env.filters["format_date"] = format_date_filter
     app.jinja_env.filters["format_content"] = format_content_filter
@@ -0,0 +1,4 @@
+"""
+부하 테스트 및 성능 측정 도구
+실제 외부 API 대신 로컬 가짜 서버를 사용하여 애플리케이션 흐름을 측정합니다.
+"""
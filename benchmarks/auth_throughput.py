@@ -0,0 +1,228 @@
+"""
+로그인 사용자 요청 처리량 벤치마크
+애플리케이션을 같은 프로세스에서 실행하고 로그인한 사용자들이 인증이 필요한 페이지를
+동시에 호출하도록 합니다. 사용자 캐시를 끈 경우와 켠 경우를 차례로 측정하여
+처리량, p50/p95/p99 지연 시간, 요청당 users 테이블 조회 수를 비교합니다.
+
+사용 예:
+    python -m benchmarks.auth_throughput --users 20 --requests 2000 --concurrency 10
+    python -m benchmarks.auth_throughput --path /api/usage/summary --db-latency-ms 2
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import threading
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import print_table, run_load, summarize_latencies
+
+PASSWORD = "benchmark-password"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="로그인 사용자 요청 처리량 벤치마크")
+    parser.add_argument("--users", type=int, default=10, help="로그인 사용자 수")
+    parser.add_argument("--requests", type=int, default=1000, help="모드별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument(
+        "--path", default="/member/profile", help="호출할 인증 필요 경로"
+    )
+    parser.add_argument(
+        "--db-latency-ms",
+        type=float,
+        default=0.0,
+        help="users 테이블 조회마다 추가할 지연 시간(ms), 원격 DB 왕복 모사용",
+    )
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument(
+        "--verbose", action="store_true", help="애플리케이션 INFO 로그 출력"
+    )
+    return parser.parse_args()
+
+
+def configure_environment(workdir: str) -> None:
+    """애플리케이션을 불러오기 전에 벤치마크용 환경 변수를 설정합니다."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["LLM_CACHE_PATH"] = os.path.join(workdir, "llm_cache.db")
+    os.environ["RATE_LIMIT_DB_PATH"] = os.path.join(workdir, "rate_limit.db")
+    os.environ["ARTIFACT_DIR"] = os.path.join(workdir, "artifacts")
+    os.environ.setdefault("USER_CACHE_TTL", "60")
+
+
+def create_users(app, count: int) -> List[str]:
+    """벤치마크용 사용자를 만들고 아이디 목록을 반환합니다."""
+    from config import db
+    from routes.member import User
+
+    usernames = [f"bench_user_{i}" for i in range(count)]
+    with app.app_context():
+        for username in usernames:
+            user = User(
+                username=username,
+                email=f"{username}@example.com",
+                full_name=username,
+            )
+            user.set_password(PASSWORD)
+            db.session.add(user)
+        db.session.commit()
+    return usernames
+
+
+def login_all(base_url: str, usernames: List[str]) -> List[Any]:
+    """사용자별로 로그인한 requests 세션 목록을 반환합니다."""
+    import requests
+
+    sessions = []
+    for username in usernames:
+        session = requests.Session()
+        response = session.post(
+            f"{base_url}/member/login",
+            data={"username": username, "password": PASSWORD},
+            allow_redirects=False,
+        )
+        if response.status_code != 302 or "session" not in session.cookies:
+            raise RuntimeError(f"로그인 실패: {username} ({response.status_code})")
+        sessions.append(session)
+    return sessions
+
+
+class UserQueryCounter:
+    """users 테이블 조회 수를 세고, 선택적으로 조회마다 지연을 추가합니다."""
+
+    def __init__(self, engine, latency_seconds: float = 0.0):
+        from sqlalchemy import event
+
+        self.count = 0
+        self.latency_seconds = latency_seconds
+        self._lock = threading.Lock()
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" not in statement:
+            return
+        with self._lock:
+            self.count += 1
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.count = 0
+
+
+def run_mode(base_url, path, sessions, args, counter) -> Dict[str, Any]:
+    """현재 설정으로 요청을 보내고 결과를 요약합니다."""
+
+    def task(index: int) -> None:
+        session = sessions[index % len(sessions)]
+        response = session.get(f"{base_url}{path}", allow_redirects=False)
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}")
+
+    counter.reset()
+    load = run_load(task, args.requests, args.concurrency)
+    return {
+        "succeeded": len(load["latencies"]),
+        "failed": len(load["errors"]),
+        "throughput_rps": round(load["throughput"], 1),
+        "user_queries_per_request": round(counter.count / max(args.requests, 1), 3),
+        "latency_ms": summarize_latencies(load["latencies"]),
+        "errors": load["errors"][:5],
+    }
+
+
+def main():
+    args = parse_args()
+    workdir = tempfile.mkdtemp(prefix="govdraft-bench-")
+    configure_environment(workdir)
+
+    # 환경 변수 설정 후에 애플리케이션을 불러옴
+    from werkzeug.serving import make_server
+    from app import app
+    from config import db
+    from utils.logging import logger
+    import routes.member.models as member_models
+
+    if not args.verbose:
+        logger.setLevel(logging.WARNING)
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+    # 폼 로그인을 직접 호출하므로 CSRF 검사는 끔
+    app.config["WTF_CSRF_ENABLED"] = False
+    usernames = create_users(app, args.users)
+
+    http_server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=http_server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{http_server.server_port}"
+    sessions = login_all(base_url, usernames)
+
+    with app.app_context():
+        counter = UserQueryCounter(db.engine, args.db_latency_ms / 1000)
+
+    print(
+        f"벤치마크 시작: 사용자={args.users}, 요청={args.requests}, "
+        f"동시성={args.concurrency}, 경로={args.path}"
+    )
+
+    # 사용자 캐시를 끈 상태(기존 방식)와 켠 상태를 같은 조건에서 측정
+    cache = member_models.user_cache
+    results = {}
+    try:
+        member_models.user_cache = None
+        # 템플릿 컴파일, 연결 생성 등 첫 요청 비용이 한쪽 모드에 몰리지 않도록 예열
+        warmup = argparse.Namespace(
+            **{**vars(args), "requests": min(args.requests, 200)}
+        )
+        run_mode(base_url, args.path, sessions, warmup, counter)
+        results["user_cache_off"] = run_mode(
+            base_url, args.path, sessions, args, counter
+        )
+        member_models.user_cache = cache
+        if cache is not None:
+            cache.clear()
+            results["user_cache_on"] = run_mode(
+                base_url, args.path, sessions, args, counter
+            )
+    finally:
+        member_models.user_cache = cache
+        http_server.shutdown()
+
+    report = {
+        "users": args.users,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "path": args.path,
+        "db_latency_ms": args.db_latency_ms,
+        "modes": results,
+    }
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print_table("지연 시간 (ms)", {m: r["latency_ms"] for m, r in results.items()})
+    print_table(
+        "처리량",
+        {
+            mode: {
+                "rps": result["throughput_rps"],
+                "user_qpr": result["user_queries_per_request"],
+                "failed": result["failed"],
+            }
+            for mode, result in results.items()
+        },
+    )
+    for mode, result in results.items():
+        for error in result["errors"]:
+            print(f"  [{mode}] {error}")
+
+
+if __name__ == "__main__":
+    main()
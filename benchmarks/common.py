@@ -0,0 +1,253 @@
+"""
+벤치마크 공통 유틸리티
+지연 시간 통계, 동시 실행 드라이버, 처리 중 요청 수 측정 미들웨어를 제공합니다.
+"""
+
+import math
+import time
+import random
+import socket
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+
+LATENCY_DISTRIBUTIONS = ["fixed", "uniform", "normal", "lognormal"]
+
+
+def sample_latency(
+    distribution: str, mean: float, stddev: float, rng: random.Random
+) -> float:
+    """
+    지정한 분포에서 지연 시간(초)을 뽑습니다.
+
+    Args:
+        distribution: fixed, uniform(mean ± stddev), normal, lognormal
+        mean: 평균(초)
+        stddev: 표준편차(초)
+        rng: 난수 생성기
+    """
+    if distribution == "uniform":
+        value = rng.uniform(mean - stddev, mean + stddev)
+    elif distribution == "normal":
+        value = rng.gauss(mean, stddev)
+    elif distribution == "lognormal":
+        # 평균과 표준편차가 주어진 값이 되도록 로그 정규 분포 모수 계산
+        if mean <= 0:
+            return 0.0
+        sigma2 = math.log(1 + stddev**2 / mean**2)
+        mu = math.log(mean) - sigma2 / 2
+        value = rng.lognormvariate(mu, math.sqrt(sigma2))
+    else:
+        value = mean
+    return max(0.0, value)
+
+
+def add_latency_arguments(
+    parser: argparse.ArgumentParser, mean: float = 0.5, stddev: float = 0.2
+) -> None:
+    """지연 시간 분포 인자를 추가합니다."""
+    parser.add_argument(
+        "--latency",
+        choices=LATENCY_DISTRIBUTIONS,
+        default="lognormal",
+        help="응답 지연 시간 분포",
+    )
+    parser.add_argument(
+        "--latency-mean", type=float, default=mean, help="평균 지연(초)"
+    )
+    parser.add_argument(
+        "--latency-stddev", type=float, default=stddev, help="지연 표준편차(초)"
+    )
+
+
+def find_free_port(host: str = "127.0.0.1") -> int:
+    """사용 가능한 TCP 포트 번호를 찾습니다."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """정렬된 값 목록에서 백분위수를 계산합니다. (nearest-rank 방식)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_latencies(latencies: List[float]) -> Dict[str, float]:
+    """지연 시간 목록(초)을 p50/p95/p99/평균/최대 값(밀리초)으로 요약합니다."""
+    if not latencies:
+        return {"count": 0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "mean": 0.0, "max": 0.0}
+    return {
+        "count": len(latencies),
+        "p50": round(percentile(latencies, 50) * 1000, 1),
+        "p95": round(percentile(latencies, 95) * 1000, 1),
+        "p99": round(percentile(latencies, 99) * 1000, 1),
+        "mean": round(sum(latencies) / len(latencies) * 1000, 1),
+        "max": round(max(latencies) * 1000, 1),
+    }
+
+
+class InFlightCounter:
+    """
+    WSGI 미들웨어: 동시에 처리 중인 요청 수를 측정합니다.
+    최대값과 시간 가중 평균값으로 점유된 워커 수를 추정합니다.
+    스트리밍 응답은 본문 전송이 끝날 때까지 처리 중으로 계산합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+        self._area = 0.0
+        self._started_at = time.time()
+        self._last_change = self._started_at
+
+    def _change(self, delta: int) -> None:
+        with self._lock:
+            now = time.time()
+            self._area += self.current * (now - self._last_change)
+            self._last_change = now
+            self.current += delta
+            self.peak = max(self.peak, self.current)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.peak = self.current
+            self._area = 0.0
+            self._started_at = self._last_change = time.time()
+
+    def average(self) -> float:
+        """측정 시작 이후 처리 중 요청 수의 시간 가중 평균을 반환합니다."""
+        with self._lock:
+            now = time.time()
+            area = self._area + self.current * (now - self._last_change)
+            elapsed = now - self._started_at
+        return area / elapsed if elapsed > 0 else 0.0
+
+    def __call__(self, environ, start_response):
+        self._change(1)
+        try:
+            body = self.app(environ, start_response)
+        except Exception:
+            self._change(-1)
+            raise
+        return _ClosingIterator(body, lambda: self._change(-1))
+
+
+class _ClosingIterator:
+    """응답 본문 전송이 끝나면 콜백을 한 번 호출하는 반복자"""
+
+    def __init__(self, body, on_close: Callable[[], None]):
+        self._body = body
+        self._iterator = iter(body)
+        self._on_close = on_close
+        self._closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._iterator)
+
+    def close(self):
+        try:
+            if hasattr(self._body, "close"):
+                self._body.close()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close()
+
+
+class Sampler:
+    """백그라운드 스레드에서 주기적으로 값을 측정하여 최대값과 평균을 기록합니다."""
+
+    def __init__(self, func: Callable[[], float], interval: float = 0.05):
+        self.func = func
+        self.interval = interval
+        self.samples: List[float] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.samples.append(self.func())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def summary(self) -> Dict[str, float]:
+        if not self.samples:
+            return {"peak": 0, "mean": 0.0}
+        return {
+            "peak": max(self.samples),
+            "mean": round(sum(self.samples) / len(self.samples), 2),
+        }
+
+
+def run_load(
+    task: Callable[[int], Any],
+    total: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    """
+    작업을 지정한 동시성으로 total번 실행하고 지연 시간과 처리량을 측정합니다.
+
+    Args:
+        task: 반복 번호를 받아 실행되는 함수 (예외 발생 시 실패로 집계)
+        total: 전체 실행 횟수
+        concurrency: 동시 실행 수
+
+    Returns:
+        latencies(성공 지연 시간 목록), errors(오류 메시지 목록),
+        elapsed(전체 소요 시간), throughput(초당 성공 수)
+    """
+    latencies: List[float] = []
+    errors: List[str] = []
+    lock = threading.Lock()
+
+    def run_one(index: int):
+        start = time.perf_counter()
+        try:
+            task(index)
+        except Exception as e:
+            with lock:
+                errors.append(f"{type(e).__name__}: {e}")
+            return
+        with lock:
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(run_one, range(total)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "latencies": latencies,
+        "errors": errors,
+        "elapsed": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def print_table(title: str, rows: Dict[str, Dict[str, Any]]) -> None:
+    """단계별 요약 통계를 표 형식으로 출력합니다."""
+    print(f"\n== {title} ==")
+    columns: Optional[List[str]] = None
+    for name, stats in rows.items():
+        if columns is None:
+            columns = list(stats.keys())
+            print(f"{'':<24}" + "".join(f"{column:>10}" for column in columns))
+        print(f"{name:<24}" + "".join(f"{stats.get(c, ''):>10}" for c in columns))
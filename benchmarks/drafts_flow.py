@@ -0,0 +1,286 @@
+"""
+보고서 생성 흐름 종단 간 벤치마크
+가짜 OpenAI 서버를 띄우고 애플리케이션을 같은 프로세스에서 실행한 뒤,
+템플릿 분석 → 내용 분석 작업 → 보고서 생성 흐름을 지정한 동시성으로 반복합니다.
+단계별 p50/p95/p99 지연 시간, 처리량, 점유된 워커 수를 보고합니다.
+
+사용 예:
+    python -m benchmarks.drafts_flow --flows 50 --concurrency 10 --stream \\
+        --latency lognormal --latency-mean 1.0 --rate-429 0.02
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import (
+    InFlightCounter,
+    Sampler,
+    print_table,
+    run_load,
+    summarize_latencies,
+)
+from benchmarks.fake_openai_server import (
+    add_settings_arguments,
+    settings_from_args,
+    start_fake_server,
+)
+
+TEMPLATE_BODY = (
+    "□ 추진 배경\n○ 정책 추진 배경과 필요성을 설명합니다.\n"
+    "□ 주요 내용\n○ 세부 추진 과제와 일정, 예산을 정리합니다.\n"
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="보고서 생성 흐름 부하 테스트")
+    parser.add_argument("--flows", type=int, default=20, help="전체 실행 흐름 수")
+    parser.add_argument("--concurrency", type=int, default=5, help="동시 사용자 수")
+    parser.add_argument(
+        "--templates-per-flow", type=int, default=3, help="흐름마다 선택할 템플릿 수"
+    )
+    parser.add_argument(
+        "--template-chars", type=int, default=3000, help="가짜 템플릿 본문 길이"
+    )
+    parser.add_argument("--stream", action="store_true", help="SSE 스트리밍 생성 사용")
+    parser.add_argument(
+        "--job-workers", type=int, default=4, help="백그라운드 작업자 수"
+    )
+    parser.add_argument(
+        "--llm-cache", action="store_true", help="LLM 응답 캐시 사용 (기본: 끔)"
+    )
+    parser.add_argument(
+        "--llm-url",
+        default=None,
+        help="이미 실행 중인 OpenAI 호환 서버 주소 (지정하지 않으면 가짜 서버 실행)",
+    )
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument(
+        "--verbose", action="store_true", help="애플리케이션 INFO 로그 출력"
+    )
+    add_settings_arguments(parser)
+    return parser.parse_args()
+
+
+def configure_environment(args: argparse.Namespace, api_base: str, workdir: str):
+    """애플리케이션을 불러오기 전에 벤치마크용 환경 변수를 설정합니다."""
+    os.environ["OPENAI_API_BASE"] = api_base
+    os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+    os.environ["LLM_CACHE_ENABLED"] = "True" if args.llm_cache else "False"
+    os.environ["LLM_CACHE_PATH"] = os.path.join(workdir, "llm_cache.db")
+    os.environ["RATE_LIMIT_DB_PATH"] = os.path.join(workdir, "rate_limit.db")
+    os.environ["ARTIFACT_DIR"] = os.path.join(workdir, "artifacts")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["JOB_MAX_WORKERS"] = str(args.job_workers)
+    os.environ["JOB_MAX_PENDING"] = str(max(32, args.flows))
+
+
+def seed_templates(count: int, chars: int) -> List[str]:
+    """검색 결과 캐시에 가짜 템플릿을 넣고 ID 목록을 반환합니다."""
+    from routes.main import template_cache
+
+    body = (TEMPLATE_BODY * (chars // len(TEMPLATE_BODY) + 1))[:chars]
+    items = [
+        {
+            "id": f"bench-{index}",
+            "title": f"벤치마크 템플릿 {index}",
+            "publisher": "벤치마크부",
+            "summary": "부하 테스트용 템플릿",
+            "structure": "",
+            "content": body,
+        }
+        for index in range(count)
+    ]
+    template_cache["benchmark"] = {"items": items}
+    return [item["id"] for item in items]
+
+
+class DraftsFlow:
+    """한 사용자의 보고서 생성 흐름을 HTTP로 실행하고 단계별 지연 시간을 기록합니다."""
+
+    def __init__(self, base_url: str, template_ids: List[str], args):
+        import requests
+
+        self.base_url = base_url
+        self.template_ids = template_ids
+        self.args = args
+        self.local = threading.local()
+        self.requests = requests
+        self.timings: Dict[str, List[float]] = defaultdict(list)
+        self.lock = threading.Lock()
+
+    @property
+    def session(self):
+        # 사용자(스레드)마다 연결을 재사용
+        if not hasattr(self.local, "session"):
+            self.local.session = self.requests.Session()
+        return self.local.session
+
+    def record(self, step: str, started: float) -> None:
+        with self.lock:
+            self.timings[step].append(time.perf_counter() - started)
+
+    def post(self, path: str, payload: Dict[str, Any], **kwargs):
+        return self.session.post(f"{self.base_url}{path}", json=payload, **kwargs)
+
+    def __call__(self, index: int) -> None:
+        count = self.args.templates_per_flow
+        offset = (index * count) % len(self.template_ids)
+        ids = (self.template_ids * 2)[offset : offset + count]
+
+        started = time.perf_counter()
+        response = self.post("/api/drafts/analyze-templates", {"template_ids": ids})
+        response.raise_for_status()
+        self.record("analyze-templates", started)
+        artifact_id = response.json()["artifact_id"]
+
+        started = time.perf_counter()
+        response = self.post(
+            "/api/drafts/analyze-content", {"artifact_id": artifact_id}
+        )
+        response.raise_for_status()
+        self.record("analyze-content(202)", started)
+        self.wait_for_job(response.json(), started)
+
+        started = time.perf_counter()
+        payload = {
+            "template_ids": ids,
+            "user_input": f"벤치마크 보고서 {index}",
+            "stream": self.args.stream,
+        }
+        if self.args.stream:
+            self.generate_stream(payload, started)
+        else:
+            response = self.post("/api/drafts/generate", payload)
+            response.raise_for_status()
+        self.record("generate", started)
+
+    def wait_for_job(self, job: Dict[str, Any], started: float) -> None:
+        """작업이 끝날 때까지 상태를 조회합니다."""
+        delay = 0.1
+        while True:
+            response = self.session.get(f"{self.base_url}{job['status_url']}")
+            response.raise_for_status()
+            status = response.json()["status"]
+            if status == "succeeded":
+                break
+            if status in ("failed", "cancelled"):
+                raise RuntimeError(f"내용 분석 작업 {status}: {response.json()}")
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
+        self.record("analyze-content(job)", started)
+
+        response = self.session.get(f"{self.base_url}{job['result_url']}")
+        response.raise_for_status()
+
+    def generate_stream(self, payload: Dict[str, Any], started: float) -> None:
+        """SSE 응답을 끝까지 읽고 첫 토큰 도착 시간을 기록합니다."""
+        with self.post("/api/drafts/generate", payload, stream=True) as response:
+            response.raise_for_status()
+            event = None
+            first_delta = False
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("event:"):
+                    event = line.split(":", 1)[1].strip()
+                elif line.startswith("data:"):
+                    if event == "delta" and not first_delta:
+                        first_delta = True
+                        self.record("generate(first token)", started)
+                    elif event == "error":
+                        raise RuntimeError(f"생성 오류: {line[5:].strip()}")
+                    elif event == "done":
+                        return
+        raise RuntimeError("스트림이 done 이벤트 없이 종료됨")
+
+
+def main():
+    args = parse_args()
+    workdir = tempfile.mkdtemp(prefix="govdraft-bench-")
+
+    fake_server = None
+    if args.llm_url:
+        api_base = args.llm_url
+    else:
+        fake_server = start_fake_server(settings_from_args(args))
+        api_base = fake_server.api_base
+    configure_environment(args, api_base, workdir)
+
+    # 환경 변수 설정 후에 애플리케이션을 불러옴
+    from werkzeug.serving import make_server
+    from app import app
+    from utils.job_queue import job_manager
+    from utils.logging import logger
+
+    if not args.verbose:
+        logger.setLevel(logging.WARNING)
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+    counter = InFlightCounter(app.wsgi_app)
+    app.wsgi_app = counter
+    http_server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=http_server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{http_server.server_port}"
+
+    template_ids = seed_templates(
+        max(args.templates_per_flow * 4, 10), args.template_chars
+    )
+    flow = DraftsFlow(base_url, template_ids, args)
+
+    print(
+        f"벤치마크 시작: 흐름={args.flows}, 동시성={args.concurrency}, "
+        f"스트리밍={args.stream}, LLM={api_base}"
+    )
+    counter.reset()
+    with Sampler(lambda: job_manager.stats()["running"]) as job_sampler:
+        load = run_load(flow, args.flows, args.concurrency)
+    http_server.shutdown()
+
+    steps = {step: summarize_latencies(values) for step, values in flow.timings.items()}
+    steps["flow(total)"] = summarize_latencies(load["latencies"])
+    report = {
+        "flows": args.flows,
+        "concurrency": args.concurrency,
+        "succeeded": len(load["latencies"]),
+        "failed": len(load["errors"]),
+        "elapsed_s": round(load["elapsed"], 2),
+        "throughput_flows_per_s": round(load["throughput"], 3),
+        "http_in_flight": {"peak": counter.peak, "mean": round(counter.average(), 2)},
+        "job_workers_busy": {**job_sampler.summary(), "max": args.job_workers},
+        "steps_ms": steps,
+        "llm_server": fake_server.stats.to_dict() if fake_server else None,
+        "errors": load["errors"][:10],
+    }
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print_table("단계별 지연 시간 (ms)", steps)
+    print(
+        f"\n성공 {report['succeeded']} / 실패 {report['failed']}, "
+        f"소요 {report['elapsed_s']}초, 처리량 {report['throughput_flows_per_s']} 흐름/초"
+    )
+    print(
+        f"처리 중 HTTP 요청: 최대 {counter.peak}, 평균 {report['http_in_flight']['mean']}"
+    )
+    print(
+        f"작업자 점유: 최대 {report['job_workers_busy']['peak']}/{args.job_workers}, "
+        f"평균 {report['job_workers_busy']['mean']}"
+    )
+    if fake_server:
+        print(f"가짜 LLM 서버: {report['llm_server']}")
+    for error in report["errors"]:
+        print(f"오류: {error}")
+
+
+if __name__ == "__main__":
+    main()
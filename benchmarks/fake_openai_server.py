@@ -0,0 +1,347 @@
+"""
+OpenAI 호환 가짜 서버
+/v1/chat/completions 요청에 설정한 지연 시간 분포, 토큰 사용량, 오류 비율로 응답합니다.
+실제 비용이나 속도 제한 없이 보고서 생성 흐름의 부하 테스트에 사용합니다.
+
+사용 예:
+    python -m benchmarks.fake_openai_server --port 8765 --latency lognormal \\
+        --latency-mean 1.5 --rate-429 0.02 --rate-5xx 0.01
+    OPENAI_API_BASE=http://127.0.0.1:8765/v1 python app.py
+"""
+
+import json
+import time
+import uuid
+import random
+import argparse
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from benchmarks.common import add_latency_arguments, sample_latency
+
+# JSON 응답을 요구하는 프롬프트에 돌려줄 범용 결과
+# (템플릿 분석, 병합, 문서 분석 응답 형식을 모두 만족)
+FAKE_JSON_RESPONSE = {
+    "title": "가짜 템플릿",
+    "structure": [
+        {"name": "추진 배경", "description": "정책 추진 배경", "example": "□ 배경"},
+        {"name": "주요 내용", "description": "핵심 정책 내용", "example": "○ 내용"},
+    ],
+    "tips": ["개조식으로 간결하게 작성"],
+    "keywords": ["정책", "추진", "예산"],
+    "common_structure": [{"name": "추진 배경", "description": "공통 항목"}],
+    "common_keywords": ["정책"],
+    "writing_tips": ["핵심부터 작성"],
+    "templates": [{"title": "가짜 템플릿", "structure": [], "keywords": []}],
+    "tone": {"formality": 0.9, "sentiment": 0.1, "objectivity": 0.9},
+    "summary": "가짜 요약입니다.",
+}
+
+FAKE_TEXT = "□ 추진 배경\n○ 본 문서는 부하 테스트를 위해 생성된 가짜 보고서입니다.\n"
+
+
+@dataclass
+class FakeServerSettings:
+    """가짜 서버 동작 설정"""
+
+    latency: str = "fixed"  # fixed | uniform | normal | lognormal
+    latency_mean: float = 0.5  # 초
+    latency_stddev: float = 0.2  # 초 (uniform은 ± 범위)
+    completion_tokens: int = 300
+    tokens_per_second: float = 200.0  # 스트리밍 토큰 생성 속도
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    seed: Optional[int] = None
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """설정한 분포에서 응답 지연 시간(초)을 뽑습니다."""
+        return sample_latency(self.latency, self.latency_mean, self.latency_stddev, rng)
+
+
+class FakeServerStats:
+    """가짜 서버가 처리한 요청 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.streams = 0
+        self.errors_429 = 0
+        self.errors_5xx = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def enter(self):
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def leave(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def count(self, field: str):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def to_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "streams": self.streams,
+                "errors_429": self.errors_429,
+                "errors_5xx": self.errors_5xx,
+                "peak_in_flight": self.peak_in_flight,
+            }
+
+
+def _estimate_tokens(messages: List[Dict[str, Any]]) -> int:
+    """입력 토큰 수를 대략 추정합니다. (한글 기준 글자당 약 1토큰)"""
+    return sum(len(message.get("content") or "") + 4 for message in messages)
+
+
+def _build_content(messages: List[Dict[str, Any]], completion_tokens: int) -> str:
+    """프롬프트 형식에 맞는 가짜 응답 내용을 만듭니다."""
+    system = next(
+        (m.get("content") or "" for m in messages if m.get("role") == "system"), ""
+    )
+    if "JSON" in system:
+        return json.dumps(FAKE_JSON_RESPONSE, ensure_ascii=False)
+    repeat = max(1, completion_tokens // len(FAKE_TEXT))
+    return FAKE_TEXT * repeat
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """OpenAI Chat Completions API 형식으로 응답하는 요청 처리기"""
+
+    protocol_version = "HTTP/1.1"
+    server: "FakeOpenAIServer"
+
+    def log_message(self, format, *args):
+        # 부하 테스트 중 요청마다 로그를 남기지 않음
+        pass
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, message: str, error_type: str, headers=None):
+        self._send_json(
+            status,
+            {"error": {"message": message, "type": error_type, "code": None}},
+            headers,
+        )
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_error(
+                404, f"알 수 없는 경로: {self.path}", "invalid_request_error"
+            )
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_error(400, "잘못된 JSON 요청", "invalid_request_error")
+            return
+
+        settings = self.server.settings
+        stats = self.server.stats
+        stats.enter()
+        try:
+            with self.server.rng_lock:
+                roll = self.server.rng.random()
+                latency = settings.sample_latency(self.server.rng)
+
+            if roll < settings.rate_429:
+                stats.count("errors_429")
+                self._send_error(
+                    429,
+                    "Rate limit reached (fake server)",
+                    "requests",
+                    {"Retry-After": "1"},
+                )
+                return
+            if roll < settings.rate_429 + settings.rate_5xx:
+                stats.count("errors_5xx")
+                time.sleep(latency / 2)
+                status = (
+                    503 if roll < settings.rate_429 + settings.rate_5xx / 2 else 500
+                )
+                self._send_error(
+                    status, "The server is overloaded (fake)", "server_error"
+                )
+                return
+
+            messages = request.get("messages") or []
+            model = request.get("model", "gpt-4o-mini")
+            completion_tokens = min(
+                settings.completion_tokens,
+                request.get("max_tokens") or settings.completion_tokens,
+            )
+            content = _build_content(messages, completion_tokens)
+            usage = {
+                "prompt_tokens": _estimate_tokens(messages),
+                "completion_tokens": completion_tokens,
+                "total_tokens": _estimate_tokens(messages) + completion_tokens,
+            }
+
+            if request.get("stream"):
+                stats.count("streams")
+                self._stream(request, model, content, usage, latency)
+            else:
+                time.sleep(latency)
+                self._send_json(
+                    200,
+                    {
+                        "id": f"chatcmpl-{uuid.uuid4().hex}",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {"role": "assistant", "content": content},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                        "usage": usage,
+                    },
+                )
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            stats.leave()
+
+    def _stream(self, request, model, content, usage, latency):
+        """SSE 형식으로 응답을 조각 단위로 전송합니다. (latency는 첫 토큰까지의 시간)"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        time.sleep(latency)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        pieces = [content[i : i + 20] for i in range(0, len(content), 20)] or [""]
+        delay = (
+            usage["completion_tokens"] / self.server.settings.tokens_per_second
+        ) / len(pieces)
+
+        def send(payload):
+            data = json.dumps(payload, ensure_ascii=False)
+            self.wfile.write(f"data: {data}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        for piece in pieces:
+            send(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [
+                        {"index": 0, "delta": {"content": piece}, "finish_reason": None}
+                    ],
+                }
+            )
+            time.sleep(delay)
+
+        if (request.get("stream_options") or {}).get("include_usage"):
+            send(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [],
+                    "usage": usage,
+                }
+            )
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    """요청마다 스레드를 사용하는 가짜 OpenAI 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, address, settings: FakeServerSettings):
+        super().__init__(address, FakeOpenAIHandler)
+        self.settings = settings
+        self.stats = FakeServerStats()
+        self.rng = random.Random(settings.seed)
+        self.rng_lock = threading.Lock()
+
+    @property
+    def api_base(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+
+def start_fake_server(
+    settings: FakeServerSettings, host: str = "127.0.0.1", port: int = 0
+) -> FakeOpenAIServer:
+    """가짜 서버를 백그라운드 스레드에서 시작합니다. (port=0이면 빈 포트 사용)"""
+    server = FakeOpenAIServer((host, port), settings)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_settings_arguments(parser: argparse.ArgumentParser) -> None:
+    """가짜 서버 설정 인자를 추가합니다. (벤치마크 스크립트와 공유)"""
+    add_latency_arguments(parser)
+    parser.add_argument(
+        "--completion-tokens", type=int, default=300, help="응답 출력 토큰 수"
+    )
+    parser.add_argument(
+        "--tokens-per-second", type=float, default=200.0, help="스트리밍 생성 속도"
+    )
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 오류 비율")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="5xx 오류 비율")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+
+
+def settings_from_args(args: argparse.Namespace) -> FakeServerSettings:
+    return FakeServerSettings(
+        latency=args.latency,
+        latency_mean=args.latency_mean,
+        latency_stddev=args.latency_stddev,
+        completion_tokens=args.completion_tokens,
+        tokens_per_second=args.tokens_per_second,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호환 가짜 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_settings_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer((args.host, args.port), settings_from_args(args))
+    print(f"가짜 OpenAI 서버 실행 중: OPENAI_API_BASE={server.api_base}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"요청 통계: {server.stats.to_dict()}")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
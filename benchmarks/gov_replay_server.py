@@ -0,0 +1,304 @@
+"""
+공공데이터포털(apis.data.go.kr) 재생 서버
+GOV_API_RECORD_DIR 기록 모드로 저장한 픽스처를 실제와 비슷한 지연 시간과
+resultCode 오류를 섞어 재생합니다. 인증키 없이 검색 부하 테스트에 사용합니다.
+
+사용 예:
+    GOV_API_RECORD_DIR=fixtures/gov python app.py      # 실제 API로 검색하며 기록
+    python -m benchmarks.gov_replay_server --fixtures fixtures/gov --port 8766
+    API_BASE_URL=http://127.0.0.1:8766 PUBLIC_DATA_API_KEY=dummy python app.py
+"""
+
+import os
+import sys
+import glob
+import json
+import random
+import argparse
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import add_latency_arguments, sample_latency
+
+# 공공데이터포털 공통 오류 코드
+RESULT_CODE_ERRORS = {
+    "01": "APPLICATION_ERROR",
+    "04": "HTTP_ERROR",
+    "12": "NO_OPENAPI_SERVICE_ERROR",
+    "22": "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR",
+    "99": "UNKNOWN_ERROR",
+}
+
+
+@dataclass
+class ReplaySettings:
+    """재생 서버 동작 설정"""
+
+    latency: str = "lognormal"
+    latency_mean: float = 0.4
+    latency_stddev: float = 0.3
+    recorded_latency: bool = False  # 기록된 응답 시간을 그대로 사용
+    error_rate: float = 0.0  # resultCode 오류 응답 비율
+    xml_errors: bool = False  # 실제 포털처럼 오류를 XML로 응답
+    strict: bool = False  # 기록되지 않은 요청에 NODATA 오류 응답
+    synthetic_items: int = 10  # 픽스처가 없는 엔드포인트의 가짜 결과 수
+    seed: Optional[int] = None
+
+
+def fixture_key(endpoint: str, params: Dict[str, Any]) -> str:
+    # 부하 테스트가 환경 변수를 설정한 뒤에 설정 모듈이 로드되도록 필요할 때 불러옴
+    from api.government_api import fixture_key as government_fixture_key
+
+    return government_fixture_key(endpoint, params)
+
+
+def load_fixtures(directory: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """픽스처 디렉토리의 JSON 파일을 키별로 불러옵니다."""
+    fixtures = {}
+    if not directory:
+        return fixtures
+    for path in glob.glob(os.path.join(directory, "*.json")):
+        with open(path, encoding="utf-8") as f:
+            fixture = json.load(f)
+        fixtures[fixture_key(fixture["endpoint"], fixture["params"])] = fixture
+    return fixtures
+
+
+def synthetic_response(endpoint: str, params: Dict[str, str], count: int) -> Dict:
+    """기록이 없을 때 사용할 포털 형식의 가짜 응답을 만듭니다."""
+    page = int(params.get("pageNo") or 1)
+    rows = min(int(params.get("numOfRows") or 10), count)
+    title = params.get("title") or "정책"
+    results = [
+        {
+            "meta": {
+                "doc_id": f"{endpoint}-{title}-{page}-{index}",
+                "title": f"{title} 관련 문서 {page}-{index}",
+                "doc_type": endpoint,
+                "date": "2025-01-01",
+                "ministry": "행정안전부",
+                "department": "벤치마크과",
+                "manager": params.get("manager", ""),
+            },
+            "data": {
+                "text": "<p>□ 추진 배경</p><p>○ 재생 서버가 생성한 가짜 본문입니다.</p>"
+                * 20
+            },
+        }
+        for index in range(rows)
+    ]
+    return {
+        "response": {
+            "header": {"resultCode": "00", "resultMsg": "NORMAL_SERVICE"},
+            "body": {
+                "resultList": results,
+                "totalCount": count * 10,
+                "pageNo": page,
+                "numOfRows": rows,
+            },
+        }
+    }
+
+
+class ReplayStats:
+    """재생 서버가 처리한 요청 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {"requests": 0, "replayed": 0, "synthetic": 0, "errors": 0}
+
+    def count(self, field: str) -> None:
+        with self._lock:
+            self.counts[field] += 1
+
+    def to_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+
+class GovReplayHandler(BaseHTTPRequestHandler):
+    """기록된 포털 응답을 재생하는 요청 처리기"""
+
+    protocol_version = "HTTP/1.1"
+    server: "GovReplayServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self._send(200, body, "application/json;charset=UTF-8")
+
+    def _send_result_error(self, code: str, message: str) -> None:
+        if self.server.settings.xml_errors:
+            # 포털은 인증/한도 오류를 type=json 요청에도 XML로 응답하는 경우가 있음
+            body = (
+                "<OpenAPI_ServiceResponse><cmmMsgHeader>"
+                f"<errMsg>SERVICE ERROR</errMsg><returnAuthMsg>{message}</returnAuthMsg>"
+                f"<returnReasonCode>{code}</returnReasonCode>"
+                "</cmmMsgHeader></OpenAPI_ServiceResponse>"
+            ).encode("utf-8")
+            self._send(200, body, "text/xml;charset=UTF-8")
+        else:
+            self._send_json(
+                {"response": {"header": {"resultCode": code, "resultMsg": message}}}
+            )
+
+    def do_GET(self):
+        server = self.server
+        settings = server.settings
+        server.stats.count("requests")
+
+        parts = urlsplit(self.path)
+        endpoint = parts.path.rstrip("/").rsplit("/", 1)[-1]
+        params = dict(parse_qsl(parts.query, keep_blank_values=True))
+        fixture = server.fixtures.get(fixture_key(endpoint, params))
+
+        with server.rng_lock:
+            roll = server.rng.random()
+            if fixture and settings.recorded_latency:
+                latency = float(fixture.get("elapsed") or 0)
+            else:
+                latency = sample_latency(
+                    settings.latency,
+                    settings.latency_mean,
+                    settings.latency_stddev,
+                    server.rng,
+                )
+            error_code = server.rng.choice(sorted(RESULT_CODE_ERRORS))
+        server.wait(latency)
+
+        try:
+            if roll < settings.error_rate:
+                server.stats.count("errors")
+                self._send_result_error(error_code, RESULT_CODE_ERRORS[error_code])
+            elif fixture:
+                server.stats.count("replayed")
+                self._send_json(fixture["response"])
+            elif settings.strict:
+                server.stats.count("errors")
+                self._send_result_error("03", "NODATA_ERROR")
+            else:
+                server.stats.count("synthetic")
+                self._send_json(
+                    synthetic_response(endpoint, params, settings.synthetic_items)
+                )
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class GovReplayServer(ThreadingHTTPServer):
+    """요청마다 스레드를 사용하는 재생 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, address, settings: ReplaySettings, fixtures: Dict[str, Dict]):
+        super().__init__(address, GovReplayHandler)
+        self.settings = settings
+        self.fixtures = fixtures
+        self.stats = ReplayStats()
+        self.rng = random.Random(settings.seed)
+        self.rng_lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def wait(self, seconds: float) -> None:
+        self._stopped.wait(seconds)
+
+    def shutdown(self):
+        self._stopped.set()
+        super().shutdown()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_replay_server(
+    settings: ReplaySettings,
+    fixtures_dir: Optional[str] = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> GovReplayServer:
+    """재생 서버를 백그라운드 스레드에서 시작합니다. (port=0이면 빈 포트 사용)"""
+    server = GovReplayServer((host, port), settings, load_fixtures(fixtures_dir))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_replay_arguments(parser: argparse.ArgumentParser) -> None:
+    """재생 서버 설정 인자를 추가합니다. (부하 테스트 스크립트와 공유)"""
+    parser.add_argument("--fixtures", default=None, help="기록된 픽스처 디렉토리")
+    add_latency_arguments(parser, mean=0.4, stddev=0.3)
+    parser.add_argument(
+        "--recorded-latency",
+        action="store_true",
+        help="기록된 응답 시간을 그대로 재생",
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="resultCode 오류 응답 비율"
+    )
+    parser.add_argument(
+        "--xml-errors", action="store_true", help="오류를 XML 형식으로 응답"
+    )
+    parser.add_argument(
+        "--strict", action="store_true", help="기록되지 않은 요청에 NODATA 오류 응답"
+    )
+    parser.add_argument(
+        "--synthetic-items", type=int, default=10, help="가짜 응답의 결과 수"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+
+
+def replay_settings_from_args(args: argparse.Namespace) -> ReplaySettings:
+    return ReplaySettings(
+        latency=args.latency,
+        latency_mean=args.latency_mean,
+        latency_stddev=args.latency_stddev,
+        recorded_latency=args.recorded_latency,
+        error_rate=args.error_rate,
+        xml_errors=args.xml_errors,
+        strict=args.strict,
+        synthetic_items=args.synthetic_items,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공공데이터포털 재생 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    add_replay_arguments(parser)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    server = GovReplayServer(
+        (args.host, args.port), replay_settings_from_args(args), fixtures
+    )
+    print(
+        f"공공데이터포털 재생 서버 실행 중: API_BASE_URL={server.base_url}, "
+        f"픽스처 {len(fixtures)}개"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"요청 통계: {server.stats.to_dict()}")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
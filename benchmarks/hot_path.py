@@ -0,0 +1,335 @@
+"""
+요청마다 실행되는 파싱/변환 함수의 마이크로 벤치마크
+대표 픽스처로 함수별 초당 실행 횟수(ops/s)와 호출당 최대 메모리 할당량을 측정하고,
+저장된 기준값보다 임계값 이상 느려지거나 메모리를 더 쓰면 0이 아닌 코드로 종료합니다.
+
+사용 예:
+    python -m benchmarks.hot_path --save            # 기준값 저장
+    python -m benchmarks.hot_path --check           # 기준값과 비교 (회귀 시 종료 코드 1)
+    python -m benchmarks.hot_path --check --threshold 0.3 --filter clean_html
+"""
+
+import os
+import gc
+import sys
+import json
+import timeit
+import logging
+import argparse
+import platform
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import hot_path_fixtures as fixtures
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baselines", "hot_path.json"
+)
+
+# 이 값보다 작은 메모리 변화는 회귀로 보지 않음 (바이트)
+MEMORY_NOISE_FLOOR = 4096
+
+
+@dataclass
+class BenchCase:
+    """벤치마크 대상 함수 호출 하나"""
+
+    name: str
+    func: Callable[[], Any]
+    # 결과를 검사하여 측정할 수 없는 이유를 반환 (측정 가능하면 None)
+    skip_reason: Optional[Callable[[Any], Optional[str]]] = None
+
+
+def build_cases() -> List[BenchCase]:
+    """측정할 함수와 픽스처 조합을 만듭니다."""
+    from api.government_api import parse_api_response, process_items
+    from api.government_api import process_result_list
+    from routes.main import format_content_filter
+    from utils.doc_structure import parse_document
+    from utils.html_utils import clean_html_content, get_preview_content
+    from utils.near_duplicates import NearDuplicateDetector
+    from utils.similarity_index import SimilarityIndex
+    from utils.token_utils import calculate_token_cost
+
+    documents = {
+        "small": fixtures.small_document(),
+        "large": fixtures.large_document(),
+        "table_heavy": fixtures.table_heavy_document(),
+    }
+    cleaned = {name: clean_html_content(html) for name, html in documents.items()}
+    pages = {count: fixtures.api_page(count) for count in (10, 100)}
+    result_lists = {count: fixtures.result_list(count) for count in (10, 100)}
+    items = fixtures.items_page(100)
+
+    def token_error(result):
+        return result.get("error") if isinstance(result, dict) else None
+
+    cases = []
+    for count in (10, 100):
+        cases.append(
+            BenchCase(
+                f"parse_api_response[{count}]",
+                lambda page=pages[count]: parse_api_response(page, "press"),
+            )
+        )
+        cases.append(
+            BenchCase(
+                f"process_result_list[{count}]",
+                lambda results=result_lists[count]: process_result_list(
+                    results, "press"
+                ),
+            )
+        )
+    cases.append(BenchCase("process_items[100]", lambda: process_items(items)))
+
+    # 유사 템플릿 색인: 검색 결과 한 페이지 추가, 1000건 색인에서 상위 5건 조회
+    processed = {
+        count: process_result_list(fixtures.result_list(count), "press")
+        for count in (100, 1000)
+    }
+    index = SimilarityIndex()
+    index.add_items(processed[1000])
+    cases.append(
+        BenchCase(
+            "similarity_index.add_items[100]",
+            lambda: SimilarityIndex().add_items(processed[100]),
+        )
+    )
+    cases.append(
+        BenchCase(
+            "near_duplicates.collapse_items[100]",
+            lambda detector=NearDuplicateDetector(): detector.collapse_items(
+                processed[100]
+            ),
+        )
+    )
+    cases.append(
+        BenchCase(
+            "similarity_index.similar[1000]",
+            lambda: index.similar(processed[1000][0]["id"], 5),
+        )
+    )
+
+    for name, html in documents.items():
+        cases.append(
+            BenchCase(
+                f"clean_html_content[{name}]", lambda h=html: clean_html_content(h)
+            )
+        )
+        cases.append(
+            BenchCase(
+                f"get_preview_content[{name}]",
+                lambda text=cleaned[name]: get_preview_content(text, 500),
+            )
+        )
+        cases.append(
+            BenchCase(
+                f"parse_document[{name}]",
+                lambda text=cleaned[name]: parse_document(text),
+            )
+        )
+
+    cases.append(
+        BenchCase(
+            "format_content_filter[text]",
+            lambda: format_content_filter(cleaned["large"]),
+        )
+    )
+    cases.append(
+        BenchCase(
+            "format_content_filter[html]",
+            lambda: format_content_filter(documents["table_heavy"]),
+        )
+    )
+    cases.append(
+        BenchCase(
+            "calculate_token_cost[tokens]",
+            lambda: calculate_token_cost(1200, 800, "gpt-4o-mini"),
+        )
+    )
+    cases.append(
+        BenchCase(
+            "calculate_token_cost[text]",
+            lambda: calculate_token_cost(cleaned["large"], cleaned["small"]),
+            skip_reason=token_error,
+        )
+    )
+    return cases
+
+
+def measure_speed(func: Callable[[], Any], repeat: int) -> float:
+    """가장 빠른 반복의 호출당 시간으로 초당 실행 횟수를 계산합니다."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return 1.0 / best if best > 0 else float("inf")
+
+
+def measure_allocation(func: Callable[[], Any]) -> Dict[str, int]:
+    """호출 한 번의 최대 메모리 할당량과 호출 후 남은 메모리를 측정합니다."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"peak_bytes": peak - before, "retained_bytes": max(0, current - before)}
+
+
+def run_cases(cases: List[BenchCase], repeat: int) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for case in cases:
+        first = case.func()
+        reason = case.skip_reason(first) if case.skip_reason else None
+        if reason:
+            results[case.name] = {"skipped": str(reason)[:80]}
+            continue
+        results[case.name] = {
+            "ops_per_sec": round(measure_speed(case.func, repeat), 1),
+            **measure_allocation(case.func),
+        }
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+) -> List[str]:
+    """기준값 대비 회귀 항목을 찾습니다."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base or "skipped" in current or "skipped" in base:
+            continue
+
+        min_ops = base["ops_per_sec"] * (1 - threshold)
+        if current["ops_per_sec"] < min_ops:
+            regressions.append(
+                f"{name}: 속도 {current['ops_per_sec']:.1f} ops/s "
+                f"(기준 {base['ops_per_sec']:.1f}, {_change(current, base):+.1%})"
+            )
+
+        max_peak = max(
+            base["peak_bytes"] * (1 + threshold),
+            base["peak_bytes"] + MEMORY_NOISE_FLOOR,
+        )
+        if current["peak_bytes"] > max_peak:
+            regressions.append(
+                f"{name}: 메모리 {current['peak_bytes']:,}B "
+                f"(기준 {base['peak_bytes']:,}B)"
+            )
+    return regressions
+
+
+def _change(current: Dict[str, Any], base: Dict[str, Any]) -> float:
+    return current["ops_per_sec"] / base["ops_per_sec"] - 1
+
+
+def print_results(results, baseline) -> None:
+    print(
+        f"{'함수[픽스처]':<34}{'ops/s':>12}{'us/op':>11}{'peak KB':>10}"
+        f"{'기준 ops/s':>13}{'변화':>9}"
+    )
+    for name, current in results.items():
+        if "skipped" in current:
+            print(f"{name:<34}  건너뜀: {current['skipped']}")
+            continue
+        base = baseline.get(name)
+        base_ops = (
+            f"{base['ops_per_sec']:>13.1f}"
+            if base and "skipped" not in base
+            else f"{'-':>13}"
+        )
+        change = (
+            f"{_change(current, base):>+9.1%}"
+            if base and "skipped" not in base
+            else f"{'-':>9}"
+        )
+        print(
+            f"{name:<34}{current['ops_per_sec']:>12.1f}"
+            f"{1e6 / current['ops_per_sec']:>11.1f}"
+            f"{current['peak_bytes'] / 1024:>10.1f}{base_ops}{change}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="핫 패스 마이크로 벤치마크")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준값 파일")
+    parser.add_argument("--save", action="store_true", help="결과를 기준값으로 저장")
+    parser.add_argument(
+        "--check", action="store_true", help="기준값 대비 회귀 시 종료 코드 1"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="허용 회귀 비율 (0.25 = 25%%)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수")
+    parser.add_argument("--filter", default="", help="이름에 포함된 항목만 측정")
+    parser.add_argument(
+        "--verbose", action="store_true", help="측정 중 애플리케이션 로그 출력"
+    )
+    args = parser.parse_args()
+
+    from utils.logging import logger
+
+    # 측정 대상 함수의 INFO 로그 출력 비용은 제외
+    if not args.verbose:
+        logger.setLevel(logging.WARNING)
+
+    cases = [case for case in build_cases() if args.filter in case.name]
+    results = run_cases(cases, args.repeat)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+
+    print_results(results, baseline)
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": {**baseline, **results},
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        print(f"\n기준값 저장: {args.baseline}")
+
+    if args.check:
+        if not baseline:
+            print(f"\n기준값 파일이 없습니다: {args.baseline} (--save로 먼저 생성)")
+            sys.exit(2)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            # 일시적인 부하로 인한 오탐을 줄이기 위해 회귀 항목을 한 번 더 측정
+            suspects = {line.split(":", 1)[0] for line in regressions}
+            for case in cases:
+                if case.name in suspects:
+                    retry = measure_speed(case.func, args.repeat * 2)
+                    results[case.name]["ops_per_sec"] = round(
+                        max(results[case.name]["ops_per_sec"], retry), 1
+                    )
+            regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n성능 회귀 {len(regressions)}건 (임계값 {args.threshold:.0%}):")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print(f"\n성능 회귀 없음 (임계값 {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+핫 패스 마이크로 벤치마크용 대표 픽스처
+공공데이터포털 응답 형식의 문서와 검색 결과 페이지를 결정적으로 생성합니다.
+"""
+
+import random
+from typing import Any, Dict, List
+
+SENTENCES = [
+    "정부는 청년 일자리 창출을 위해 관계 부처 합동으로 지원 방안을 마련하였다.",
+    "올해 예산은 전년 대비 12.5% 증가한 3조 2천억 원 규모로 편성되었다.",
+    "지방자치단체와 협력하여 현장 중심의 맞춤형 지원 체계를 구축할 계획이다.",
+    "디지털 전환에 대응하여 공공 서비스의 접근성과 편의성을 높인다.",
+    "관련 법령 개정을 추진하고 제도 개선 과제를 단계적으로 이행한다.",
+]
+
+
+def _paragraphs(rng: random.Random, sections: int, bullets: int) -> str:
+    """□/○ 구조의 HTML 문단을 생성합니다."""
+    parts = []
+    for section in range(sections):
+        parts.append(f"<p>□ 추진 과제 {section + 1}</p>")
+        for _ in range(bullets):
+            parts.append(f"<p>○ {rng.choice(SENTENCES)} {rng.choice(SENTENCES)}</p>")
+    return "".join(parts)
+
+
+def _table(rng: random.Random, rows: int, cols: int) -> str:
+    """숫자와 텍스트가 섞인 표를 생성합니다."""
+    header = "".join(f"<th>항목 {col + 1}</th>" for col in range(cols))
+    body = "".join(
+        "<tr>"
+        + "".join(
+            (
+                f"<td>{rng.randint(1, 99999):,}</td>"
+                if col
+                else f"<td>{rng.choice(['서울', '부산', '대구', '세종'])}</td>"
+            )
+            for col in range(cols)
+        )
+        + "</tr>"
+        for _ in range(rows)
+    )
+    return f"<table><thead><tr>{header}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def small_document(seed: int = 1) -> str:
+    """짧은 보도자료 본문 (약 1KB)"""
+    rng = random.Random(seed)
+    return _paragraphs(rng, sections=2, bullets=2)
+
+
+def large_document(seed: int = 2) -> str:
+    """긴 보고서 본문 (약 100KB)"""
+    rng = random.Random(seed)
+    return _paragraphs(rng, sections=60, bullets=10)
+
+
+def table_heavy_document(seed: int = 3) -> str:
+    """표가 많은 통계 자료 본문"""
+    rng = random.Random(seed)
+    parts = []
+    for _ in range(15):
+        parts.append(_paragraphs(rng, sections=1, bullets=2))
+        parts.append(_table(rng, rows=20, cols=6))
+    return "".join(parts)
+
+
+def result_list(count: int, seed: int = 4) -> List[Dict[str, Any]]:
+    """검색 결과 resultList 항목 목록 (본문 크기를 섞어서 생성)"""
+    rng = random.Random(seed)
+    documents = [small_document(seed), small_document(seed + 1), table_heavy_document()]
+    return [
+        {
+            "meta": {
+                "doc_id": f"DOC{index:06d}",
+                "title": f"{rng.choice(SENTENCES)[:20]} {index}",
+                "doc_type": "보도자료",
+                "date": "2025-03-01",
+                "time": "10:00",
+                "ministry": "행정안전부",
+                "department": "정책기획과",
+                "manager": "홍길동",
+                "relevantdepartments": "",
+            },
+            "data": {"text": documents[0] if index % 10 else rng.choice(documents)},
+        }
+        for index in range(count)
+    ]
+
+
+def api_page(count: int) -> Dict[str, Any]:
+    """공공데이터포털 응답 한 페이지"""
+    return {
+        "response": {
+            "header": {"resultCode": "00", "resultMsg": "NORMAL_SERVICE"},
+            "body": {
+                "resultList": result_list(count),
+                "totalCount": count * 10,
+                "pageNo": 1,
+                "numOfRows": count,
+            },
+        }
+    }
+
+
+def items_page(count: int) -> Dict[str, Any]:
+    """items.item 형식의 응답 본문"""
+    return {
+        "item": [
+            {"id": f"ITEM{index}", "title": f"항목 {index}", "content": "내용"}
+            for index in range(count)
+        ]
+    }
@@ -0,0 +1,120 @@
+"""
+LLM 호출 스케줄러 공정성 벤치마크
+긴 백그라운드 분석을 한꺼번에 쌓는 사용자와 짧은 대화형 초안 요청을 반복하는 사용자를
+동시에 실행하여, 단일 FIFO 대기열과 공정 스케줄러(api/llm_scheduler.py)의
+등급별 종단 지연 시간(대기 + 호출)을 비교합니다. OpenAI 호출은 지연만 모사합니다.
+
+사용 예:
+    python -m benchmarks.llm_fairness --concurrency 4 --background-calls 40 \\
+        --interactive-users 5 --interactive-calls 5
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import print_table, sample_latency, summarize_latencies
+from api.llm_scheduler import (
+    FairLLMScheduler,
+    current_llm_priority,
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+)
+from utils.usage_ledger import current_usage_owner
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="LLM 호출 스케줄러 공정성 벤치마크")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 호출 수")
+    parser.add_argument("--reserve", type=int, default=1, help="대화형 예약 슬롯 수")
+    parser.add_argument(
+        "--heavy-users", type=int, default=1, help="백그라운드 분석을 쌓는 사용자 수"
+    )
+    parser.add_argument(
+        "--background-calls", type=int, default=40, help="사용자별 백그라운드 호출 수"
+    )
+    parser.add_argument(
+        "--background-latency", type=float, default=2.0, help="백그라운드 호출 평균(초)"
+    )
+    parser.add_argument(
+        "--interactive-users", type=int, default=5, help="대화형 사용자 수"
+    )
+    parser.add_argument(
+        "--interactive-calls", type=int, default=5, help="사용자별 대화형 호출 수"
+    )
+    parser.add_argument(
+        "--interactive-latency", type=float, default=0.5, help="대화형 호출 평균(초)"
+    )
+    parser.add_argument(
+        "--think-time", type=float, default=0.2, help="대화형 호출 사이 간격(초)"
+    )
+    parser.add_argument("--speedup", type=float, default=10.0, help="시간 배속")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+async def run_scenario(
+    args: argparse.Namespace, fair: bool
+) -> Dict[str, Dict[str, float]]:
+    """한 가지 스케줄링 방식으로 혼합 부하를 실행하고 등급별 지연 시간 요약을 반환합니다."""
+    rng = random.Random(args.seed)
+    scale = 1.0 / args.speedup
+    if fair:
+        scheduler = FairLLMScheduler(
+            max_concurrency=args.concurrency, interactive_reserve=args.reserve
+        )
+    else:
+        # 모든 호출을 같은 흐름으로 보내면 단일 FIFO 대기열과 같음
+        scheduler = FairLLMScheduler(
+            max_concurrency=args.concurrency, interactive_reserve=0
+        )
+    latencies: Dict[str, List[float]] = {
+        PRIORITY_INTERACTIVE: [],
+        PRIORITY_BACKGROUND: [],
+    }
+
+    async def call(priority: str, owner: int, mean: float) -> None:
+        duration = sample_latency("lognormal", mean, mean * 0.4, rng)
+        current_llm_priority.set(priority if fair else PRIORITY_BACKGROUND)
+        current_usage_owner.set(owner if fair else None)
+        start = time.perf_counter()
+        async with scheduler.aslot(cost=duration * 4):
+            await asyncio.sleep(duration * scale)
+        latencies[priority].append((time.perf_counter() - start) / scale)
+
+    async def interactive_user(owner: int) -> None:
+        for _ in range(args.interactive_calls):
+            await asyncio.sleep(args.think_time * scale)
+            await call(PRIORITY_INTERACTIVE, owner, args.interactive_latency)
+
+    tasks = [
+        call(PRIORITY_BACKGROUND, 1000 + user, args.background_latency)
+        for user in range(args.heavy_users)
+        for _ in range(args.background_calls)
+    ]
+    tasks += [interactive_user(user) for user in range(args.interactive_users)]
+    await asyncio.gather(*tasks)
+
+    return {
+        priority: summarize_latencies(values) for priority, values in latencies.items()
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    for fair in (False, True):
+        summary = asyncio.run(run_scenario(args, fair))
+        print_table(
+            "공정 스케줄러 (지연 ms)" if fair else "단일 FIFO 대기열 (지연 ms)",
+            summary,
+        )
+
+
+if __name__ == "__main__":
+    main()
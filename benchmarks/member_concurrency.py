@@ -0,0 +1,236 @@
+"""
+회원 엔드포인트 동시성 벤치마크
+같은 데이터베이스 파일을 공유하는 애플리케이션 워커 프로세스 여러 개를 띄우고
+회원가입 → 로그인 → 프로필 조회를 동시에 반복합니다. 엔진 프로필별로
+단계별 p50/p95/p99 지연 시간, 처리량, 5xx("database is locked" 등) 오류 수를 비교합니다.
+
+사용 예:
+    python -m benchmarks.member_concurrency --workers 4 --flows 200 --concurrency 16
+    python -m benchmarks.member_concurrency --profiles none,sqlite --database-url sqlite:////tmp/m.db
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import threading
+import subprocess
+from collections import defaultdict
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import find_free_port, print_table, run_load, summarize_latencies
+
+PASSWORD = "benchmark-password"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="회원 엔드포인트 동시성 벤치마크")
+    parser.add_argument("--workers", type=int, default=4, help="워커 프로세스 수")
+    parser.add_argument("--flows", type=int, default=100, help="프로필별 흐름 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 사용자 수")
+    parser.add_argument(
+        "--profiles",
+        default="none,auto",
+        help="비교할 DB_PROFILE 목록 (쉼표 구분, none은 기존 기본 설정)",
+    )
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="사용할 데이터베이스 URL (지정하지 않으면 프로필마다 새 SQLite 파일)",
+    )
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def serve(port: int) -> None:
+    """워커 프로세스: 환경 변수 설정을 그대로 사용해 애플리케이션을 실행합니다."""
+    from werkzeug.serving import make_server
+    from app import app
+    from utils.logging import logger
+
+    logger.setLevel(logging.WARNING)
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    # 폼을 직접 전송하므로 CSRF 검사는 끔
+    app.config["WTF_CSRF_ENABLED"] = False
+    make_server("127.0.0.1", port, app, threaded=True).serve_forever()
+
+
+def start_workers(count: int, profile: str, database_url: str, workdir: str):
+    """워커 프로세스를 띄우고 (프로세스 목록, 주소 목록)을 반환합니다."""
+    import requests
+
+    env = {
+        **os.environ,
+        "DB_PROFILE": profile,
+        "DATABASE_URL": database_url,
+        "LLM_CACHE_PATH": os.path.join(workdir, "llm_cache.db"),
+        "RATE_LIMIT_DB_PATH": os.path.join(workdir, "rate_limit.db"),
+        "ARTIFACT_DIR": os.path.join(workdir, "artifacts"),
+    }
+    processes, base_urls = [], []
+    for index in range(count):
+        port = find_free_port()
+        processes.append(
+            subprocess.Popen(
+                [sys.executable, "-m", "benchmarks.member_concurrency", "--serve"]
+                + ["--port", str(port)],
+                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        )
+        base_urls.append(f"http://127.0.0.1:{port}")
+
+        # 테이블 생성이 겹치지 않도록 첫 워커가 준비된 뒤 나머지를 띄움
+        if index == 0 or index == count - 1:
+            for url in base_urls:
+                wait_until_ready(requests, url)
+
+    return processes, base_urls
+
+
+def wait_until_ready(requests, base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(f"{base_url}/member/login", timeout=1).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"워커가 준비되지 않음: {base_url}")
+
+
+class MemberFlow:
+    """회원가입 → 로그인 → 프로필 조회 흐름을 워커에 분산하여 실행합니다."""
+
+    def __init__(self, base_urls: List[str], run_id: str):
+        self.base_urls = base_urls
+        self.run_id = run_id
+        self.timings: Dict[str, List[float]] = defaultdict(list)
+        self.server_errors: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def step(self, name: str, send) -> Any:
+        started = time.perf_counter()
+        response = send()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            if response.status_code >= 500:
+                self.server_errors[name] += 1
+            else:
+                self.timings[name].append(elapsed)
+        if response.status_code >= 400:
+            raise RuntimeError(f"{name}: HTTP {response.status_code}")
+        return response
+
+    def __call__(self, index: int) -> None:
+        import requests
+
+        session = requests.Session()
+        username = f"m{self.run_id}_{index}"
+        # 단계마다 다른 워커로 보내 프로세스 간 쓰기 경합을 만듦
+        urls = [self.base_urls[(index + k) % len(self.base_urls)] for k in range(3)]
+
+        self.step(
+            "register",
+            lambda: session.post(
+                f"{urls[0]}/member/register",
+                data={
+                    "username": username,
+                    "email": f"{username}@example.com",
+                    "full_name": username,
+                    "password": PASSWORD,
+                    "password2": PASSWORD,
+                },
+                allow_redirects=False,
+            ),
+        )
+        response = self.step(
+            "login",
+            lambda: session.post(
+                f"{urls[1]}/member/login",
+                data={"username": username, "password": PASSWORD},
+                allow_redirects=False,
+            ),
+        )
+        if "session" not in session.cookies:
+            raise RuntimeError(f"login: 로그인 실패 (HTTP {response.status_code})")
+        self.step(
+            "profile",
+            lambda: session.get(f"{urls[2]}/member/profile", allow_redirects=False),
+        )
+
+
+def run_profile(profile: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """한 엔진 프로필로 워커를 띄우고 부하를 실행한 결과를 반환합니다."""
+    workdir = tempfile.mkdtemp(prefix="govdraft-bench-")
+    database_url = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    processes, base_urls = start_workers(args.workers, profile, database_url, workdir)
+    try:
+        flow = MemberFlow(base_urls, run_id=f"{profile}{int(time.time())}")
+        load = run_load(flow, args.flows, args.concurrency)
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait(timeout=10)
+
+    return {
+        "succeeded": len(load["latencies"]),
+        "failed": len(load["errors"]),
+        "throughput_flows_per_s": round(load["throughput"], 2),
+        "server_errors": dict(flow.server_errors),
+        "steps_ms": {
+            step: summarize_latencies(values) for step, values in flow.timings.items()
+        },
+        "errors": load["errors"][:5],
+    }
+
+
+def main():
+    args = parse_args()
+    if args.serve:
+        serve(args.port)
+        return
+
+    profiles = [profile.strip() for profile in args.profiles.split(",") if profile]
+    print(
+        f"벤치마크 시작: 워커={args.workers}, 흐름={args.flows}, "
+        f"동시성={args.concurrency}, 프로필={profiles}"
+    )
+    results = {profile: run_profile(profile, args) for profile in profiles}
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    for profile, result in results.items():
+        print_table(f"DB_PROFILE={profile} 지연 시간 (ms)", result["steps_ms"])
+    print_table(
+        "프로필별 요약",
+        {
+            profile: {
+                "flows/s": result["throughput_flows_per_s"],
+                "ok": result["succeeded"],
+                "failed": result["failed"],
+                "5xx": sum(result["server_errors"].values()),
+            }
+            for profile, result in results.items()
+        },
+    )
+    for profile, result in results.items():
+        for error in result["errors"]:
+            print(f"  [{profile}] {error}")
+
+
+if __name__ == "__main__":
+    main()
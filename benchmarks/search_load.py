@@ -0,0 +1,223 @@
+"""
+템플릿 검색 부하 테스트
+공공데이터포털 재생 서버를 띄우고 애플리케이션을 같은 프로세스에서 실행한 뒤,
+여러 사용자가 인기도 분포(Zipf)에 따라 /api/search를 호출하도록 합니다.
+처리량, 검색 캐시 적중률, p50/p95/p99 지연 시간을 보고합니다.
+
+사용 예:
+    python -m benchmarks.search_load --users 20 --requests 1000 --keywords 100
+    python -m benchmarks.search_load --fixtures fixtures/gov --error-rate 0.02 --xml-errors
+"""
+
+import os
+import sys
+import json
+import random
+import logging
+import argparse
+import tempfile
+import threading
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import (
+    InFlightCounter,
+    find_free_port,
+    print_table,
+    run_load,
+    summarize_latencies,
+)
+from benchmarks.gov_replay_server import (
+    add_replay_arguments,
+    replay_settings_from_args,
+    start_replay_server,
+)
+
+SEARCH_WORDS = ["청년", "일자리", "주거", "예산", "디지털", "안전", "복지", "교육"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="템플릿 검색 부하 테스트")
+    parser.add_argument("--users", type=int, default=10, help="동시 사용자 수")
+    parser.add_argument("--requests", type=int, default=500, help="전체 검색 요청 수")
+    parser.add_argument(
+        "--keywords", type=int, default=50, help="검색어 종류 수 (픽스처가 없을 때)"
+    )
+    parser.add_argument("--pages", type=int, default=3, help="검색어별 페이지 수")
+    parser.add_argument(
+        "--zipf", type=float, default=1.1, help="검색어 인기도 분포 지수 (0이면 균등)"
+    )
+    parser.add_argument("--doc-type", default="press", help="문서 유형")
+    parser.add_argument("--manager", default="홍길동", help="보도자료 담당자")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="검색 캐시를 사용하지 않음"
+    )
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument(
+        "--verbose", action="store_true", help="애플리케이션 INFO 로그 출력"
+    )
+    add_replay_arguments(parser)
+    return parser.parse_args()
+
+
+def configure_environment(base_url: str, workdir: str) -> None:
+    """애플리케이션을 불러오기 전에 부하 테스트용 환경 변수를 설정합니다."""
+    os.environ["API_BASE_URL"] = base_url
+    os.environ["PUBLIC_DATA_API_KEY"] = "benchmark-key"
+    os.environ["GOV_API_RECORD_DIR"] = ""
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["LLM_CACHE_PATH"] = os.path.join(workdir, "llm_cache.db")
+    os.environ["RATE_LIMIT_DB_PATH"] = os.path.join(workdir, "rate_limit.db")
+
+
+def build_query_pool(args, fixtures: Dict[str, Dict[str, Any]]) -> List[Dict]:
+    """검색 요청 후보 목록을 만듭니다. 픽스처가 있으면 기록된 요청을 사용합니다."""
+    from config import Config
+
+    if fixtures:
+        doc_types = {
+            config["endpoint"]: doc_type
+            for doc_type, config in Config.DOC_TYPE_CONFIG.items()
+        }
+        pool = []
+        for fixture in fixtures.values():
+            params = fixture["params"]
+            pool.append(
+                {
+                    "keyword": params.get("title", ""),
+                    "page": params.get("pageNo", 1),
+                    "per_page": params.get("numOfRows", 10),
+                    "doc_type": doc_types.get(fixture["endpoint"], args.doc_type),
+                    "manager": params.get("manager", ""),
+                }
+            )
+        return pool
+
+    return [
+        {
+            "keyword": f"{SEARCH_WORDS[index % len(SEARCH_WORDS)]} {index}",
+            "page": page,
+            "per_page": 10,
+            "doc_type": args.doc_type,
+            "manager": args.manager,
+        }
+        for index in range(args.keywords)
+        for page in range(1, args.pages + 1)
+    ]
+
+
+class SearchUser:
+    """인기도 분포에 따라 검색 요청을 보내는 가상 사용자"""
+
+    def __init__(self, base_url: str, pool: List[Dict], args):
+        import requests
+
+        self.base_url = base_url
+        self.pool = pool
+        self.use_cache = "false" if args.no_cache else "true"
+        self.weights = [1 / (rank + 1) ** args.zipf for rank in range(len(pool))]
+        self.rng = random.Random(args.seed)
+        self.rng_lock = threading.Lock()
+        self.local = threading.local()
+        self.requests = requests
+        self.error_responses = 0
+        self.lock = threading.Lock()
+
+    @property
+    def session(self):
+        if not hasattr(self.local, "session"):
+            self.local.session = self.requests.Session()
+        return self.local.session
+
+    def __call__(self, index: int) -> None:
+        with self.rng_lock:
+            query = self.rng.choices(self.pool, weights=self.weights)[0]
+        response = self.session.get(
+            f"{self.base_url}/api/search",
+            params={**query, "use_cache": self.use_cache},
+        )
+        response.raise_for_status()
+        if "error" in response.json():
+            with self.lock:
+                self.error_responses += 1
+
+
+def main():
+    args = parse_args()
+    workdir = tempfile.mkdtemp(prefix="govdraft-search-")
+
+    port = find_free_port()
+    configure_environment(f"http://127.0.0.1:{port}", workdir)
+    replay = start_replay_server(
+        replay_settings_from_args(args), args.fixtures, port=port
+    )
+
+    # 환경 변수 설정 후에 애플리케이션을 불러옴
+    from werkzeug.serving import make_server
+    from app import app
+    from utils.logging import logger
+
+    if not args.verbose:
+        logger.setLevel(logging.WARNING)
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+    counter = InFlightCounter(app.wsgi_app)
+    app.wsgi_app = counter
+    http_server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=http_server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{http_server.server_port}"
+
+    pool = build_query_pool(args, replay.fixtures)
+    user = SearchUser(base_url, pool, args)
+
+    print(
+        f"검색 부하 테스트 시작: 요청={args.requests}, 사용자={args.users}, "
+        f"검색 후보={len(pool)}, 픽스처={len(replay.fixtures)}"
+    )
+    counter.reset()
+    load = run_load(user, args.requests, args.users)
+    http_server.shutdown()
+    replay.shutdown()
+
+    upstream = replay.stats.to_dict()
+    searches = len(load["latencies"])
+    hit_ratio = 1 - upstream["requests"] / searches if searches else 0.0
+    report = {
+        "requests": args.requests,
+        "users": args.users,
+        "succeeded": searches,
+        "failed": len(load["errors"]),
+        "error_responses": user.error_responses,
+        "elapsed_s": round(load["elapsed"], 2),
+        "throughput_rps": round(load["throughput"], 2),
+        "cache_hit_ratio": round(max(0.0, hit_ratio), 3),
+        "latency_ms": summarize_latencies(load["latencies"]),
+        "http_in_flight": {"peak": counter.peak, "mean": round(counter.average(), 2)},
+        "upstream": upstream,
+        "errors": load["errors"][:10],
+    }
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print_table("검색 지연 시간 (ms)", {"/api/search": report["latency_ms"]})
+    print(
+        f"\n성공 {searches} / 실패 {report['failed']} (오류 응답 {user.error_responses}), "
+        f"소요 {report['elapsed_s']}초, 처리량 {report['throughput_rps']} 요청/초"
+    )
+    print(
+        f"캐시 적중률 {report['cache_hit_ratio']:.1%} "
+        f"(포털 호출 {upstream['requests']}회 / 검색 {searches}회)"
+    )
+    print(
+        f"처리 중 HTTP 요청: 최대 {counter.peak}, 평균 {report['http_in_flight']['mean']}"
+    )
+    print(f"재생 서버: {upstream}")
+    for error in report["errors"]:
+        print(f"오류: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,11 +13,53 @@ load_dotenv()
 # 공통 SQLAlchemy 객체 초기화
 db = SQLAlchemy()
 
+# 프로젝트 루트 디렉토리
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def resolve_db_profile(database_uri: str, profile: str) -> str:
+    """
+    데이터베이스 엔진 프로필을 결정합니다.
+    auto이면 URI가 SQLite인지에 따라 sqlite 또는 server를 선택하고,
+    none이면 SQLAlchemy 기본 설정을 그대로 사용합니다.
+    """
+    if profile == "auto":
+        return "sqlite" if database_uri.startswith("sqlite") else "server"
+    return profile
+
+
+def build_engine_options(
+    database_uri: str, profile: str, sqlite_busy_timeout_ms: int = 5000
+) -> dict:
+    """엔진 프로필에 맞는 SQLALCHEMY_ENGINE_OPTIONS를 생성합니다."""
+    profile = resolve_db_profile(database_uri, profile)
+
+    if profile == "sqlite":
+        # 잠금 대기는 드라이버 timeout(초)과 PRAGMA busy_timeout이 함께 처리
+        return {
+            "connect_args": {
+                "timeout": sqlite_busy_timeout_ms / 1000,
+                "check_same_thread": False,
+            },
+        }
+    if profile == "server":
+        return {
+            "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+            "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+            # 방화벽/DB 서버가 끊은 유휴 연결을 재사용하기 전에 확인하고 주기적으로 교체
+            "pool_pre_ping": True,
+            "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        }
+    return {}
+
 
 class Config:
     """애플리케이션 설정 클래스"""
 
     API_BASE_URL = os.getenv("API_BASE_URL", "http://apis.data.go.kr/1741000/publicDoc")
+    # 지정하면 공공데이터포털 응답을 재생용 픽스처로 저장 (인증키 제거)
+    GOV_API_RECORD_DIR = os.getenv("GOV_API_RECORD_DIR", "")
     MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
     RETRY_DELAY = int(os.getenv("RETRY_DELAY", "2"))
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -29,10 +71,147 @@ class Config:
     # OpenAI API 설정
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    # OpenAI 호환 API 주소 (로컬 벤치마크용 가짜 서버 등, 비어 있으면 기본값)
+    OPENAI_API_BASE = os.getenv("OPENAI_API_BASE", "")
+    # 비동기 클라이언트 연결 풀 크기와 호출별 제한 시간(초)
+    OPENAI_POOL_SIZE = int(os.getenv("OPENAI_POOL_SIZE", "20"))
+    OPENAI_CALL_TIMEOUT = float(os.getenv("OPENAI_CALL_TIMEOUT", "120"))
+    OPENAI_BATCH_CONCURRENCY = int(os.getenv("OPENAI_BATCH_CONCURRENCY", "8"))
+
+    # OpenAI 응답 캐시 설정
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "True").lower() == "true"
+    LLM_CACHE_PATH = os.getenv(
+        "LLM_CACHE_PATH", os.path.join(BASE_DIR, "cache", "llm_responses.db")
+    )
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+    LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+    LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+    # 이 값 이하의 temperature 호출은 기본적으로 캐시 사용
+    LLM_CACHE_MAX_TEMPERATURE = float(os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0.3"))
+
+    # OpenAI 호출 속도 제한 설정 (워커 프로세스 간 공유, 0이면 비활성화)
+    OPENAI_RPM_LIMIT = int(os.getenv("OPENAI_RPM_LIMIT", "500"))
+    OPENAI_TPM_LIMIT = int(os.getenv("OPENAI_TPM_LIMIT", "200000"))
+    RATE_LIMIT_HEADROOM = float(os.getenv("RATE_LIMIT_HEADROOM", "0.9"))
+    RATE_LIMIT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", "60"))
+    RATE_LIMIT_DB_PATH = os.getenv(
+        "RATE_LIMIT_DB_PATH", os.path.join(BASE_DIR, "cache", "rate_limit.db")
+    )
+    # max_tokens가 지정되지 않은 호출의 예상 출력 토큰 수
+    OPENAI_DEFAULT_COMPLETION_TOKENS = int(
+        os.getenv("OPENAI_DEFAULT_COMPLETION_TOKENS", "1000")
+    )
+
+    # 템플릿 분석 설정 (map_reduce: 템플릿별 병렬 분석 후 병합, single: 단일 프롬프트)
+    TEMPLATE_ANALYSIS_MODE = os.getenv("TEMPLATE_ANALYSIS_MODE", "map_reduce")
+    TEMPLATE_ANALYSIS_CONCURRENCY = int(os.getenv("TEMPLATE_ANALYSIS_CONCURRENCY", "5"))
+    TEMPLATE_MAX_CHARS = int(os.getenv("TEMPLATE_MAX_CHARS", "12000"))
+
+    # 긴 문서 분석 설정 (청크 단위 병렬 분석)
+    DOCUMENT_CHUNK_CHARS = int(os.getenv("DOCUMENT_CHUNK_CHARS", "6000"))
+    DOCUMENT_ANALYSIS_CONCURRENCY = int(os.getenv("DOCUMENT_ANALYSIS_CONCURRENCY", "4"))
+
+    # 분석/보고서 결과 저장소 설정 (압축: gzip, zstd, none)
+    ARTIFACT_DIR = os.getenv("ARTIFACT_DIR", os.path.join(BASE_DIR, "artifacts"))
+    ARTIFACT_COMPRESSION = os.getenv("ARTIFACT_COMPRESSION", "gzip")
+    ARTIFACT_RETENTION_SECONDS = int(
+        os.getenv("ARTIFACT_RETENTION_SECONDS", str(30 * 24 * 3600))
+    )
+    # 분석 입력 데이터(선택한 템플릿 원문)는 짧게 보관
+    ARTIFACT_INPUT_TTL = int(os.getenv("ARTIFACT_INPUT_TTL", str(24 * 3600)))
+
+    # 토큰 사용량 장부 설정 (메모리 버퍼 후 일괄 저장)
+    USAGE_LEDGER_ENABLED = os.getenv("USAGE_LEDGER_ENABLED", "True").lower() == "true"
+    USAGE_FLUSH_INTERVAL = float(os.getenv("USAGE_FLUSH_INTERVAL", "5"))
+    USAGE_FLUSH_BATCH_SIZE = int(os.getenv("USAGE_FLUSH_BATCH_SIZE", "200"))
+    USAGE_MAX_BUFFER = int(os.getenv("USAGE_MAX_BUFFER", "10000"))
+    # 사용자별 일일 예산 기본값(KRW, 0이면 제한 없음)과 누적 비용 캐시 유지 시간(초)
+    USAGE_DAILY_BUDGET_KRW = float(os.getenv("USAGE_DAILY_BUDGET_KRW", "0"))
+    USAGE_TOTAL_CACHE_TTL = float(os.getenv("USAGE_TOTAL_CACHE_TTL", "30"))
+
+    # LLM 호출 스케줄러 설정 (프로세스별 동시 호출 수, 대화형 예약 슬롯, 등급별 가중치)
+    # 백그라운드 작업 안의 호출은 background, 그 외 요청의 호출은 interactive 등급
+    LLM_SCHEDULER_ENABLED = os.getenv("LLM_SCHEDULER_ENABLED", "True").lower() == "true"
+    LLM_SCHEDULER_CONCURRENCY = int(os.getenv("LLM_SCHEDULER_CONCURRENCY", "10"))
+    LLM_SCHEDULER_INTERACTIVE_RESERVE = int(
+        os.getenv("LLM_SCHEDULER_INTERACTIVE_RESERVE", "2")
+    )
+    LLM_WEIGHT_INTERACTIVE = float(os.getenv("LLM_WEIGHT_INTERACTIVE", "8"))
+    LLM_WEIGHT_BACKGROUND = float(os.getenv("LLM_WEIGHT_BACKGROUND", "1"))
+    LLM_WEIGHT_SPECULATIVE = float(os.getenv("LLM_WEIGHT_SPECULATIVE", "0.25"))
+
+    # 추측 템플릿 분석 설정 (템플릿 선택이 멈추면 미리 분석, 로그인 사용자별 일일 비용 한도(KRW))
+    SPECULATIVE_ANALYSIS_ENABLED = (
+        os.getenv("SPECULATIVE_ANALYSIS_ENABLED", "True").lower() == "true"
+    )
+    SPECULATIVE_DAILY_BUDGET_KRW = float(
+        os.getenv("SPECULATIVE_DAILY_BUDGET_KRW", "50")
+    )
+    SPECULATIVE_SESSION_TTL = int(os.getenv("SPECULATIVE_SESSION_TTL", "3600"))
+
+    # 초안 일괄 생성 설정 (배치별 체크포인트 디렉터리, 동시 생성 수, 최대 행 수)
+    BATCH_DRAFT_DIR = os.getenv(
+        "BATCH_DRAFT_DIR", os.path.join(ARTIFACT_DIR, "batches")
+    )
+    BATCH_DRAFT_CONCURRENCY = int(os.getenv("BATCH_DRAFT_CONCURRENCY", "4"))
+    BATCH_DRAFT_MAX_ROWS = int(os.getenv("BATCH_DRAFT_MAX_ROWS", "200"))
+
+    # 백그라운드 작업 설정
+    JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "4"))
+    JOB_MAX_PENDING = int(os.getenv("JOB_MAX_PENDING", "32"))
+    JOB_RETENTION_SECONDS = int(os.getenv("JOB_RETENTION_SECONDS", "3600"))
+
+    # 로그인 사용자 캐시 설정 (프로세스별, 0이면 비활성화)
+    # 다른 프로세스에서 변경된 계정 상태는 최대 TTL(초)만큼 늦게 반영됩니다.
+    USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
+    USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
+
+    # 문서 구조 추출 설정
+    # 프롬프트에 넣을 템플릿 본문 형식 ("full": 원문, "skeleton": 제목/글머리표/표 요약 골격)
+    TEMPLATE_PROMPT_FORMAT = os.getenv("TEMPLATE_PROMPT_FORMAT", "full")
+    DOC_SKELETON_MAX_TEXT = int(os.getenv("DOC_SKELETON_MAX_TEXT", "60"))
+    DOC_STRUCTURE_CACHE_SIZE = int(os.getenv("DOC_STRUCTURE_CACHE_SIZE", "512"))
+
+    # 유사 템플릿 추천 설정 (제목 + 본문의 문자 n-gram TF-IDF)
+    SIMILAR_NGRAM_MIN = int(os.getenv("SIMILAR_NGRAM_MIN", "2"))
+    SIMILAR_NGRAM_MAX = int(os.getenv("SIMILAR_NGRAM_MAX", "3"))
+    SIMILAR_MAX_CHARS = int(os.getenv("SIMILAR_MAX_CHARS", "5000"))
+    SIMILAR_TOP_K = int(os.getenv("SIMILAR_TOP_K", "5"))
+
+    # 유사 중복 문서 탐지 설정 (MinHash/LSH)
+    NEAR_DUP_ENABLED = os.getenv("NEAR_DUP_ENABLED", "True").lower() == "true"
+    NEAR_DUP_THRESHOLD = float(os.getenv("NEAR_DUP_THRESHOLD", "0.8"))
+    NEAR_DUP_NUM_PERM = int(os.getenv("NEAR_DUP_NUM_PERM", "128"))
+    NEAR_DUP_BANDS = int(os.getenv("NEAR_DUP_BANDS", "32"))
+    NEAR_DUP_SHINGLE_SIZE = int(os.getenv("NEAR_DUP_SHINGLE_SIZE", "5"))
+    # 선택한 템플릿 중 유사 중복을 프롬프트에서 제외할지 여부 (False면 경고만 반환)
+    NEAR_DUP_DROP_TEMPLATES = (
+        os.getenv("NEAR_DUP_DROP_TEMPLATES", "True").lower() == "true"
+    )
+
+    # 비밀번호 해시 설정 (방식을 바꾸면 기존 해시는 다음 로그인 때 새 방식으로 갱신)
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt")
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "16"))
+
+    # 마지막 로그인 시각 지연 기록 설정 (로그인 요청에서 DB 쓰기를 제외하고 일괄 저장)
+    LAST_LOGIN_WRITE_BEHIND = (
+        os.getenv("LAST_LOGIN_WRITE_BEHIND", "True").lower() == "true"
+    )
+    LAST_LOGIN_FLUSH_INTERVAL = float(os.getenv("LAST_LOGIN_FLUSH_INTERVAL", "5"))
+    LAST_LOGIN_MAX_PENDING = int(os.getenv("LAST_LOGIN_MAX_PENDING", "1000"))
 
     # 데이터베이스 설정
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "sqlite:///govdraft.db")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # 엔진 프로필 (auto: URI에 따라 선택, sqlite: WAL/busy timeout/mmap,
+    # server: 연결 풀/pre-ping/recycle, none: SQLAlchemy 기본값)
+    DB_PROFILE = os.getenv("DB_PROFILE", "auto")
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLALCHEMY_ENGINE_OPTIONS = build_engine_options(
+        SQLALCHEMY_DATABASE_URI, DB_PROFILE, SQLITE_BUSY_TIMEOUT_MS
+    )
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-key-change-in-production")
 
     # 문서 유형별 엔드포인트와 필수 파라미터 정의
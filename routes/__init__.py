@@ -4,6 +4,8 @@
 
 from routes.main import main_bp
 from routes.drafts import drafts_bp
+from routes.jobs import jobs_bp
+from routes.usage import usage_bp
 from routes.member.routes import member_bp
 
 
@@ -11,4 +13,6 @@ def register_routes(app):
     """모든 블루프린트를 Flask 앱에 등록합니다."""
     app.register_blueprint(main_bp)
     app.register_blueprint(drafts_bp, url_prefix="/api/drafts")
+    app.register_blueprint(jobs_bp, url_prefix="/api/jobs")
+    app.register_blueprint(usage_bp, url_prefix="/api/usage")
     app.register_blueprint(member_bp, url_prefix="/member")
@@ -3,37 +3,260 @@
 AI 보고서 생성 관련 API 엔드포인트를 처리합니다.
 """
 
+import io
 import time
+import contextlib
+import uuid
 import datetime
-import os
 import json
-from flask import Blueprint, request, jsonify, current_app
-from routes.main import get_template_cache
+from flask_login import login_required, current_user
+from flask import (
+    Blueprint,
+    Response,
+    request,
+    session,
+    g,
+    jsonify,
+    current_app,
+    stream_with_context,
+    send_file,
+    url_for,
+)
+from routes.main import get_template_cache, iter_cached_items
 from utils.token_utils import calculate_token_cost
 from utils.logging import logger
+from utils.job_queue import job_manager, JobQueueFullError
+from utils.artifact_store import artifact_store
+from utils.near_duplicates import near_duplicate_detector
+from utils.usage_ledger import usage_ledger, current_usage_owner, BudgetExceededError
+from utils.speculation import speculation_manager
+from config import Config, db
+from routes.member import DraftRecord
+from routes.jobs import get_job_owner, accepted_response
+from api.batch_drafts import (
+    batch_draft_store,
+    run_batch,
+    parse_rows_csv,
+    normalize_rows,
+)
 from api.openai_api import (
     analyze_templates as template_analyzer,
-    analyze_templates_from_json,  # 함수 이름 변경
+    analyze_template_records,
+    estimate_template_analysis_cost,
     generate_draft as generate_draft_api,
+    generate_draft_stream,
+    is_complete_template_analysis,
+    template_analysis_memo_key,
+    template_set_hash,
 )
+from api.llm_scheduler import PRIORITY_SPECULATIVE
+from api.rate_limiter import RateLimitWaitTimeout
 from slugify import slugify
 
 # 블루프린트 생성
 drafts_bp = Blueprint("drafts", __name__)
 
-# 결과 파일 저장 경로 설정
-RESULT_DIR = os.path.join(
-    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "result"
-)
 
-# 결과 디렉토리가 없으면 생성
-if not os.path.exists(RESULT_DIR):
-    os.makedirs(RESULT_DIR)
+@drafts_bp.before_request
+def _bind_usage_owner():
+    """이 요청과 요청에서 제출한 작업의 OpenAI 사용량을 현재 사용자에게 기록합니다."""
+    g.usage_owner_token = current_usage_owner.set(get_job_owner())
+
+
+@drafts_bp.teardown_request
+def _unbind_usage_owner(exc=None):
+    """재사용되는 작업자 스레드에 이전 요청의 사용자가 남지 않도록 되돌립니다."""
+    token = g.pop("usage_owner_token", None)
+    if token is not None:
+        current_usage_owner.reset(token)
+
+
+def _artifact_response(meta):
+    """저장된 결과의 ID, 파일명, 다운로드 URL, 크기(KB)를 응답 필드로 반환합니다."""
+    return {
+        "artifact_id": meta["id"],
+        "resultFile": meta["name"],
+        "download_url": url_for(
+            "drafts.serve_analysis_file", artifact_id=meta["id"], download=1
+        ),
+        "size_kb": round(meta["size"] / 1024, 2),
+    }
+
+
+def _record_history(owner, kind, title, body, template_ids, meta, token_info=None):
+    """로그인 사용자의 보고서/분석 기록을 저장합니다. 실패해도 결과 응답은 계속합니다."""
+    if owner is None:
+        return
+    try:
+        DraftRecord.create(
+            owner,
+            kind,
+            title,
+            body,
+            template_ids=template_ids,
+            token_info=token_info,
+            artifact_id=meta["id"],
+        )
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"기록 저장 실패: 사용자={owner}, 종류={kind}, 오류={str(e)}")
+
+
+def _save_generated_report(result, token_info, owner, template_ids):
+    """생성된 보고서를 결과 저장소와 사용자 기록에 저장하고 응답 필드를 반환합니다."""
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    meta = artifact_store.put(
+        "draft",
+        result,
+        owner=owner,
+        template_ids=template_ids,
+        name=f"generated_report_{timestamp}.json",
+    )
+    _record_history(
+        owner, "draft", result.get("title"), result, template_ids, meta, token_info
+    )
+    return _artifact_response(meta)
+
+
+def _run_content_analysis(job, input_artifact_id, owner, on_token_info=None):
+    """
+    백그라운드 작업: 템플릿 내용을 분석하고 결과를 저장소에 저장합니다.
+    on_token_info가 있으면 분석에 사용한 토큰/비용 정보를 전달합니다.
+    """
+    job.update_progress(5, "템플릿 데이터 로드 중")
+    input_meta = artifact_store.get(input_artifact_id)
+    templates = artifact_store.load(input_artifact_id)
+    if templates is None:
+        raise RuntimeError("템플릿 데이터가 만료되었습니다. 다시 분석해주세요.")
+
+    analysis = analyze_template_records(
+        templates,
+        progress_callback=job.update_progress,
+        token_info_callback=on_token_info,
+    )
+    if analysis is None:
+        raise RuntimeError("템플릿 내용 분석에 실패했습니다.")
+
+    job.update_progress(90, "분석 결과 저장 중")
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    set_hash = artifact_store.memo_key_of(input_artifact_id)
+    # 일시적인 실패(속도 제한, 시간 초과 등)가 섞인 결과는 다음 요청에서 다시 분석하도록 메모하지 않음
+    memoize = set_hash and is_complete_template_analysis(analysis)
+    if set_hash and not memoize:
+        logger.warning(
+            f"템플릿 분석 결과에 실패가 있어 메모하지 않음: 입력 ID={input_artifact_id}"
+        )
+    meta = artifact_store.put(
+        "template_analysis",
+        analysis,
+        owner=owner,
+        template_ids=input_meta["template_ids"] if input_meta else None,
+        name=f"template_analysis_{timestamp}.json",
+        memo_key=template_analysis_memo_key(set_hash) if memoize else None,
+    )
+
+    # 승격되지 않은 추측 분석은 사용자가 요청한 분석이 아니므로 기록하지 않음
+    if job.priority != PRIORITY_SPECULATIVE:
+        _record_history(
+            owner,
+            "analysis",
+            f"템플릿 {len(templates)}개 분석",
+            analysis,
+            meta["template_ids"],
+            meta,
+        )
+
+    logger.info(f"템플릿 내용 분석 완료: 결과 ID={meta['id']}")
+    return _content_analysis_result(input_artifact_id, meta, analysis)
+
+
+def _content_analysis_result(input_artifact_id, meta, analysis):
+    """템플릿 내용 분석 작업 결과 형식으로 응답 필드를 구성합니다."""
+    return {
+        "analyzed_at": datetime.datetime.fromtimestamp(meta["created_at"]).isoformat(),
+        "input_artifact_id": input_artifact_id,
+        "artifact_id": meta["id"],
+        "output_file": meta["name"],
+        "analysis": analysis,
+    }
+
+
+def _sse_event(event, data):
+    """Server-Sent Events 형식의 메시지를 생성합니다."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _dedupe_templates(templates):
+    """
+    프롬프트를 만들기 전에 유사 중복 템플릿을 찾습니다.
+    NEAR_DUP_DROP_TEMPLATES가 켜져 있으면 제외하고, 아니면 경고 목록만 반환합니다.
+
+    Returns:
+        (프롬프트에 넣을 템플릿 목록, 유사 중복 템플릿 정보 목록)
+    """
+    if near_duplicate_detector is None or len(templates) < 2:
+        return templates, []
+    kept, redundant = near_duplicate_detector.drop_redundant(templates)
+    return (kept if Config.NEAR_DUP_DROP_TEMPLATES else templates), redundant
+
+
+def _store_template_input(selected_templates, template_ids, owner, set_hash):
+    """선택한 템플릿을 분석 입력 데이터(JSONL 항목)로 정제하여 결과 저장소에 저장합니다."""
+    jsonl_items = [
+        {
+            "제목": template.get("title", ""),
+            "발행 부처": template.get("publisher", ""),
+            "개요": template.get("summary", ""),
+            "문서 구조": template.get("structure", ""),
+            "내용": template.get("content", ""),
+        }
+        for template in selected_templates
+    ]
+
+    # 분석 입력 데이터는 내용 분석 작업에서만 사용하므로 짧게 보관
+    return artifact_store.put(
+        "template_input",
+        jsonl_items,
+        owner=owner,
+        template_ids=template_ids,
+        ttl_seconds=Config.ARTIFACT_INPUT_TTL,
+        memo_key=set_hash,
+    )
+
+
+def _stream_draft_events(
+    user_input_dict, selected_templates, owner, redundant_templates=None
+):
+    """초안 생성 스트림을 SSE 이벤트로 변환하고, 완료 시 결과를 저장합니다."""
+    template_ids = [template.get("id") for template in selected_templates]
+    # 클라이언트 연결이 끊기면 생성 스트림을 바로 닫아 사용량을 기록
+    with contextlib.closing(
+        generate_draft_stream(user_input_dict, selected_templates)
+    ) as events:
+        for event in events:
+            if event["type"] == "delta":
+                yield _sse_event("delta", {"content": event["content"]})
+            elif event["type"] == "done":
+                artifact = _save_generated_report(
+                    event["report"], event["token_info"], owner, template_ids
+                )
+                yield _sse_event(
+                    "done",
+                    {
+                        "result": "success",
+                        "report": event["report"],
+                        "token_info": event["token_info"],
+                        "redundant_templates": redundant_templates or [],
+                        **artifact,
+                    },
+                )
+            else:
+                yield _sse_event("error", {"error": event["error"]})
 
 
 @drafts_bp.route("/analyze-templates", methods=["POST"])
 def analyze_templates():
-    """선택한 템플릿을 분석하여 JSONL 형식으로 저장하는 API"""
+    """선택한 템플릿의 분석 입력 데이터를 결과 저장소에 저장하는 API"""
     try:
         # 요청 본문 검증
         if not request.is_json:
@@ -78,13 +301,11 @@ def analyze_templates():
             )
 
         # 캐시된 데이터에서 템플릿 정보 찾기
-        for key, data in template_cache.items():
-            if "items" in data:
-                for item in data["items"]:
-                    if item.get("id") in template_ids and item.get("id") not in [
-                        t.get("id") for t in selected_templates
-                    ]:
-                        selected_templates.append(item)
+        for item in iter_cached_items():
+            if item.get("id") in template_ids and item.get("id") not in [
+                t.get("id") for t in selected_templates
+            ]:
+                selected_templates.append(item)
 
         # 모든 템플릿을 찾았는지 확인
         if len(selected_templates) == len(template_ids):
@@ -112,50 +333,53 @@ def analyze_templates():
                 404,
             )
 
-        # 템플릿 데이터 정제 및 JSONL 저장
-        jsonl_items = []
-
-        for template in selected_templates:
-            # 필요한 필드 추출
-            title = template.get("title", "")
-            publisher = template.get("publisher", "")
-            summary = template.get("summary", "")
-            structure = template.get("structure", "")
-            content = template.get("content", "")
-
-            # JSONL 형식으로 저장할 데이터 형식 구성
-            jsonl_item = {
-                "제목": title,
-                "발행 부처": publisher,
-                "개요": summary,
-                "문서 구조": structure,
-                "내용": content,
-            }
-
-            jsonl_items.append(jsonl_item)
-
-        # 타임스탬프를 이용하여 파일명 생성
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        json_filename = os.path.join(
-            RESULT_DIR, f"template_analysis_{timestamp}.json"  # 확장자 변경
-        )
+        # 거의 같은 템플릿은 프롬프트에 한 번만 넣음
+        selected_templates, redundant_templates = _dedupe_templates(selected_templates)
 
-        # JSON 파일 저장
-        with open(json_filename, "w", encoding="utf-8") as f:
-            json.dump(
-                jsonl_items, f, ensure_ascii=False, indent=2
-            )  # json.dump 사용 및 들여쓰기 추가
+        # 같은 템플릿 묶음(ID + 내용)의 입력 데이터가 있으면 그대로 재사용
+        owner = get_job_owner()
+        set_hash = template_set_hash(selected_templates)
+        memo_meta = artifact_store.find_memo("template_input", set_hash, owner)
+        if memo_meta is not None:
+            analysis_meta = artifact_store.find_memo(
+                "template_analysis", template_analysis_memo_key(set_hash), owner
+            )
+            logger.info(
+                f"템플릿 분석 메모 적중: 입력 ID={memo_meta['id']}, "
+                f"분석 결과 ID={analysis_meta['id'] if analysis_meta else None}"
+            )
+            return jsonify(
+                {
+                    "analyzed_at": datetime.datetime.fromtimestamp(
+                        memo_meta["created_at"]
+                    ).isoformat(),
+                    "template_count": len(selected_templates),
+                    "template_ids": template_ids,
+                    "artifact_id": memo_meta["id"],
+                    "analysis_artifact_id": (
+                        analysis_meta["id"] if analysis_meta else None
+                    ),
+                    "redundant_templates": redundant_templates,
+                    "cached": True,
+                    "status": "success",
+                }
+            )
+
+        meta = _store_template_input(selected_templates, template_ids, owner, set_hash)
 
         logger.info(
-            f"템플릿 분석 완료: 파일={json_filename}, 템플릿 수={len(jsonl_items)}"  # 로그 메시지 파일명 변수 변경
+            f"템플릿 분석 완료: 입력 ID={meta['id']}, 템플릿 수={len(selected_templates)}"
         )
 
         # 응답 생성
         response = {
             "analyzed_at": datetime.datetime.now().isoformat(),
-            "template_count": len(jsonl_items),
+            "template_count": len(selected_templates),
             "template_ids": template_ids,
-            "output_file": json_filename,  # 응답의 파일명 변수 변경
+            "artifact_id": meta["id"],
+            "analysis_artifact_id": None,
+            "redundant_templates": redundant_templates,
+            "cached": False,
             "status": "success",
         }
 
@@ -171,7 +395,7 @@ def analyze_templates():
 
 @drafts_bp.route("/analyze-content", methods=["POST"])
 def analyze_content():
-    """템플릿 내용을 NLP 기법으로 분석하는 API"""
+    """템플릿 내용 분석 작업을 제출하는 API (202 Accepted, 작업 ID 반환)"""
     try:
         # 요청 본문 검증
         if not request.is_json:
@@ -184,57 +408,88 @@ def analyze_content():
             logger.error("API 요청 본문이 비어 있음")
             return jsonify({"error": "요청 본문이 비어 있습니다."}), 400
 
-        jsonl_file = data.get("jsonl_file", "")
+        artifact_id = data.get("artifact_id", "")
 
-        logger.info(f"템플릿 내용 분석 요청: JSONL 파일={jsonl_file}")
+        logger.info(f"템플릿 내용 분석 요청: 입력 ID={artifact_id}")
 
         # 필수 데이터 검증
-        if not jsonl_file:
-            logger.error("JSONL 파일 경로가 제공되지 않음")
-            return jsonify({"error": "JSONL 파일 경로가 필요합니다."}), 400
-
-        # 파일 존재 확인
-        if not os.path.exists(jsonl_file):
-            logger.error(f"JSONL 파일을 찾을 수 없음: {jsonl_file}")
+        if not artifact_id:
+            logger.error("분석 입력 ID가 제공되지 않음")
+            return jsonify({"error": "분석 입력 ID(artifact_id)가 필요합니다."}), 400
+
+        # 입력 데이터 존재 및 소유자 확인
+        owner = get_job_owner()
+        input_meta = artifact_store.get(artifact_id)
+        if input_meta is None or input_meta["owner"] != owner:
+            logger.error(f"분석 입력 데이터를 찾을 수 없음: {artifact_id}")
             return (
-                jsonify({"error": f"JSONL 파일을 찾을 수 없습니다: {jsonl_file}"}),
+                jsonify(
+                    {"error": f"분석 입력 데이터를 찾을 수 없습니다: {artifact_id}"}
+                ),
                 404,
             )
 
-        # analysis 디렉토리 확인 및 생성
-        analysis_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "analysis"
-        )
-        if not os.path.exists(analysis_dir):
-            os.makedirs(analysis_dir)
-
-        # 타임스탬프를 이용하여 파일명 생성
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_filename = f"template_analysis_{timestamp}.json"
-        output_file = os.path.join(analysis_dir, output_filename)
-
-        # 템플릿 내용 분석 (수정된 함수 호출)
-        success = analyze_templates_from_json(jsonl_file, output_file)
-
-        if not success:
-            logger.error("템플릿 내용 분석 실패")
-            return jsonify({"error": "템플릿 내용 분석에 실패했습니다."}), 500
-
-        # 응답 생성 - 파일 이름만 반환하여 경로 문제 방지
-        response = {
-            "analyzed_at": datetime.datetime.now().isoformat(),
-            "jsonl_file": jsonl_file,
-            "output_file": output_filename,  # 파일 이름만 반환 (경로 제외)
-            "status": "success",
-        }
+        # 같은 템플릿 묶음을 같은 설정으로 분석한 결과가 있으면 작업 없이 바로 반환
+        set_hash = artifact_store.memo_key_of(artifact_id)
+        if set_hash:
+            analysis_meta = artifact_store.find_memo(
+                "template_analysis", template_analysis_memo_key(set_hash), owner
+            )
+            analysis = (
+                artifact_store.load(analysis_meta["id"]) if analysis_meta else None
+            )
+            if analysis is not None:
+                logger.info(
+                    f"템플릿 내용 분석 메모 적중: 입력 ID={artifact_id}, "
+                    f"결과 ID={analysis_meta['id']}"
+                )
+                return jsonify(
+                    {
+                        "status": "succeeded",
+                        "cached": True,
+                        "result": _content_analysis_result(
+                            artifact_id, analysis_meta, analysis
+                        ),
+                    }
+                )
+
+        # 같은 템플릿 묶음을 미리 분석 중인 추측 작업이 있으면 넘겨받음
+        if speculation_manager is not None and set_hash:
+            job = speculation_manager.promote(owner, set_hash)
+            if job is not None:
+                logger.info(
+                    f"추측 분석 작업으로 응답: 작업 ID={job.id}, 입력 ID={artifact_id}"
+                )
+                return accepted_response(
+                    job, input_artifact_id=artifact_id, speculative=True
+                )
+
+        # 템플릿 내용 분석은 백그라운드 작업으로 실행하고 즉시 202 반환
+        try:
+            job = job_manager.submit(
+                "template_content_analysis",
+                _run_content_analysis,
+                artifact_id,
+                owner,
+                owner=owner,
+            )
+        except JobQueueFullError:
+            logger.warning("작업 대기열이 가득 차 템플릿 내용 분석 요청 거부")
+            return (
+                jsonify({"error": "분석 요청이 많습니다. 잠시 후 다시 시도해주세요."}),
+                503,
+                {"Retry-After": "10"},
+            )
 
-        logger.info(f"템플릿 내용 분석 완료: 결과 파일={output_file}")
-        return jsonify(response)
+        logger.info(
+            f"템플릿 내용 분석 작업 제출: 작업 ID={job.id}, 입력 ID={artifact_id}"
+        )
+        return accepted_response(job, input_artifact_id=artifact_id)
 
     except Exception as e:
         # 오류 발생 시 함수명과 입력 파일 경로 로깅, 스택 트레이스 포함
         logger.exception(
-            f"analyze_content 함수 오류 발생: jsonl_file={data.get('jsonl_file', 'N/A')}"
+            f"analyze_content 함수 오류 발생: artifact_id={data.get('artifact_id', 'N/A')}"
         )
         return (
             jsonify({"error": f"템플릿 내용 분석 중 오류가 발생했습니다: {str(e)}"}),
@@ -242,6 +497,107 @@ def analyze_content():
         )
 
 
+@drafts_bp.route("/speculate", methods=["POST"])
+@login_required
+def speculate_analysis():
+    """
+    템플릿 선택이 멈추면 프론트엔드가 호출하는 추측 분석 API
+    선택한 템플릿의 내용 분석을 남는 처리 용량으로 미리 실행하여 결과를 메모에 저장하므로,
+    사용자가 분석을 요청하면 기존 분석 API가 결과를 바로 반환합니다.
+    선택이 바뀌면 이전 선택의 추측 작업은 취소됩니다. (template_ids가 비어 있으면 취소만 수행)
+    비용 한도를 사용자별로 적용하기 위해 로그인 사용자만 사용할 수 있습니다.
+    """
+    if speculation_manager is None:
+        return jsonify({"status": "disabled"})
+
+    data = request.get_json(silent=True) or {}
+    template_ids = list(dict.fromkeys(data.get("template_ids") or []))[:5]
+    owner = get_job_owner()
+    session_key = session.setdefault("speculation_id", uuid.uuid4().hex)
+
+    if not template_ids:
+        speculation_manager.abandon(session_key, owner)
+        return jsonify({"status": "idle"})
+
+    cached_items = {}
+    for item in iter_cached_items():
+        cached_items.setdefault(item.get("id"), item)
+    if any(tid not in cached_items for tid in template_ids):
+        speculation_manager.abandon(session_key, owner)
+        return (
+            jsonify(
+                {
+                    "error": "일부 템플릿 정보를 찾을 수 없습니다. 검색을 다시 실행해주세요."
+                }
+            ),
+            404,
+        )
+
+    selected_templates, _ = _dedupe_templates(
+        [cached_items[tid] for tid in template_ids]
+    )
+    set_hash = template_set_hash(selected_templates)
+
+    # 이미 분석한 묶음이면 실행할 필요 없음
+    if artifact_store.find_memo(
+        "template_analysis", template_analysis_memo_key(set_hash), owner
+    ):
+        return jsonify({"status": "ready"})
+
+    job = speculation_manager.running(session_key, owner, set_hash)
+    if job is not None:
+        return jsonify({"status": "running", "job_id": job.id})
+
+    # 선택이 바뀌었으므로 이전 선택의 추측 작업은 버림
+    speculation_manager.abandon(session_key, owner)
+
+    # 사용자가 요청한 작업이 기다리지 않도록 작업자가 남을 때만 실행
+    stats = job_manager.stats()
+    if stats["queued"] or stats["running"] >= max(1, stats["max_workers"] - 1):
+        return jsonify({"status": "skipped", "reason": "busy"})
+
+    # 예상 비용을 사용자의 오늘 한도에서 미리 차감 (취소되거나 실패해도 돌려주지 않음)
+    estimated_cost = estimate_template_analysis_cost(selected_templates)
+    if not speculation_manager.reserve(owner, estimated_cost):
+        logger.info(
+            f"추측 분석 생략 (사용자 일일 비용 한도): 사용자={owner}, "
+            f"예상 비용={estimated_cost:.2f}원"
+        )
+        return jsonify({"status": "skipped", "reason": "budget"})
+
+    input_meta = artifact_store.find_memo(
+        "template_input", set_hash, owner
+    ) or _store_template_input(selected_templates, template_ids, owner, set_hash)
+
+    try:
+        job = job_manager.submit(
+            "speculative_template_analysis",
+            _run_content_analysis,
+            input_meta["id"],
+            owner,
+            on_token_info=lambda info: speculation_manager.settle(
+                owner, estimated_cost, info.get("cost_krw", 0)
+            ),
+            owner=owner,
+            priority=PRIORITY_SPECULATIVE,
+        )
+    except JobQueueFullError:
+        speculation_manager.settle(owner, estimated_cost, 0)
+        return jsonify({"status": "skipped", "reason": "busy"})
+
+    speculation_manager.start(session_key, owner, set_hash, job)
+    logger.info(
+        f"추측 분석 작업 제출: 작업 ID={job.id}, 템플릿 ID={template_ids}, "
+        f"예상 비용={estimated_cost:.2f}원"
+    )
+    return accepted_response(
+        job,
+        input_artifact_id=input_meta["id"],
+        estimated_cost_krw=round(estimated_cost, 2),
+        speculative=True,
+    )
+
+
 @drafts_bp.route("/generate", methods=["POST"])
 def generate_draft():
     """선택한 템플릿을 기반으로 AI 보고서 생성 API"""
@@ -259,6 +615,8 @@ def generate_draft():
 
         template_ids = data.get("template_ids", [])
         user_input = data.get("user_input", "")
+        use_cache = bool(data.get("use_cache", False))
+        stream = bool(data.get("stream", False))
 
         logger.info(
             f"보고서 생성 요청: 템플릿 ID={template_ids}, 입력 길이={len(user_input)}자"
@@ -289,13 +647,11 @@ def generate_draft():
             )
 
         # 캐시된 데이터에서 템플릿 정보 찾기
-        for key, data in template_cache.items():
-            if "items" in data:
-                for item in data["items"]:
-                    if item.get("id") in template_ids and item.get("id") not in [
-                        t.get("id") for t in selected_templates
-                    ]:
-                        selected_templates.append(item)
+        for item in iter_cached_items():
+            if item.get("id") in template_ids and item.get("id") not in [
+                t.get("id") for t in selected_templates
+            ]:
+                selected_templates.append(item)
 
         # 모든 템플릿을 찾았는지 확인
         if len(selected_templates) == len(template_ids):
@@ -323,43 +679,63 @@ def generate_draft():
                 404,
             )
 
+        # 거의 같은 템플릿은 프롬프트에 한 번만 넣음
+        selected_templates, redundant_templates = _dedupe_templates(selected_templates)
+
         # 사용자 입력 데이터 형식화
         user_input_dict = {"title": user_input}
 
+        # 스트리밍 모드: 생성되는 토큰을 SSE로 전달
+        if stream:
+            # 스트림을 연 뒤에는 상태 코드를 바꿀 수 없으므로 예산은 미리 확인 (초과 시 429)
+            if usage_ledger:
+                usage_ledger.check_budget(get_job_owner())
+            return Response(
+                stream_with_context(
+                    _stream_draft_events(
+                        user_input_dict,
+                        selected_templates,
+                        get_job_owner(),
+                        redundant_templates,
+                    )
+                ),
+                mimetype="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
         # api/openai_api.py에 있는 generate_draft 함수 호출
-        result, token_info = generate_draft_api(user_input_dict, selected_templates)
+        result, token_info = generate_draft_api(
+            user_input_dict, selected_templates, use_cache=use_cache
+        )
+
+        # 결과 저장
+        artifact = _save_generated_report(
+            result, token_info, get_job_owner(), template_ids
+        )
 
-        # 응답 구성
+        # 응답 구성 - 결과 ID, 다운로드 URL, 크기 포함
         response = {
             "result": "success",
             "report": result,
             "token_info": token_info,
-            "resultFile": f"generated_report_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            "redundant_templates": redundant_templates,
+            **artifact,
         }
 
-        # analysis 디렉토리 확인 및 생성
-        analysis_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "analysis"
-        )
-        if not os.path.exists(analysis_dir):
-            os.makedirs(analysis_dir)
-
-        # 결과 저장
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        result_filename = f"generated_report_{timestamp}.json"
-        result_path = os.path.join(analysis_dir, result_filename)
-
-        with open(result_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
-
-        # 파일 크기 계산 (KB)
-        file_size_kb = round(os.path.getsize(result_path) / 1024, 2)
+        return jsonify(response)
 
-        # 응답 업데이트 - 파일명만 포함하고 파일 크기 추가
-        response["resultFile"] = result_filename
-        response["size_kb"] = file_size_kb
+    except BudgetExceededError as e:
+        return jsonify({"error": str(e)}), 429
 
-        return jsonify(response)
+    except RateLimitWaitTimeout:
+        logger.warning("OpenAI 호출 용량을 확보하지 못해 보고서 생성 요청 거부")
+        return (
+            jsonify(
+                {"error": "요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요."}
+            ),
+            503,
+            {"Retry-After": "10"},
+        )
 
     except Exception as e:
         # 오류 발생 시 함수명, 입력값(ID, 입력 길이) 로깅, 스택 트레이스 포함
@@ -369,34 +745,260 @@ def generate_draft():
         return jsonify({"error": f"보고서 생성 중 오류가 발생했습니다: {str(e)}"}), 500
 
 
-# 분석 결과 파일 서빙 라우트 추가
-@drafts_bp.route("/analysis/<filename>")
-def serve_analysis_file(filename):
-    """분석 결과 파일을 제공하는 API"""
+def _run_draft_batch(job, batch_id):
+    """백그라운드 작업: 초안 배치의 남은 행을 생성합니다. (취소 시 완료된 행은 유지)"""
+    job.update_progress(1, "초안 배치 시작")
+    return run_batch(batch_id, progress_callback=job.update_progress)
+
+
+def _batch_links(batch_id):
+    """배치 상태/이어서 실행/결과 ZIP URL을 반환합니다."""
+    return {
+        "batch_url": url_for("drafts.get_draft_batch", batch_id=batch_id),
+        "resume_url": url_for("drafts.resume_draft_batch", batch_id=batch_id),
+        "archive_url": url_for("drafts.download_draft_batch", batch_id=batch_id),
+    }
+
+
+def _submit_draft_batch(batch_id, owner):
+    """초안 배치 작업을 제출하고 202 응답을 반환합니다."""
+    try:
+        job = job_manager.submit("draft_batch", _run_draft_batch, batch_id, owner=owner)
+    except JobQueueFullError:
+        logger.warning("작업 대기열이 가득 차 초안 배치 요청 거부")
+        return (
+            jsonify({"error": "생성 요청이 많습니다. 잠시 후 다시 시도해주세요."}),
+            503,
+            {"Retry-After": "10"},
+        )
+
+    logger.info(f"초안 배치 작업 제출: 작업 ID={job.id}, 배치 ID={batch_id}")
+    return accepted_response(job, batch_id=batch_id, **_batch_links(batch_id))
+
+
+def _find_owned_batch(batch_id):
+    """배치 설정을 조회하고 소유자를 확인합니다. 권한이 없으면 None을 반환합니다."""
+    manifest = batch_draft_store.get(batch_id)
+    if manifest is None or manifest["owner"] != get_job_owner():
+        return None
+    return manifest
+
+
+@drafts_bp.route("/batch", methods=["POST"])
+def create_draft_batch():
+    """
+    여러 사용자 입력의 초안을 같은 템플릿으로 일괄 생성하는 작업을 제출하는 API
+    JSON: {"template_ids": [...], "rows": ["입력", {"user_input": ..., ...}], "use_cache": false}
+    또는 multipart: file(CSV, user_input 열), template_ids(쉼표 구분)
+    """
+    try:
+        if request.is_json:
+            data = request.get_json() or {}
+            template_ids = data.get("template_ids", [])
+            rows = normalize_rows(data.get("rows", []))
+            use_cache = bool(data.get("use_cache", False))
+        else:
+            upload = request.files.get("file")
+            template_ids = [
+                tid.strip()
+                for tid in request.form.get("template_ids", "").split(",")
+                if tid.strip()
+            ]
+            rows = parse_rows_csv(upload.read().decode("utf-8-sig")) if upload else []
+            use_cache = request.form.get("use_cache", "").lower() == "true"
+
+        logger.info(f"초안 배치 요청: 템플릿 ID={template_ids}, 행 수={len(rows)}")
+
+        if not template_ids:
+            return jsonify({"error": "템플릿 ID가 필요합니다."}), 400
+        if not rows:
+            return jsonify({"error": "보고서 입력 행이 필요합니다."}), 400
+        if len(rows) > Config.BATCH_DRAFT_MAX_ROWS:
+            return (
+                jsonify(
+                    {
+                        "error": f"한 번에 최대 {Config.BATCH_DRAFT_MAX_ROWS}행까지 생성할 수 있습니다."
+                    }
+                ),
+                400,
+            )
+
+        # 캐시된 데이터에서 템플릿 정보 찾기 (요청 순서 유지)
+        cached = {}
+        for item in iter_cached_items():
+            cached.setdefault(item.get("id"), item)
+        missing_templates = [tid for tid in template_ids if tid not in cached]
+        if missing_templates:
+            logger.warning(f"캐시에서 찾을 수 없는 템플릿: {missing_templates}")
+            return (
+                jsonify(
+                    {
+                        "error": "일부 템플릿 정보를 찾을 수 없습니다. 검색을 다시 실행해주세요."
+                    }
+                ),
+                404,
+            )
+        selected_templates = [cached[tid] for tid in dict.fromkeys(template_ids)]
+
+        # 거의 같은 템플릿은 프롬프트에 한 번만 넣음
+        selected_templates, redundant_templates = _dedupe_templates(selected_templates)
+
+        # 공유 템플릿 컨텍스트는 배치 생성 시 한 번만 구성하여 저장
+        owner = get_job_owner()
+        manifest = batch_draft_store.create(
+            selected_templates,
+            rows,
+            owner=owner,
+            use_cache=use_cache,
+            redundant_templates=redundant_templates,
+        )
+        return _submit_draft_batch(manifest["id"], owner)
+
+    except Exception as e:
+        logger.exception("create_draft_batch 함수 오류 발생")
+        return (
+            jsonify({"error": f"초안 배치 생성 중 오류가 발생했습니다: {str(e)}"}),
+            500,
+        )
+
+
+@drafts_bp.route("/batch/<batch_id>", methods=["GET"])
+def get_draft_batch(batch_id):
+    """초안 배치 진행 상태(행 상태별 개수, 비용) 조회 API"""
+    if _find_owned_batch(batch_id) is None:
+        return jsonify({"error": f"배치를 찾을 수 없습니다: {batch_id}"}), 404
+
+    return jsonify({**batch_draft_store.status(batch_id), **_batch_links(batch_id)})
+
+
+@drafts_bp.route("/batch/<batch_id>/resume", methods=["POST"])
+def resume_draft_batch(batch_id):
+    """중단되었거나 실패한 행이 있는 초안 배치를 이어서 실행하는 API"""
+    if _find_owned_batch(batch_id) is None:
+        return jsonify({"error": f"배치를 찾을 수 없습니다: {batch_id}"}), 404
+
+    status = batch_draft_store.status(batch_id)
+    if status["running"]:
+        return jsonify({"error": "이미 실행 중인 배치입니다.", **status}), 409
+    if status["complete"]:
+        return jsonify({**status, **_batch_links(batch_id)})
+
+    return _submit_draft_batch(batch_id, get_job_owner())
+
+
+@drafts_bp.route("/batch/<batch_id>/archive", methods=["GET"])
+def download_draft_batch(batch_id):
+    """초안 배치 결과 ZIP 다운로드 API (실행 중이면 그때까지 완료된 행만 포함)"""
+    if _find_owned_batch(batch_id) is None:
+        return jsonify({"error": f"배치를 찾을 수 없습니다: {batch_id}"}), 404
+
+    return Response(
+        stream_with_context(batch_draft_store.iter_archive(batch_id)),
+        mimetype="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="drafts_{batch_id}.zip"'
+        },
+    )
+
+
+@drafts_bp.route("/history", methods=["GET"])
+@login_required
+def list_history():
+    """
+    현재 사용자의 보고서/분석 기록 목록 API (최신순, 키셋 페이지네이션)
+    쿼리: cursor(이전 응답의 next_cursor), limit(최대 100), kind(draft/analysis), template_id
+    """
+    limit = min(max(request.args.get("limit", 20, type=int), 1), 100)
     try:
-        # analysis 디렉토리 경로
-        analysis_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "analysis"
+        records, next_cursor = DraftRecord.page(
+            current_user.id,
+            cursor=request.args.get("cursor"),
+            limit=limit,
+            kind=request.args.get("kind"),
+            template_id=request.args.get("template_id"),
         )
+    except ValueError:
+        return jsonify({"error": "잘못된 페이지 커서입니다."}), 400
 
-        # 파일 경로 구성
-        file_path = os.path.join(analysis_dir, filename)
+    return jsonify(
+        {
+            "items": [record.to_dict() for record in records],
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+@drafts_bp.route("/history/<int:record_id>", methods=["GET"])
+@login_required
+def get_history(record_id):
+    """현재 사용자의 보고서/분석 기록 상세(본문 포함) API"""
+    record = DraftRecord.query.filter_by(id=record_id, user_id=current_user.id).first()
+    if record is None:
+        return jsonify({"error": f"기록을 찾을 수 없습니다: {record_id}"}), 404
+
+    return jsonify({**record.to_dict(), "body": record.load_body()})
+
+
+def _send_artifact(meta, as_attachment=False):
+    """
+    저장된 결과를 파싱 없이 바이트 그대로 전송합니다.
+    클라이언트가 저장된 압축 방식을 지원하면 압축 파일을 그대로 보내고,
+    지원하지 않으면 압축만 해제하여 보냅니다. ETag/Last-Modified/Range는 send_file이 처리합니다.
+    """
+    encoding = meta["encoding"]
+    options = {
+        "mimetype": "application/json",
+        "as_attachment": as_attachment,
+        "download_name": meta["name"],
+        "conditional": True,
+        "last_modified": meta["created_at"],
+    }
+
+    if encoding == "identity" or request.accept_encodings[encoding]:
+        response = send_file(
+            artifact_store.file_path(meta),
+            etag=f"{meta['id']}-{encoding}",
+            **options,
+        )
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+    else:
+        raw = artifact_store.read_bytes(meta)
+        if raw is None:
+            raise FileNotFoundError(meta["path"])
+        response = send_file(io.BytesIO(raw), etag=f"{meta['id']}-identity", **options)
+
+    # 결과는 변경되지 않으므로 사용자 브라우저에만 저장하고 ETag로 재검증
+    response.vary.add("Accept-Encoding")
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+# 저장된 분석/보고서 결과 제공 라우트
+@drafts_bp.route("/analysis/<artifact_id>")
+def serve_analysis_file(artifact_id):
+    """저장된 결과를 ID로 조회하여 제공하는 API (?download=1이면 첨부 파일로 제공)"""
+    try:
+        meta = artifact_store.get(artifact_id)
 
-        # 파일 존재 확인
-        if not os.path.exists(file_path):
-            logger.error(f"분석 파일을 찾을 수 없음: {filename}")
-            return jsonify({"error": f"파일을 찾을 수 없습니다: {filename}"}), 404
+        # 다른 사용자의 결과는 존재하지 않는 것으로 처리
+        if meta is None or meta["owner"] != get_job_owner():
+            logger.error(f"분석 결과를 찾을 수 없음: {artifact_id}")
+            return jsonify({"error": f"결과를 찾을 수 없습니다: {artifact_id}"}), 404
 
-        # 파일 내용 읽기
-        with open(file_path, "r", encoding="utf-8") as f:
-            file_content = json.load(f)
+        return _send_artifact(meta, as_attachment=bool(request.args.get("download")))
 
-        return jsonify(file_content)
+    except FileNotFoundError:
+        logger.error(f"분석 결과 파일이 없음: {artifact_id}")
+        return jsonify({"error": f"결과를 찾을 수 없습니다: {artifact_id}"}), 404
 
     except Exception as e:
-        # 오류 발생 시 함수명과 파일명 로깅, 스택 트레이스 포함
-        logger.exception(f"serve_analysis_file 함수 오류 발생: filename={filename}")
+        # 오류 발생 시 함수명과 결과 ID 로깅, 스택 트레이스 포함
+        logger.exception(
+            f"serve_analysis_file 함수 오류 발생: artifact_id={artifact_id}"
+        )
         return (
-            jsonify({"error": f"분석 파일 제공 중 오류가 발생했습니다: {str(e)}"}),
+            jsonify({"error": f"분석 결과 제공 중 오류가 발생했습니다: {str(e)}"}),
             500,
         )
@@ -0,0 +1,93 @@
+"""
+백그라운드 작업 라우트 핸들러
+작업 상태 조회, 결과 조회, 취소 API를 제공합니다.
+"""
+
+from flask import Blueprint, jsonify, url_for
+from flask_login import current_user
+from utils.job_queue import job_manager, JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED
+from utils.logging import logger
+from utils.usage_ledger import BudgetExceededError
+
+# 블루프린트 생성
+jobs_bp = Blueprint("jobs", __name__)
+
+
+def get_job_owner():
+    """현재 요청 사용자의 작업 소유자 ID를 반환합니다. (비로그인 시 None)"""
+    return current_user.id if current_user.is_authenticated else None
+
+
+def job_links(job):
+    """작업 상태/결과 조회 URL을 반환합니다."""
+    return {
+        "status_url": url_for("jobs.get_job_status", job_id=job.id),
+        "result_url": url_for("jobs.get_job_result", job_id=job.id),
+        "cancel_url": url_for("jobs.cancel_job", job_id=job.id, _method="POST"),
+    }
+
+
+def accepted_response(job, **extra):
+    """작업 제출 결과를 202 응답으로 반환합니다."""
+    links = job_links(job)
+    payload = {**job.to_dict(), **links, **extra}
+    return jsonify(payload), 202, {"Location": links["status_url"]}
+
+
+def _find_job(job_id):
+    """작업을 조회하고 소유자를 확인합니다. 권한이 없으면 None을 반환합니다."""
+    job = job_manager.get(job_id)
+    if job is None:
+        return None
+    if job.owner is not None and job.owner != get_job_owner():
+        logger.warning(f"다른 사용자의 작업 접근 시도: id={job_id}")
+        return None
+    return job
+
+
+@jobs_bp.route("/<job_id>", methods=["GET"])
+def get_job_status(job_id):
+    """작업 상태 및 진행률 조회 API"""
+    job = _find_job(job_id)
+    if job is None:
+        return jsonify({"error": f"작업을 찾을 수 없습니다: {job_id}"}), 404
+
+    return jsonify({**job.to_dict(), **job_links(job)})
+
+
+@jobs_bp.route("/<job_id>/result", methods=["GET"])
+def get_job_result(job_id):
+    """작업 결과 조회 API (완료 전에는 202 반환)"""
+    job = _find_job(job_id)
+    if job is None:
+        return jsonify({"error": f"작업을 찾을 수 없습니다: {job_id}"}), 404
+
+    if job.status == JOB_SUCCEEDED:
+        return jsonify({"job_id": job.id, "status": job.status, "result": job.result})
+
+    if job.status == JOB_FAILED:
+        # 예산 초과로 실패한 작업은 동기 API와 같이 429 반환
+        status_code = 429 if isinstance(job.exception, BudgetExceededError) else 500
+        return (
+            jsonify({**job.to_dict(), "error": f"작업이 실패했습니다: {job.error}"}),
+            status_code,
+        )
+
+    if job.status == JOB_CANCELLED:
+        return jsonify({**job.to_dict(), "error": "취소된 작업입니다."}), 409
+
+    return jsonify(job.to_dict()), 202
+
+
+@jobs_bp.route("/<job_id>/cancel", methods=["POST"])
+@jobs_bp.route("/<job_id>", methods=["DELETE"])
+def cancel_job(job_id):
+    """작업 취소 API"""
+    job = _find_job(job_id)
+    if job is None:
+        return jsonify({"error": f"작업을 찾을 수 없습니다: {job_id}"}), 404
+
+    if not job_manager.cancel(job_id):
+        return jsonify({**job.to_dict(), "error": "이미 종료된 작업입니다."}), 409
+
+    return jsonify(job.to_dict())
@@ -8,6 +8,9 @@ from flask import Blueprint, render_template, request, jsonify, abort
 from markupsafe import Markup  # Markup 임포트
 import re  # 정규표현식 임포트
 from api.government_api import fetch_government_templates
+from config import Config
+from utils.near_duplicates import near_duplicate_detector
+from utils.similarity_index import similarity_index
 from utils.token_utils import calculate_token_cost
 from utils.logging import logger
 
@@ -58,13 +61,34 @@ def search_templates():
     # API 호출
     result = fetch_government_templates(keyword, page, per_page, doc_type, manager)
 
+    # 거의 같은 문서는 대표 항목 하나로 묶음 (similarCount, duplicates)
+    if "error" not in result and near_duplicate_detector and result.get("items"):
+        result["items"] = near_duplicate_detector.collapse_items(result["items"])
+
     # 결과 캐싱 (오류가 없는 경우에만)
+    # 캐시한 항목은 유사 템플릿 색인에도 반영 (추천 항목을 캐시에서 찾을 수 있도록)
     if "error" not in result and use_cache:
         template_cache[cache_key] = result
+        similarity_index.add_items(result.get("items", []))
 
     return jsonify(result)
 
 
+@main_bp.route("/api/templates/<template_id>/similar", methods=["GET"])
+def similar_templates(template_id):
+    """선택한 템플릿과 내용이 비슷한 템플릿 추천 API"""
+    k = max(1, min(request.args.get("k", Config.SIMILAR_TOP_K, type=int), 50))
+
+    items = similarity_index.similar(template_id, k)
+    if items is None:
+        return (
+            jsonify({"error": f"색인되지 않은 템플릿입니다: {template_id}"}),
+            404,
+        )
+
+    return jsonify({"id": template_id, "items": items})
+
+
 # 템플릿 상세 정보 관련 헬퍼 함수 및 필터
 def get_meta_fields(doc_type):
     """문서 유형에 따른 메타 필드 구성 반환"""
@@ -181,18 +205,11 @@ def template_detail(template_id):
 
     # 캐시에서 템플릿 찾기 시도
     found_template = None
-    for cache_key, cached_data in template_cache.items():
-        if isinstance(cached_data, dict) and "items" in cached_data:
-            for item in cached_data["items"]:
-                # API 응답 형식에 따라 id 필드 접근 방식 조정 필요
-                # 예: item['id'], item.get('id') 등
-                item_id = item.get("id") or item.get(
-                    "_id"
-                )  # 다양한 ID 필드 가능성 고려
-                if str(item_id) == str(template_id):
-                    found_template = item
-                    break
-        if found_template:
+    for item in iter_cached_items():
+        # 다양한 ID 필드 가능성 고려
+        item_id = item.get("id") or item.get("_id")
+        if str(item_id) == str(template_id):
+            found_template = item
             break
 
     if not found_template:
@@ -253,3 +270,13 @@ def internal_server_error(e):
 # 캐시 가져오기 함수 (drafts.py에서 사용)
 def get_template_cache():
     return template_cache
+
+
+def iter_cached_items():
+    """캐시된 검색 결과의 항목을 순회합니다. (유사 중복으로 묶인 항목 포함)"""
+    for cached_data in list(template_cache.values()):
+        if not isinstance(cached_data, dict):
+            continue
+        for item in cached_data.get("items", []):
+            yield item
+            yield from item.get("duplicates", [])
@@ -4,7 +4,10 @@
 """
 
 from config import db
-from routes.member.models import init_user_model
+from routes.member.models import init_user_model, init_draft_models
 
 # User 모델 초기화
 User = init_user_model(db)
+
+# 보고서/분석 기록 모델 초기화
+DraftRecord, DraftTemplate, DraftBody = init_draft_models(db)
@@ -1,11 +1,18 @@
 """
 회원 관리 관련 데이터베이스 모델
-사용자 계정 모델을 정의합니다.
+사용자 계정 모델과 사용자별 보고서/분석 기록 모델을 정의합니다.
 """
 
+import gzip
+import json
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import event
+from sqlalchemy.orm import make_transient_to_detached, object_session
+from sqlalchemy.orm.attributes import set_committed_value
 from datetime import datetime
+from utils.password_hasher import password_hasher
+from utils.user_cache import user_cache
+from utils.write_behind import last_login_writer
 
 # SQLAlchemy 객체는 외부에서 주입됩니다. (from config import db)
 db = None
@@ -30,17 +37,66 @@ def init_user_model(sqlalchemy_db):
         created_at = db.Column(db.DateTime, default=datetime.utcnow)
         last_login = db.Column(db.DateTime, nullable=True)
 
+        @classmethod
+        def get_cached(cls, user_id):
+            """
+            사용자 캐시를 거쳐 ID로 사용자를 조회합니다. (Flask-Login user_loader용)
+            캐시 적중 시 스냅샷으로 만든 객체를 쿼리 없이 현재 세션에 연결하므로
+            요청 중 변경한 값도 평소처럼 commit으로 저장됩니다.
+            """
+            if user_cache is None:
+                return db.session.get(cls, user_id)
+
+            data = user_cache.get(user_id)
+            if data is None:
+                user = db.session.get(cls, user_id)
+                if user is not None:
+                    user_cache.set(
+                        user_id,
+                        {
+                            column.key: getattr(user, column.key)
+                            for column in cls.__table__.columns
+                        },
+                    )
+                return user
+
+            user = cls(**data)
+            make_transient_to_detached(user)
+            return db.session.merge(user, load=False)
+
         def set_password(self, password):
-            """비밀번호를 해시하여 저장"""
-            self.password_hash = generate_password_hash(password)
+            """비밀번호를 해시하여 저장 (해시 전용 스레드 풀에서 계산)"""
+            self.password_hash = password_hasher.hash(password)
 
         def check_password(self, password):
-            """비밀번호 검증"""
-            return check_password_hash(self.password_hash, password)
+            """비밀번호 검증 (해시 전용 스레드 풀에서 계산)"""
+            return password_hasher.verify(self.password_hash, password)
+
+        def upgrade_password_hash(self, password):
+            """
+            저장된 해시가 현재 설정과 다른 방식이면 검증된 비밀번호로 다시 해시하여 저장
+            로그인 성공 직후 호출하며, 해시 방식 변경 후 사용자당 한 번만 저장합니다.
+            """
+            if not password_hasher.needs_rehash(self.password_hash):
+                return False
+            self.set_password(password)
+            db.session.commit()
+            return True
 
         def update_last_login(self):
-            """마지막 로그인 시간 업데이트"""
-            self.last_login = datetime.utcnow()
+            """
+            마지막 로그인 시간 업데이트
+            지연 기록기가 있으면 메모리에 기록하고 일괄 저장하여 로그인 요청에서 DB 쓰기를 뺍니다.
+            """
+            last_login = datetime.utcnow()
+            if last_login_writer and last_login_writer.record(
+                self.id, last_login=last_login
+            ):
+                # 요청 안에서도 새 값이 보이도록 하되, 이 세션의 변경으로는 저장하지 않음
+                set_committed_value(self, "last_login", last_login)
+                return
+
+            self.last_login = last_login
             db.session.commit()
 
         def activate_account(self):
@@ -56,4 +112,206 @@ def init_user_model(sqlalchemy_db):
         def __repr__(self):
             return f"<User {self.username}>"
 
+    if user_cache is not None:
+        # 사용자 행이 변경되면 커밋 후 캐시를 무효화 (비밀번호 변경, 비활성화, 마지막 로그인 등)
+        @event.listens_for(User, "after_update")
+        @event.listens_for(User, "after_delete")
+        def _track_changed_user(mapper, connection, target):
+            session = object_session(target)
+            if session is not None:
+                session.info.setdefault("changed_user_ids", set()).add(target.id)
+
+        @event.listens_for(db.session, "after_commit")
+        def _invalidate_changed_users(session):
+            for user_id in session.info.pop("changed_user_ids", ()):
+                user_cache.invalidate(user_id)
+
+        @event.listens_for(db.session, "after_rollback")
+        def _discard_changed_users(session):
+            session.info.pop("changed_user_ids", None)
+
     return User
+
+
+def encode_history_cursor(record):
+    """기록의 (생성 시각, ID)를 다음 페이지 조회용 커서 문자열로 변환합니다."""
+    return f"{record.created_at.isoformat()}_{record.id}"
+
+
+def decode_history_cursor(cursor):
+    """커서 문자열을 (생성 시각, ID)로 변환합니다. 형식이 잘못되면 ValueError를 발생시킵니다."""
+    created_at, _, record_id = cursor.rpartition("_")
+    return datetime.fromisoformat(created_at), int(record_id)
+
+
+def init_draft_models(sqlalchemy_db):
+    """보고서/분석 기록 모델 클래스를 초기화하고 (DraftRecord, DraftTemplate, DraftBody)를 반환합니다."""
+
+    class DraftRecord(sqlalchemy_db.Model):
+        """
+        사용자별 보고서/분석 기록 (목록 조회용 메타데이터)
+        본문은 DraftBody에 분리 저장하여 목록 조회 시 읽지 않습니다.
+        """
+
+        __tablename__ = "draft_records"
+        __table_args__ = (
+            sqlalchemy_db.Index(
+                "ix_draft_records_user_created", "user_id", "created_at", "id"
+            ),
+        )
+
+        id = sqlalchemy_db.Column(sqlalchemy_db.Integer, primary_key=True)
+        user_id = sqlalchemy_db.Column(
+            sqlalchemy_db.Integer, sqlalchemy_db.ForeignKey("users.id"), nullable=False
+        )
+        kind = sqlalchemy_db.Column(sqlalchemy_db.String(20), nullable=False)
+        title = sqlalchemy_db.Column(sqlalchemy_db.String(200), nullable=False)
+        template_ids = sqlalchemy_db.Column(sqlalchemy_db.Text, default="[]")
+        model = sqlalchemy_db.Column(sqlalchemy_db.String(50), nullable=True)
+        total_tokens = sqlalchemy_db.Column(sqlalchemy_db.Integer, default=0)
+        cost_krw = sqlalchemy_db.Column(sqlalchemy_db.Float, default=0.0)
+        size = sqlalchemy_db.Column(sqlalchemy_db.Integer, default=0)
+        artifact_id = sqlalchemy_db.Column(sqlalchemy_db.String(32), nullable=True)
+        created_at = sqlalchemy_db.Column(
+            sqlalchemy_db.DateTime, default=datetime.utcnow, nullable=False
+        )
+
+        user = sqlalchemy_db.relationship(
+            "User", backref=sqlalchemy_db.backref("drafts", lazy="dynamic")
+        )
+
+        @classmethod
+        def create(
+            cls,
+            user_id,
+            kind,
+            title,
+            body,
+            template_ids=None,
+            token_info=None,
+            artifact_id=None,
+        ):
+            """기록과 압축한 본문을 저장하고 기록을 반환합니다."""
+            token_info = token_info or {}
+            template_ids = [str(template_id) for template_id in template_ids or []]
+            raw = json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode(
+                "utf-8"
+            )
+
+            record = cls(
+                user_id=user_id,
+                kind=kind,
+                title=(title or "제목 없음")[:200],
+                template_ids=json.dumps(template_ids, ensure_ascii=False),
+                model=token_info.get("model"),
+                total_tokens=token_info.get("total_tokens", 0),
+                cost_krw=token_info.get("cost_krw", 0.0),
+                size=len(raw),
+                artifact_id=artifact_id,
+            )
+            sqlalchemy_db.session.add(record)
+            sqlalchemy_db.session.flush()
+
+            sqlalchemy_db.session.add(
+                DraftBody(record_id=record.id, content=gzip.compress(raw))
+            )
+            sqlalchemy_db.session.add_all(
+                DraftTemplate(record_id=record.id, template_id=template_id)
+                for template_id in dict.fromkeys(template_ids)
+            )
+            sqlalchemy_db.session.commit()
+            return record
+
+        @classmethod
+        def page(cls, user_id, cursor=None, limit=20, kind=None, template_id=None):
+            """
+            사용자의 기록을 최신순으로 키셋 페이지네이션하여 조회합니다.
+            OFFSET 대신 마지막 기록의 (생성 시각, ID) 이후만 조회하므로
+            기록이 많아져도 페이지 조회 비용이 일정합니다.
+
+            Returns:
+                (기록 목록, 다음 페이지 커서 또는 None)
+            """
+            query = cls.query.filter(cls.user_id == user_id)
+            if kind:
+                query = query.filter(cls.kind == kind)
+            if template_id:
+                query = query.join(
+                    DraftTemplate, DraftTemplate.record_id == cls.id
+                ).filter(DraftTemplate.template_id == str(template_id))
+            if cursor:
+                created_at, record_id = decode_history_cursor(cursor)
+                query = query.filter(
+                    sqlalchemy_db.or_(
+                        cls.created_at < created_at,
+                        sqlalchemy_db.and_(
+                            cls.created_at == created_at, cls.id < record_id
+                        ),
+                    )
+                )
+
+            records = (
+                query.order_by(cls.created_at.desc(), cls.id.desc())
+                .limit(limit + 1)
+                .all()
+            )
+            next_cursor = (
+                encode_history_cursor(records[limit - 1])
+                if len(records) > limit
+                else None
+            )
+            return records[:limit], next_cursor
+
+        def load_body(self):
+            """분리 저장된 본문을 불러옵니다."""
+            body = sqlalchemy_db.session.get(DraftBody, self.id)
+            return json.loads(gzip.decompress(body.content)) if body else None
+
+        def to_dict(self):
+            """목록 표시에 필요한 메타데이터를 딕셔너리로 반환합니다."""
+            return {
+                "id": self.id,
+                "kind": self.kind,
+                "title": self.title,
+                "template_ids": json.loads(self.template_ids or "[]"),
+                "model": self.model,
+                "total_tokens": self.total_tokens,
+                "cost_krw": self.cost_krw,
+                "size": self.size,
+                "artifact_id": self.artifact_id,
+                "created_at": self.created_at.isoformat(),
+            }
+
+        def __repr__(self):
+            return f"<DraftRecord {self.id} {self.kind}>"
+
+    class DraftTemplate(sqlalchemy_db.Model):
+        """기록과 사용한 템플릿 ID의 연결 (템플릿별 기록 조회용)"""
+
+        __tablename__ = "draft_templates"
+        __table_args__ = (
+            sqlalchemy_db.Index(
+                "ix_draft_templates_template", "template_id", "record_id"
+            ),
+        )
+
+        record_id = sqlalchemy_db.Column(
+            sqlalchemy_db.Integer,
+            sqlalchemy_db.ForeignKey("draft_records.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+        template_id = sqlalchemy_db.Column(sqlalchemy_db.String(100), primary_key=True)
+
+    class DraftBody(sqlalchemy_db.Model):
+        """기록 본문 (gzip 압축 JSON)"""
+
+        __tablename__ = "draft_bodies"
+
+        record_id = sqlalchemy_db.Column(
+            sqlalchemy_db.Integer,
+            sqlalchemy_db.ForeignKey("draft_records.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+        content = sqlalchemy_db.Column(sqlalchemy_db.LargeBinary, nullable=False)
+
+    return DraftRecord, DraftTemplate, DraftBody
@@ -7,15 +7,22 @@ from flask import Blueprint, render_template, redirect, url_for, flash, request
 from flask_login import login_user, logout_user, current_user, login_required
 from urllib.parse import urlparse  # 대신 werkzeug.urls.url_parse 대체
 from config import db
-from routes.member import User
+from routes.member import User, DraftRecord
 from routes.member.forms import LoginForm, RegistrationForm, PasswordChangeForm
 from utils.logging import logger
+from utils.password_hasher import PasswordHasherBusyError
 from datetime import datetime
 
 # 블루프린트 생성
 member_bp = Blueprint("member", __name__)
 
 
+@member_bp.errorhandler(PasswordHasherBusyError)
+def password_hasher_busy(e):
+    """비밀번호 해시 대기열 초과 시 기다리지 않고 즉시 503 반환"""
+    return render_template("503.html"), 503, {"Retry-After": "5"}
+
+
 @member_bp.route("/login", methods=["GET", "POST"])
 def login():
     """로그인 페이지"""
@@ -37,6 +44,14 @@ def login():
             return redirect(url_for("member.login"))
 
         login_user(user, remember=form.remember_me.data)
+        # 해시 방식 갱신은 부가 작업이므로 해시 대기열이 가득 차도 로그인은 계속하고 다음 로그인에서 재시도
+        try:
+            if user.upgrade_password_hash(form.password.data):
+                logger.info(f"비밀번호 해시 방식 갱신: {user.username}")
+        except PasswordHasherBusyError:
+            logger.warning(
+                f"비밀번호 해시 방식 갱신 보류 (해시 대기열 초과): {user.username}"
+            )
         user.update_last_login()
         logger.info(f"로그인 성공: {user.username}")
 
@@ -90,6 +105,27 @@ def profile():
     return render_template("member/profile.html", title="내 프로필")
 
 
+@member_bp.route("/history")
+@login_required
+def history():
+    """보고서/분석 기록 페이지 (최신순, 키셋 페이지네이션)"""
+    kind = request.args.get("kind") or None
+    try:
+        records, next_cursor = DraftRecord.page(
+            current_user.id, cursor=request.args.get("cursor"), limit=20, kind=kind
+        )
+    except ValueError:
+        return redirect(url_for("member.history", kind=kind))
+
+    return render_template(
+        "member/history.html",
+        title="내 기록",
+        records=records,
+        next_cursor=next_cursor,
+        kind=kind,
+    )
+
+
 @member_bp.route("/change-password", methods=["GET", "POST"])
 @login_required
 def change_password():
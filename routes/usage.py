@@ -0,0 +1,33 @@
+"""
+사용량 라우트 핸들러
+현재 사용자의 OpenAI 토큰 사용량과 예산 현황, LLM 호출 대기 현황 API를 제공합니다.
+"""
+
+from flask import Blueprint, jsonify, request
+from flask_login import login_required, current_user
+from utils.usage_ledger import usage_ledger
+from api.llm_scheduler import llm_scheduler
+
+# 블루프린트 생성
+usage_bp = Blueprint("usage", __name__)
+
+
+@usage_bp.route("/summary", methods=["GET"])
+@login_required
+def get_usage_summary():
+    """현재 사용자의 최근 일별 사용량과 오늘의 예산 현황 API (쿼리: days, 최대 90)"""
+    if usage_ledger is None:
+        return jsonify({"error": "사용량 장부가 비활성화되어 있습니다."}), 404
+
+    days = min(max(request.args.get("days", 30, type=int), 1), 90)
+    return jsonify(usage_ledger.summary(current_user.id, days=days))
+
+
+@usage_bp.route("/scheduler", methods=["GET"])
+@login_required
+def get_scheduler_stats():
+    """LLM 호출 스케줄러의 등급별 실행/대기 수와 최근 대기 시간(p50/p95/최대) API"""
+    if llm_scheduler is None:
+        return jsonify({"error": "LLM 호출 스케줄러가 비활성화되어 있습니다."}), 404
+
+    return jsonify(llm_scheduler.stats())
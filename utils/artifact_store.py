@@ -0,0 +1,390 @@
+"""
+분석/보고서 결과 저장소
+결과를 고유 ID로 압축 저장하고, SQLite 색인(소유자, 종류, 생성 시각, 크기, 템플릿 ID)과
+보관 기간 기반 정리, 같은 입력의 결과를 재사용하기 위한 메모 키 조회를 제공합니다.
+"""
+
+import os
+import gzip
+import json
+import time
+import uuid
+import sqlite3
+import threading
+import contextlib
+from typing import Any, Dict, Iterator, List, Optional
+from config import Config
+from utils.logging import logger
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+
+# 압축 방식별 파일 확장자
+ENCODING_EXTENSIONS = {"gzip": ".json.gz", "zstd": ".json.zst", "identity": ".json"}
+
+
+class ArtifactStore:
+    """압축 파일 + SQLite 색인 기반 결과 저장소"""
+
+    # 만료 항목 정리를 수행할 쓰기 횟수 간격
+    CLEANUP_EVERY = 100
+
+    def __init__(
+        self,
+        root_dir: str,
+        index_path: Optional[str] = None,
+        compression: str = "gzip",
+        retention_seconds: int = 30 * 24 * 3600,
+    ):
+        self.root_dir = root_dir
+        self.index_path = index_path or os.path.join(root_dir, "index.db")
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        if compression == "zstd" and zstandard is None:
+            logger.warning("zstandard 패키지가 없어 gzip 압축을 사용합니다.")
+            compression = "gzip"
+        if compression not in ("gzip", "zstd"):
+            compression = "identity"
+        self.compression = compression
+
+        os.makedirs(root_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS artifacts (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    owner INTEGER,
+                    name TEXT,
+                    path TEXT NOT NULL,
+                    encoding TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    raw_size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL
+                )"""
+            )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS artifact_templates (
+                    artifact_id TEXT NOT NULL,
+                    template_id TEXT NOT NULL,
+                    PRIMARY KEY (artifact_id, template_id)
+                )"""
+            )
+            # 메모 키(입력 내용 해시) → 결과 ID (소유자별, 익명은 0)
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS artifact_memos (
+                    memo_key TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    owner INTEGER NOT NULL,
+                    artifact_id TEXT NOT NULL,
+                    PRIMARY KEY (memo_key, kind, owner)
+                )"""
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_artifact_memos_artifact "
+                "ON artifact_memos (artifact_id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_artifacts_owner "
+                "ON artifacts (owner, kind, created_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_artifacts_expires "
+                "ON artifacts (expires_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_artifact_templates_template "
+                "ON artifact_templates (template_id)"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        스레드/프로세스 간 공유를 위해 호출마다 새 연결을 생성합니다.
+        블록이 끝나면 커밋(예외 시 롤백)하고 연결을 닫습니다.
+        """
+        conn = sqlite3.connect(self.index_path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _compress(self, raw: bytes) -> bytes:
+        if self.compression == "gzip":
+            return gzip.compress(raw, compresslevel=6)
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=3).compress(raw)
+        return raw
+
+    @staticmethod
+    def _decompress(data: bytes, encoding: str) -> bytes:
+        if encoding == "gzip":
+            return gzip.decompress(data)
+        if encoding == "zstd":
+            if zstandard is None:
+                raise RuntimeError(
+                    "zstd 압축 결과를 읽으려면 zstandard 패키지가 필요합니다."
+                )
+            return zstandard.ZstdDecompressor().decompress(data)
+        return data
+
+    def put(
+        self,
+        kind: str,
+        data: Any,
+        owner: Optional[int] = None,
+        template_ids: Optional[List[str]] = None,
+        name: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+        memo_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        결과를 압축 저장하고 색인에 등록합니다.
+
+        Args:
+            kind: 결과 종류 (template_input, template_analysis, draft 등)
+            data: JSON으로 직렬화할 데이터
+            owner: 소유 사용자 ID
+            template_ids: 관련 템플릿 ID 목록
+            name: 다운로드 시 사용할 파일 이름
+            ttl_seconds: 보관 기간(초), None이면 기본 보관 기간
+            memo_key: 같은 입력의 결과를 find_memo로 다시 찾기 위한 키
+
+        Returns:
+            저장된 결과의 메타데이터
+        """
+        artifact_id = uuid.uuid4().hex
+        raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        stored = self._compress(raw)
+
+        # ID 앞 두 글자로 하위 디렉토리를 나누어 한 디렉토리의 파일 수를 제한
+        relative_path = os.path.join(
+            artifact_id[:2], artifact_id + ENCODING_EXTENSIONS[self.compression]
+        )
+        path = os.path.join(self.root_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(stored)
+        os.replace(temp_path, path)
+
+        now = time.time()
+        ttl = self.retention_seconds if ttl_seconds is None else ttl_seconds
+        meta = {
+            "id": artifact_id,
+            "kind": kind,
+            "owner": owner,
+            "name": name or f"{kind}_{artifact_id[:8]}.json",
+            "path": relative_path,
+            "encoding": self.compression,
+            "size": len(stored),
+            "raw_size": len(raw),
+            "created_at": now,
+            "expires_at": now + ttl if ttl else None,
+        }
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO artifacts (id, kind, owner, name, path, encoding, size, "
+                "raw_size, created_at, expires_at) VALUES (:id, :kind, :owner, :name, "
+                ":path, :encoding, :size, :raw_size, :created_at, :expires_at)",
+                meta,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO artifact_templates (artifact_id, template_id) "
+                "VALUES (?, ?)",
+                [(artifact_id, str(template_id)) for template_id in template_ids or []],
+            )
+            if memo_key:
+                conn.execute(
+                    "INSERT OR REPLACE INTO artifact_memos "
+                    "(memo_key, kind, owner, artifact_id) VALUES (?, ?, ?, ?)",
+                    (memo_key, kind, owner or 0, artifact_id),
+                )
+
+        logger.info(
+            f"결과 저장: id={artifact_id}, 종류={kind}, "
+            f"크기={len(stored)}B (원본 {len(raw)}B, {self.compression})"
+        )
+
+        with self._lock:
+            self._writes += 1
+            should_cleanup = self._writes % self.CLEANUP_EVERY == 0
+        if should_cleanup:
+            self.cleanup()
+
+        return {
+            **meta,
+            "template_ids": list(template_ids or []),
+            "memo_key": memo_key,
+        }
+
+    def get(self, artifact_id: str) -> Optional[Dict[str, Any]]:
+        """결과 메타데이터를 조회합니다. 없거나 만료되었으면 None을 반환합니다."""
+        if not artifact_id or not artifact_id.isalnum():
+            return None
+
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute(
+                "SELECT * FROM artifacts WHERE id = ?", (artifact_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            template_ids = [
+                template_id
+                for (template_id,) in conn.execute(
+                    "SELECT template_id FROM artifact_templates WHERE artifact_id = ?",
+                    (artifact_id,),
+                )
+            ]
+
+        meta = dict(row)
+        if meta["expires_at"] and meta["expires_at"] < time.time():
+            return None
+        meta["template_ids"] = template_ids
+        return meta
+
+    def find_memo(
+        self, kind: str, memo_key: str, owner: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        메모 키로 저장된 결과를 찾습니다.
+
+        Returns:
+            결과 메타데이터, 없거나 만료되었거나 파일이 사라졌으면 None
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT artifact_id FROM artifact_memos "
+                "WHERE memo_key = ? AND kind = ? AND owner = ?",
+                (memo_key, kind, owner or 0),
+            ).fetchone()
+        if row is None:
+            return None
+
+        meta = self.get(row[0])
+        if meta is None or not os.path.exists(self.file_path(meta)):
+            with self._connect() as conn:
+                conn.execute(
+                    "DELETE FROM artifact_memos WHERE artifact_id = ?", (row[0],)
+                )
+            return None
+        meta["memo_key"] = memo_key
+        return meta
+
+    def memo_key_of(self, artifact_id: str) -> Optional[str]:
+        """결과를 저장할 때 지정한 메모 키를 반환합니다."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT memo_key FROM artifact_memos WHERE artifact_id = ?",
+                (artifact_id,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def file_path(self, meta: Dict[str, Any]) -> str:
+        """저장된 파일의 절대 경로를 반환합니다."""
+        return os.path.join(self.root_dir, meta["path"])
+
+    def read_bytes(self, meta: Dict[str, Any]) -> Optional[bytes]:
+        """저장된 결과를 압축 해제한 JSON 바이트로 반환합니다. 파일이 없으면 None을 반환합니다."""
+        try:
+            with open(self.file_path(meta), "rb") as f:
+                return self._decompress(f.read(), meta["encoding"])
+        except FileNotFoundError:
+            logger.warning(f"결과 파일이 없습니다: id={meta['id']}")
+            return None
+
+    def load(self, artifact_id: str) -> Optional[Any]:
+        """결과 데이터를 불러옵니다. 없거나 만료되었으면 None을 반환합니다."""
+        meta = self.get(artifact_id)
+        if meta is None:
+            return None
+        raw = self.read_bytes(meta)
+        return json.loads(raw) if raw is not None else None
+
+    def list(
+        self,
+        owner: Optional[int] = None,
+        kind: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """소유자/종류별 최근 결과 메타데이터 목록을 반환합니다."""
+        query = "SELECT * FROM artifacts WHERE (expires_at IS NULL OR expires_at > ?)"
+        params: List[Any] = [time.time()]
+        if owner is not None:
+            query += " AND owner = ?"
+            params.append(owner)
+        if kind is not None:
+            query += " AND kind = ?"
+            params.append(kind)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            return [dict(row) for row in conn.execute(query, params)]
+
+    def delete(self, artifact_id: str) -> bool:
+        """결과 파일과 색인을 삭제합니다."""
+        meta = self.get(artifact_id)
+        if meta is None:
+            return False
+        self._remove([(artifact_id, meta["path"])])
+        return True
+
+    def _remove(self, rows: List[tuple]) -> None:
+        for _, relative_path in rows:
+            try:
+                os.remove(os.path.join(self.root_dir, relative_path))
+            except FileNotFoundError:
+                pass
+        with self._connect() as conn:
+            conn.executemany(
+                "DELETE FROM artifacts WHERE id = ?", [(row[0],) for row in rows]
+            )
+            conn.executemany(
+                "DELETE FROM artifact_templates WHERE artifact_id = ?",
+                [(row[0],) for row in rows],
+            )
+            conn.executemany(
+                "DELETE FROM artifact_memos WHERE artifact_id = ?",
+                [(row[0],) for row in rows],
+            )
+
+    def cleanup(self) -> int:
+        """
+        보관 기간이 지난 결과를 삭제합니다.
+
+        Returns:
+            삭제된 결과 수
+        """
+        try:
+            with self._connect() as conn:
+                expired = conn.execute(
+                    "SELECT id, path FROM artifacts "
+                    "WHERE expires_at IS NOT NULL AND expires_at < ?",
+                    (time.time(),),
+                ).fetchall()
+            if expired:
+                self._remove(expired)
+                logger.info(f"만료된 결과 정리 완료: {len(expired)}개 삭제")
+            return len(expired)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"결과 저장소 정리 실패: {str(e)}")
+            return 0
+
+
+# 싱글톤 결과 저장소
+artifact_store = ArtifactStore(
+    Config.ARTIFACT_DIR,
+    compression=Config.ARTIFACT_COMPRESSION,
+    retention_seconds=Config.ARTIFACT_RETENTION_SECONDS,
+)
@@ -0,0 +1,49 @@
+"""
+데이터베이스 엔진 설정
+엔진 프로필에 따라 연결마다 필요한 설정(SQLite PRAGMA 등)을 적용합니다.
+"""
+
+from sqlalchemy import event
+from config import resolve_db_profile
+from utils.logging import logger
+
+
+def _sqlite_pragmas(config) -> list:
+    return [
+        # 읽기와 쓰기가 서로를 막지 않도록 WAL 모드 사용 (데이터베이스 파일에 유지됨)
+        "PRAGMA journal_mode=WAL",
+        # WAL 모드에서는 NORMAL도 손상 없이 안전하며 커밋마다 fsync하지 않음
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={config['SQLITE_BUSY_TIMEOUT_MS']}",
+        f"PRAGMA mmap_size={config['SQLITE_MMAP_SIZE']}",
+    ]
+
+
+def init_db_engine(app, db) -> str:
+    """
+    앱의 엔진 프로필을 적용합니다. (db.init_app 이후 호출)
+
+    Returns:
+        적용된 프로필 이름
+    """
+    profile = resolve_db_profile(
+        app.config["SQLALCHEMY_DATABASE_URI"], app.config.get("DB_PROFILE", "auto")
+    )
+
+    with app.app_context():
+        engine = db.engine
+
+    if profile == "sqlite" and engine.dialect.name == "sqlite":
+        pragmas = _sqlite_pragmas(app.config)
+
+        @event.listens_for(engine, "connect")
+        def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma in pragmas:
+                    cursor.execute(pragma)
+            finally:
+                cursor.close()
+
+    logger.info(f"데이터베이스 엔진 프로필: {profile} ({engine.dialect.name})")
+    return profile
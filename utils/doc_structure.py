@@ -0,0 +1,216 @@
+"""
+문서 구조 추출 유틸리티
+clean_html_content로 정제된 정부 문서를 규칙 기반으로 파싱하여
+제목/글머리표 계층과 표 요약으로 이루어진 간결한 구조 트리를 만듭니다.
+LLM 프롬프트에 원문 대신 골격만 보내거나, 문서 구조 통계를 LLM 없이 계산할 때 사용합니다.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List
+from bs4 import BeautifulSoup
+from config import Config
+from utils.logging import logger
+
+# 줄 앞 기호 → 계층 수준 (작을수록 상위)
+# 로마 숫자/숫자 장 제목 > □ > ○ > - > · > ※ 순으로 중첩되는 정부 문서 관례를 따름
+_MARKERS = [
+    (re.compile(r"^([ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩ]+\.|[IVX]+\.)\s*"), 0),
+    (re.compile(r"^(\d{1,2}\.)\s+"), 0),
+    (re.compile(r"^(□|■)\s*"), 1),
+    (re.compile(r"^(○|ㅇ|●)\s*"), 2),
+    (re.compile(r"^([가-하]\.|\(\d{1,2}\)|\d{1,2}\))\s*"), 2),
+    (re.compile(r"^(-|―|–|⁃)\s*"), 3),
+    (re.compile(r"^(·|∙|•|ㆍ)\s*"), 4),
+    (re.compile(r"^(※|\*)\s*"), 5),
+]
+_TABLE_PATTERN = re.compile(r"(<table[\s\S]*?</table>)", re.IGNORECASE)
+_SENTENCE_PATTERN = re.compile(r"[^.!?。]+(?:다\.|[.!?。])")
+
+
+def _match_marker(line: str):
+    for pattern, level in _MARKERS:
+        match = pattern.match(line)
+        if match:
+            return match.group(1), level, line[match.end() :].strip()
+    return None, None, line
+
+
+def summarize_table(table_html: str, max_headers: int = 8) -> Dict[str, Any]:
+    """
+    표를 행/열 수와 머리글로 요약합니다.
+
+    Returns:
+        {"type": "table", "rows": 행 수, "cols": 열 수, "headers": 첫 행 셀 텍스트}
+    """
+    try:
+        soup = BeautifulSoup(table_html, "lxml")
+        rows = soup.find_all("tr")
+        cells = [row.find_all(["th", "td"]) for row in rows]
+        headers = [cell.get_text(" ", strip=True)[:20] for cell in (cells or [[]])[0]]
+        caption = soup.find("caption")
+        summary = {
+            "type": "table",
+            "rows": len(rows),
+            "cols": max((len(row) for row in cells), default=0),
+            "headers": headers[:max_headers],
+        }
+        if caption:
+            summary["caption"] = caption.get_text(" ", strip=True)[:50]
+        return summary
+    except Exception as e:
+        logger.warning(f"표 요약 실패: {str(e)}")
+        return {"type": "table", "rows": 0, "cols": 0, "headers": []}
+
+
+def parse_document(text: str) -> Dict[str, Any]:
+    """
+    정제된 문서를 구조 트리로 파싱합니다.
+
+    Args:
+        text: clean_html_content로 정제된 문서 내용 (표는 HTML 유지)
+
+    Returns:
+        {"nodes": [...], "stats": {...}} 형태의 구조 트리.
+        노드는 {"marker", "level", "text", "children"} 또는 표 요약입니다.
+    """
+    root: Dict[str, Any] = {"level": -1, "children": []}
+    stack = [root]
+    paragraph_count = 0
+    list_items = 0
+    table_count = 0
+    plain_text = []
+
+    def attach(node: Dict[str, Any]) -> None:
+        # 같거나 더 깊은 수준의 노드를 닫고 가장 가까운 상위 노드에 붙임
+        level = node.get("level")
+        if level is not None:
+            while len(stack) > 1 and stack[-1]["level"] >= level:
+                stack.pop()
+        stack[-1]["children"].append(node)
+        if level is not None:
+            stack.append(node)
+
+    for part in _TABLE_PATTERN.split(text or ""):
+        if not part.strip():
+            continue
+        if part.lower().startswith("<table"):
+            table_count += 1
+            attach(summarize_table(part))
+            continue
+
+        for raw_line in part.split("\n"):
+            line = raw_line.strip()
+            if not line:
+                continue
+            plain_text.append(line)
+            marker, level, body = _match_marker(line)
+            if marker is None:
+                # 기호 없는 줄은 직전 노드의 이어지는 문장으로 보거나 독립 문단으로 추가
+                last = stack[-1]
+                if last is not root and not last["children"]:
+                    last["text"] = f"{last['text']} {body}".strip()
+                else:
+                    paragraph_count += 1
+                    attach({"marker": "", "level": None, "text": body, "children": []})
+                continue
+
+            paragraph_count += 1
+            if level >= 2:
+                list_items += 1
+            attach({"marker": marker, "level": level, "text": body, "children": []})
+
+    sentences = _SENTENCE_PATTERN.findall(" ".join(plain_text))
+    sentence_lengths = [len(sentence.strip()) for sentence in sentences]
+    lowered = (text or "").lower()
+    stats = {
+        "paragraph_count": paragraph_count,
+        "sentence_count": len(sentences),
+        "avg_sentence_length": (
+            round(sum(sentence_lengths) / len(sentence_lengths), 1)
+            if sentence_lengths
+            else 0
+        ),
+        "has_table": table_count > 0,
+        "has_list": list_items > 0
+        or any(tag in lowered for tag in ["<ul>", "<ol>", "<li>"]),
+        "has_image": "<img" in lowered,
+        "table_count": table_count,
+    }
+    return {"nodes": root["children"], "stats": stats}
+
+
+def render_skeleton(
+    structure: Dict[str, Any], max_text: int = 60, max_children: int = 6
+) -> str:
+    """
+    구조 트리를 프롬프트용 들여쓰기 텍스트로 변환합니다.
+    각 노드 문장은 max_text자로 자르고, 최상위 제목은 모두 남기되
+    하위 노드는 같은 부모 아래 max_children개까지만 남깁니다.
+    """
+    lines: List[str] = []
+
+    def walk(nodes: List[Dict[str, Any]], depth: int) -> None:
+        for index, node in enumerate(nodes):
+            if depth and index >= max_children:
+                lines.append(f"{'  ' * depth}… (외 {len(nodes) - max_children}개)")
+                break
+            indent = "  " * depth
+            if node.get("type") == "table":
+                headers = " | ".join(node["headers"])
+                caption = f" {node['caption']}" if node.get("caption") else ""
+                lines.append(
+                    f"{indent}[표{caption}] {node['rows']}행×{node['cols']}열: {headers}"
+                )
+                continue
+            text = node["text"]
+            if len(text) > max_text:
+                text = text[:max_text] + "…"
+            lines.append(f"{indent}{node['marker']} {text}".rstrip())
+            walk(node.get("children", []), depth + 1)
+
+    walk(structure.get("nodes", []), 0)
+    return "\n".join(lines)
+
+
+class _StructureCache:
+    """문서 내용별 구조 트리 LRU 캐시 (같은 템플릿을 반복 파싱하지 않도록)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_parse(self, text: str) -> Dict[str, Any]:
+        with self._lock:
+            structure = self._entries.get(text)
+            if structure is not None:
+                self._entries.move_to_end(text)
+                return structure
+
+        structure = parse_document(text)
+        with self._lock:
+            self._entries[text] = structure
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return structure
+
+
+_structure_cache = _StructureCache(Config.DOC_STRUCTURE_CACHE_SIZE)
+
+
+def get_document_structure(text: str) -> Dict[str, Any]:
+    """
+    문서 구조 트리를 반환합니다. 같은 내용은 캐시된 결과를 재사용합니다.
+    반환값은 여러 호출자가 공유하므로 수정하지 마세요.
+    """
+    return _structure_cache.get_or_parse(text or "")
+
+
+def template_skeleton(template: Dict[str, Any]) -> str:
+    """템플릿 본문의 구조 골격 텍스트를 반환합니다. (템플릿별 캐시)"""
+    return render_skeleton(
+        get_document_structure(template.get("content", "")),
+        max_text=Config.DOC_SKELETON_MAX_TEXT,
+    )
@@ -4,6 +4,7 @@ HTML 콘텐츠 처리 및 변환 관련 기능을 제공합니다.
 """
 
 import re
+from typing import List
 from bs4 import BeautifulSoup
 from utils.logging import logger
 
@@ -82,3 +83,66 @@ def get_preview_content(text, max_length=500):
             break
 
     return result.strip() + "..." if len(text) > len(result) else result
+
+
+def split_document_blocks(text: str) -> List[str]:
+    """
+    문서를 구조 단위 블록으로 분리합니다.
+    표(<table>)는 하나의 블록으로 유지하고, 나머지 텍스트는 □/○ 문단 단위로 나눕니다.
+
+    Args:
+        text: clean_html_content로 정제된 문서 내용
+
+    Returns:
+        블록 목록
+    """
+    if not text:
+        return []
+
+    blocks = []
+    for part in re.split(r"(<table[\s\S]*?</table>)", text, flags=re.IGNORECASE):
+        if not part.strip():
+            continue
+        if part.lower().startswith("<table"):
+            blocks.append(part)
+            continue
+        blocks.extend(
+            para.strip() for para in re.split(r"\n(?=[□○])", part) if para.strip()
+        )
+    return blocks
+
+
+def chunk_document(text: str, max_chars: int) -> List[str]:
+    """
+    문서를 구조 단위 블록으로 나눈 뒤 max_chars 이하의 청크로 묶습니다.
+    하나의 블록이 max_chars를 넘으면 줄 단위, 그래도 길면 글자 단위로 자릅니다.
+
+    Args:
+        text: clean_html_content로 정제된 문서 내용
+        max_chars: 청크당 최대 글자 수
+
+    Returns:
+        청크 목록
+    """
+    pieces = []
+    for block in split_document_blocks(text):
+        if len(block) <= max_chars:
+            pieces.append(block)
+            continue
+        for line in block.split("\n"):
+            pieces.extend(
+                line[i : i + max_chars] for i in range(0, len(line), max_chars)
+            )
+
+    chunks = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + len(piece) + 1 > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current}\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+
+    return chunks
@@ -0,0 +1,256 @@
+"""
+백그라운드 작업 실행 유틸리티
+LLM 호출처럼 오래 걸리는 작업을 제한된 작업자 풀에서 실행하고 상태를 추적합니다.
+"""
+
+import time
+import uuid
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from flask import current_app, has_app_context
+from config import Config
+from utils.logging import logger
+
+# 작업 상태 값
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+FINISHED_STATUSES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+# 현재 스레드(컨텍스트)에서 실행 중인 작업 (작업 밖에서는 None)
+current_job: contextvars.ContextVar[Optional["Job"]] = contextvars.ContextVar(
+    "current_job", default=None
+)
+
+
+class JobCancelledError(Exception):
+    """작업 취소 요청이 감지되었을 때 발생하는 예외"""
+
+
+class JobQueueFullError(Exception):
+    """대기 중인 작업 수가 한도를 초과했을 때 발생하는 예외"""
+
+
+class Job:
+    """백그라운드 작업 상태 객체"""
+
+    def __init__(
+        self, kind: str, owner: Optional[int] = None, priority: Optional[str] = None
+    ):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.owner = owner
+        self.status = JOB_QUEUED
+        self.progress = 0
+        self.message = "대기 중"
+        self.result: Any = None
+        self.error: Optional[str] = None
+        # 실패 원인 예외 (응답 상태 코드 결정용, API 응답에는 포함하지 않음)
+        self.exception: Optional[BaseException] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.future = None
+        # 작업 안에서 실행되는 LLM 호출의 우선순위 등급 (None이면 background)
+        self.priority = priority
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancel_requested(self) -> bool:
+        """취소 요청 여부"""
+        return self._cancel_event.is_set()
+
+    @property
+    def finished(self) -> bool:
+        """작업 종료 여부"""
+        return self.status in FINISHED_STATUSES
+
+    def check_cancelled(self) -> None:
+        """취소 요청이 있으면 JobCancelledError를 발생시킵니다."""
+        if self.cancel_requested:
+            raise JobCancelledError(f"작업이 취소되었습니다: {self.id}")
+
+    def update_progress(self, progress: int, message: Optional[str] = None) -> None:
+        """
+        진행률을 갱신합니다. 진행률 갱신 시점마다 취소 여부를 확인합니다.
+
+        Args:
+            progress: 진행률 (0~100)
+            message: 현재 단계 설명
+        """
+        self.check_cancelled()
+        self.progress = max(0, min(100, int(progress)))
+        if message:
+            self.message = message
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API 응답용 사전으로 변환합니다."""
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobManager:
+    """제한된 작업자 풀과 대기열 한도를 갖는 인프로세스 작업 관리자
+
+    작업 상태는 프로세스 메모리에 보관되므로, 여러 워커 프로세스 환경에서는
+    작업을 제출한 워커에서만 상태를 조회할 수 있습니다.
+    """
+
+    def __init__(
+        self, max_workers: int = 4, max_pending: int = 32, retention_seconds: int = 3600
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retention_seconds = retention_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="govdraft-job"
+        )
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def _active_count(self) -> int:
+        return sum(1 for job in self._jobs.values() if not job.finished)
+
+    def submit(
+        self,
+        kind: str,
+        fn: Callable[..., Any],
+        *args,
+        owner: Optional[int] = None,
+        priority: Optional[str] = None,
+        **kwargs,
+    ) -> Job:
+        """
+        작업을 제출합니다. 함수는 첫 번째 인자로 Job 객체를 받습니다.
+
+        Args:
+            kind: 작업 종류
+            fn: 실행할 함수 (job, *args, **kwargs)
+            owner: 작업 소유 사용자 ID
+            priority: 작업 안의 LLM 호출 우선순위 등급 (None이면 background)
+
+        Returns:
+            생성된 Job 객체
+
+        Raises:
+            JobQueueFullError: 실행/대기 중인 작업 수가 한도를 초과한 경우
+        """
+        self._cleanup()
+
+        with self._lock:
+            if self._active_count() >= self.max_workers + self.max_pending:
+                raise JobQueueFullError("작업 대기열이 가득 찼습니다.")
+            job = Job(kind, owner=owner, priority=priority)
+            self._jobs[job.id] = job
+
+        # 요청 컨텍스트 변수와 Flask 앱을 작업 스레드로 전달
+        app = current_app._get_current_object() if has_app_context() else None
+        context = contextvars.copy_context()
+        job.future = self._executor.submit(
+            context.run, self._run, job, app, fn, args, kwargs
+        )
+        logger.info(f"작업 제출: id={job.id}, 종류={kind}")
+        return job
+
+    def _run(self, job: Job, app, fn, args, kwargs) -> None:
+        if job.cancel_requested:
+            self._finish(job, JOB_CANCELLED, message="취소됨")
+            return
+
+        job.status = JOB_RUNNING
+        job.started_at = time.time()
+        job.message = "실행 중"
+        current_job.set(job)
+
+        try:
+            if app is not None:
+                with app.app_context():
+                    result = fn(job, *args, **kwargs)
+            else:
+                result = fn(job, *args, **kwargs)
+            job.result = result
+            job.progress = 100
+            self._finish(job, JOB_SUCCEEDED, message="완료")
+        except JobCancelledError:
+            self._finish(job, JOB_CANCELLED, message="취소됨")
+        except Exception as e:
+            logger.exception(f"작업 실행 중 오류: id={job.id}, 종류={job.kind}")
+            job.error = str(e)
+            job.exception = e
+            self._finish(job, JOB_FAILED, message="실패")
+
+    def _finish(self, job: Job, status: str, message: str) -> None:
+        job.status = status
+        job.message = message
+        job.finished_at = time.time()
+        elapsed = job.finished_at - job.created_at
+        logger.info(
+            f"작업 종료: id={job.id}, 종류={job.kind}, 상태={status}, "
+            f"소요 시간={elapsed:.2f}초"
+        )
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """작업을 조회합니다."""
+        return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        """대기/실행 중인 작업 수와 작업자 수를 반환합니다."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return {
+            "queued": sum(1 for job in jobs if job.status == JOB_QUEUED),
+            "running": sum(1 for job in jobs if job.status == JOB_RUNNING),
+            "max_workers": self.max_workers,
+        }
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        작업 취소를 요청합니다. 대기 중인 작업은 즉시 취소되고,
+        실행 중인 작업은 다음 진행률 갱신 시점에 중단됩니다.
+
+        Returns:
+            취소 요청이 접수되었는지 여부
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return False
+
+        job._cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            self._finish(job, JOB_CANCELLED, message="취소됨")
+        logger.info(f"작업 취소 요청: id={job_id}")
+        return True
+
+    def _cleanup(self) -> None:
+        """보관 기간이 지난 종료 작업을 제거합니다."""
+        threshold = time.time() - self.retention_seconds
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job.finished and job.finished_at < threshold
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+
+# 싱글톤 작업 관리자
+job_manager = JobManager(
+    max_workers=Config.JOB_MAX_WORKERS,
+    max_pending=Config.JOB_MAX_PENDING,
+    retention_seconds=Config.JOB_RETENTION_SECONDS,
+)
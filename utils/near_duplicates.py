@@ -0,0 +1,191 @@
+"""
+유사 중복 문서 탐지 유틸리티
+부처가 거의 같은 보도자료를 다시 게시하는 경우가 많아, 문자 shingle의 MinHash
+서명과 LSH(밴드별 버킷)로 중복 후보를 찾고 추정 자카드 유사도로 확인합니다.
+검색 결과 묶기와 프롬프트에 넣을 템플릿 중복 제거에 사용합니다.
+"""
+
+import re
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from config import Config
+from utils.logging import logger
+
+_SPACE_PATTERN = re.compile(r"\s+")
+
+
+class NearDuplicateDetector:
+    """MinHash/LSH 기반 유사 중복 탐지기"""
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 5,
+        max_chars: int = 20000,
+        seed: int = 1,
+    ):
+        """
+        Args:
+            threshold: 중복으로 볼 최소 추정 자카드 유사도
+            num_perm: MinHash 해시 함수 수 (bands로 나누어 떨어져야 함)
+            bands: LSH 밴드 수 (밴드가 많을수록 낮은 유사도도 후보가 됨)
+            shingle_size: 문자 shingle 길이
+            max_chars: 문서별로 비교할 최대 글자 수
+            seed: 해시 함수 계수 생성용 시드 (프로세스 간 같은 서명)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands로 나누어 떨어져야 합니다.")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.max_chars = max_chars
+
+        # multiply-shift 해시 계수: h(x) = (a * x + b) mod 2^64 의 상위 32비트
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2**63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+
+    @staticmethod
+    def document_text(item: Dict[str, Any]) -> str:
+        """비교에 사용할 항목 텍스트 (제목 + 본문)"""
+        return f"{item.get('title', '')} {item.get('content', '')}"
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        텍스트의 MinHash 서명을 계산합니다.
+
+        Returns:
+            uint32 서명 배열, 텍스트가 비어 있으면 None
+        """
+        text = _SPACE_PATTERN.sub(" ", text[: self.max_chars].lower()).strip()
+        if not text:
+            return None
+        size = self.shingle_size
+        shingles = {text[i : i + size] for i in range(max(1, len(text) - size + 1))}
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        with np.errstate(over="ignore"):
+            values = (
+                self._a[:, None] * hashes[None, :] + self._b[:, None]
+            ) >> np.uint64(32)
+        return values.min(axis=1).astype(np.uint32)
+
+    def find_groups(self, texts: List[str]) -> List[List[int]]:
+        """
+        유사 중복 문서 그룹을 찾습니다.
+
+        Returns:
+            2개 이상인 그룹의 인덱스 목록 (그룹 안은 입력 순서)
+        """
+        signatures = [self.signature(text) for text in texts]
+        rows = self.num_perm // self.bands
+
+        # 밴드별로 서명 조각이 같은 문서를 후보 쌍으로 모음
+        candidates = set()
+        for band in range(self.bands):
+            buckets: Dict[bytes, List[int]] = {}
+            for index, sig in enumerate(signatures):
+                if sig is None:
+                    continue
+                key = sig[band * rows : (band + 1) * rows].tobytes()
+                buckets.setdefault(key, []).append(index)
+            for members in buckets.values():
+                for i, first in enumerate(members):
+                    for second in members[i + 1 :]:
+                        candidates.add((first, second))
+
+        # 추정 자카드 유사도로 확인한 쌍을 union-find로 묶음
+        parent = list(range(len(texts)))
+
+        def find(index: int) -> int:
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        for first, second in candidates:
+            similarity = np.mean(signatures[first] == signatures[second])
+            if similarity >= self.threshold:
+                root_first, root_second = find(first), find(second)
+                if root_first != root_second:
+                    parent[max(root_first, root_second)] = min(root_first, root_second)
+
+        groups: Dict[int, List[int]] = {}
+        for index in range(len(texts)):
+            groups.setdefault(find(index), []).append(index)
+        return [members for members in groups.values() if len(members) > 1]
+
+    def collapse_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        검색 결과에서 유사 중복 항목을 첫 항목 하나로 묶습니다.
+        대표 항목에는 similarCount와 묶인 항목 목록(duplicates)이 추가됩니다.
+        """
+        groups = self.find_groups([self.document_text(item) for item in items])
+        if not groups:
+            return items
+
+        duplicates_of = {}
+        for members in groups:
+            for index in members[1:]:
+                duplicates_of[index] = members[0]
+
+        collapsed = {}
+        for index, item in enumerate(items):
+            if index not in duplicates_of:
+                collapsed[index] = dict(item)
+        for index, first in sorted(duplicates_of.items()):
+            representative = collapsed[first]
+            representative.setdefault("duplicates", []).append(items[index])
+            representative["similarCount"] = len(representative["duplicates"])
+
+        logger.info(
+            f"유사 중복 검색 결과 {len(duplicates_of)}건을 {len(groups)}개 항목으로 묶음"
+        )
+        return list(collapsed.values())
+
+    def drop_redundant(
+        self, templates: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        프롬프트에 넣을 템플릿에서 앞서 선택한 템플릿과 거의 같은 템플릿을 제외합니다.
+
+        Returns:
+            (남길 템플릿 목록, 제외한 템플릿 정보 목록 [{id, title, duplicate_of}])
+        """
+        groups = self.find_groups([self.document_text(t) for t in templates])
+        if not groups:
+            return templates, []
+
+        dropped = {}
+        for members in groups:
+            for index in members[1:]:
+                dropped[index] = {
+                    "id": templates[index].get("id"),
+                    "title": templates[index].get("title", ""),
+                    "duplicate_of": templates[members[0]].get("id"),
+                }
+
+        kept = [t for index, t in enumerate(templates) if index not in dropped]
+        redundant = [dropped[index] for index in sorted(dropped)]
+        logger.warning(f"유사 중복 템플릿 제외: {redundant}")
+        return kept, redundant
+
+
+# 유사 중복 탐지기 (비활성화 시 None)
+near_duplicate_detector = (
+    NearDuplicateDetector(
+        threshold=Config.NEAR_DUP_THRESHOLD,
+        num_perm=Config.NEAR_DUP_NUM_PERM,
+        bands=Config.NEAR_DUP_BANDS,
+        shingle_size=Config.NEAR_DUP_SHINGLE_SIZE,
+    )
+    if Config.NEAR_DUP_ENABLED
+    else None
+)
@@ -0,0 +1,83 @@
+"""
+비밀번호 해시 유틸리티
+CPU를 많이 쓰는 비밀번호 해시 생성과 검증을 전용 스레드 풀에서 실행합니다.
+동시 실행 수와 대기 수를 제한하여 로그인이 몰려도 다른 요청이 굶지 않도록 하고,
+한도를 넘으면 기다리지 않고 즉시 거부합니다.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional
+from werkzeug.security import generate_password_hash, check_password_hash
+from config import Config
+from utils.logging import logger
+
+
+class PasswordHasherBusyError(Exception):
+    """해시 대기열이 가득 차 요청을 처리할 수 없을 때 발생하는 예외"""
+
+
+class PasswordHasher:
+    """제한된 스레드 풀에서 비밀번호를 해시하고 검증하는 클래스"""
+
+    def __init__(
+        self,
+        method: str = "scrypt",
+        max_workers: int = 2,
+        max_queue: int = 16,
+        timeout: Optional[float] = 30.0,
+    ):
+        """
+        Args:
+            method: werkzeug 해시 방식 (예: "scrypt", "pbkdf2:sha256:600000")
+            max_workers: 동시에 해시를 계산할 스레드 수
+            max_queue: 실행 중인 작업 외에 대기할 수 있는 작업 수
+            timeout: 결과를 기다리는 최대 시간(초)
+        """
+        self.method = method
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        # 저장된 해시의 방식 부분 (예: "scrypt:32768:8:1")과 비교하여 재해시 여부 판단
+        self._prefix = generate_password_hash("", method).split("$", 1)[0]
+
+    def _run(self, func, *args):
+        if not self._slots.acquire(blocking=False):
+            logger.warning("비밀번호 해시 대기열이 가득 차 요청 거부")
+            raise PasswordHasherBusyError("비밀번호 처리 요청이 많습니다.")
+        try:
+            future = self._executor.submit(func, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # 아직 시작하지 않은 작업은 취소하여 대기열 자리를 돌려줌
+            future.cancel()
+            logger.warning(
+                f"비밀번호 해시가 {self.timeout}초 안에 끝나지 않아 요청 거부"
+            )
+            raise PasswordHasherBusyError("비밀번호 처리 요청이 많습니다.")
+
+    def hash(self, password: str) -> str:
+        """설정된 방식으로 비밀번호 해시를 생성합니다."""
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash: str, password: str) -> bool:
+        """저장된 해시와 비밀번호가 일치하는지 검증합니다."""
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """저장된 해시가 현재 설정과 다른 방식(비용)으로 만들어졌는지 확인합니다."""
+        return password_hash.split("$", 1)[0] != self._prefix
+
+
+password_hasher = PasswordHasher(
+    method=Config.PASSWORD_HASH_METHOD,
+    max_workers=Config.PASSWORD_HASH_WORKERS,
+    max_queue=Config.PASSWORD_HASH_MAX_QUEUE,
+)
@@ -0,0 +1,288 @@
+"""
+유사 템플릿 추천 색인
+캐시된 검색 결과 항목의 제목과 본문으로 한글 문자 n-gram TF-IDF 벡터를 만들고,
+코사인 유사도가 높은 항목을 찾습니다. 희소 행렬은 (문서, n-gram, 빈도) 배열로
+NumPy에 보관하고, 새 항목이 들어오면 행을 덧붙이는 방식으로 색인을 갱신합니다.
+"""
+
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+import numpy as np
+from config import Config
+from utils.logging import logger
+
+# 추천 결과에 포함할 항목 필드 (본문은 제외)
+SUMMARY_FIELDS = ("id", "title", "docType", "date", "description")
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def char_ngrams(text: str, ngram_range=(2, 3)) -> Counter:
+    """
+    단어 경계를 포함한 문자 n-gram 빈도를 계산합니다.
+    띄어쓰기가 불규칙한 한글 문서에서도 어절 일부가 겹치면 유사도가 잡힙니다.
+    """
+    counts = Counter()
+    min_n, max_n = ngram_range
+    for word in _WORD_PATTERN.findall(text.lower()):
+        padded = f" {word} "
+        for n in range(min_n, max_n + 1):
+            if len(padded) < n:
+                continue
+            counts.update(padded[i : i + n] for i in range(len(padded) - n + 1))
+    return counts
+
+
+class _GrowableArray:
+    """뒤에 값을 덧붙일 수 있는 1차원 NumPy 배열 (용량을 두 배씩 늘림)"""
+
+    def __init__(self, dtype, capacity: int = 1024):
+        self._data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def extend(self, values: np.ndarray) -> None:
+        needed = self.size + len(values)
+        if needed > len(self._data):
+            grown = np.empty(max(needed, len(self._data) * 2), dtype=self._data.dtype)
+            grown[: self.size] = self._data[: self.size]
+            self._data = grown
+        self._data[self.size : needed] = values
+        self.size = needed
+
+    @property
+    def view(self) -> np.ndarray:
+        return self._data[: self.size]
+
+
+class SimilarityIndex:
+    """문자 n-gram TF-IDF 기반 유사 항목 색인"""
+
+    # 내용이 바뀌어 무효가 된 행이 이 비율을 넘으면 원소 배열과 어휘를 다시 구성
+    COMPACT_DEAD_FRACTION = 0.25
+    COMPACT_MIN_DEAD_ROWS = 64
+
+    def __init__(self, ngram_range=(2, 3), max_chars: int = 5000):
+        """
+        Args:
+            ngram_range: 사용할 n-gram 길이 범위 (최소, 최대)
+            max_chars: 항목별로 색인할 최대 글자 수 (제목 + 본문)
+        """
+        self.ngram_range = ngram_range
+        self.max_chars = max_chars
+
+        self._lock = threading.Lock()
+        self._vocabulary: Dict[str, int] = {}
+        self._doc_freq = _GrowableArray(np.int32)
+        # 희소 행렬의 0이 아닌 원소 (행 번호, 열 번호, 로그 스케일 빈도)
+        self._rows = _GrowableArray(np.int32, 16384)
+        self._cols = _GrowableArray(np.int32, 16384)
+        self._tf = _GrowableArray(np.float32, 16384)
+        # 행 번호별 항목 요약과 유효 여부 (내용이 바뀐 항목은 새 행으로 추가)
+        self._items: List[Dict[str, Any]] = []
+        self._alive = _GrowableArray(np.bool_)
+        self._row_by_id: Dict[str, int] = {}
+        self._text_by_row: List[str] = []
+        # 행별 원소 구간 (행마다 연속해서 덧붙이므로 시작/끝 위치로 바로 꺼냄)
+        self._row_spans: List[tuple] = []
+        # 항목 추가 후 첫 조회 때 다시 계산하는 정규화 가중치
+        self._weights_cache: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._row_by_id)
+
+    def _document_text(self, item: Dict[str, Any]) -> str:
+        text = f"{item.get('title', '')}\n{item.get('content', '')}"
+        return text[: self.max_chars]
+
+    def add_items(self, items: Iterable[Dict[str, Any]]) -> int:
+        """
+        항목을 색인에 추가합니다. 이미 같은 내용으로 색인된 항목은 건너뜁니다.
+
+        Returns:
+            새로 색인한 항목 수
+        """
+        # n-gram 계산은 잠금 밖에서 수행
+        prepared = []
+        for item in items:
+            item_id = str(item.get("id") or "")
+            if not item_id:
+                continue
+            text = self._document_text(item)
+            prepared.append((item_id, item, text, char_ngrams(text, self.ngram_range)))
+
+        added = 0
+        removed = 0
+        with self._lock:
+            for item_id, item, text, counts in prepared:
+                old_row = self._row_by_id.get(item_id)
+                if old_row is not None:
+                    if self._text_by_row[old_row] == text:
+                        continue
+                    self._remove_row(old_row)
+                    del self._row_by_id[item_id]
+                    removed += 1
+                if not counts:
+                    continue
+
+                row = len(self._items)
+                start = self._cols.size
+                cols = np.fromiter(
+                    (self._term_id(term) for term in counts),
+                    dtype=np.int32,
+                    count=len(counts),
+                )
+                self._rows.extend(np.full(len(cols), row, dtype=np.int32))
+                self._cols.extend(cols)
+                self._tf.extend(
+                    1.0 + np.log(np.fromiter(counts.values(), dtype=np.float32))
+                )
+                np.add.at(self._doc_freq.view, cols, 1)
+
+                self._items.append({k: item.get(k, "") for k in SUMMARY_FIELDS})
+                self._text_by_row.append(text)
+                self._row_spans.append((start, self._cols.size))
+                self._alive.extend(np.array([True]))
+                self._row_by_id[item_id] = row
+                added += 1
+
+            if added or removed:
+                self._weights_cache = None
+            dead_rows = len(self._items) - len(self._row_by_id)
+            if (
+                dead_rows >= self.COMPACT_MIN_DEAD_ROWS
+                and dead_rows > len(self._items) * self.COMPACT_DEAD_FRACTION
+            ):
+                self._compact()
+
+        if added:
+            logger.debug(f"유사 템플릿 색인 {added}건 추가 (전체 {len(self)}건)")
+        return added
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._vocabulary.get(term)
+        if term_id is None:
+            term_id = len(self._vocabulary)
+            self._vocabulary[term] = term_id
+            self._doc_freq.extend(np.zeros(1, dtype=np.int32))
+        return term_id
+
+    def _remove_row(self, row: int) -> None:
+        """행을 무효화하고 문서 빈도에서 제외합니다. (원소 배열은 그대로 둠)"""
+        self._alive.view[row] = False
+        start, end = self._row_spans[row]
+        np.subtract.at(self._doc_freq.view, self._cols.view[start:end], 1)
+        self._text_by_row[row] = ""
+
+    def _compact(self) -> None:
+        """무효 행의 원소를 버리고 남은 행과 어휘에 번호를 다시 매깁니다."""
+        alive = self._alive.view
+        alive_rows = np.flatnonzero(alive)
+        row_map = np.full(len(self._items), -1, dtype=np.int32)
+        row_map[alive_rows] = np.arange(len(alive_rows), dtype=np.int32)
+
+        # 남은 문서에 한 번도 나오지 않는 n-gram은 어휘에서 제거
+        live_terms = self._doc_freq.view > 0
+        col_map = np.full(len(live_terms), -1, dtype=np.int32)
+        col_map[live_terms] = np.arange(int(live_terms.sum()), dtype=np.int32)
+
+        keep = alive[self._rows.view]
+        capacity = max(16384, int(keep.sum()))
+        rows = _GrowableArray(np.int32, capacity)
+        cols = _GrowableArray(np.int32, capacity)
+        tf = _GrowableArray(np.float32, capacity)
+        rows.extend(row_map[self._rows.view[keep]])
+        cols.extend(col_map[self._cols.view[keep]])
+        tf.extend(self._tf.view[keep])
+
+        doc_freq = _GrowableArray(np.int32, max(1024, len(col_map)))
+        doc_freq.extend(self._doc_freq.view[live_terms])
+        alive_flags = _GrowableArray(np.bool_)
+        alive_flags.extend(np.ones(len(alive_rows), dtype=np.bool_))
+
+        spans, offset = [], 0
+        for row in alive_rows:
+            start, end = self._row_spans[row]
+            spans.append((offset, offset + end - start))
+            offset += end - start
+
+        dead_rows = len(self._items) - len(alive_rows)
+        self._vocabulary = {
+            term: int(col_map[term_id])
+            for term, term_id in self._vocabulary.items()
+            if live_terms[term_id]
+        }
+        self._rows, self._cols, self._tf = rows, cols, tf
+        self._doc_freq, self._alive = doc_freq, alive_flags
+        self._items = [self._items[row] for row in alive_rows]
+        self._text_by_row = [self._text_by_row[row] for row in alive_rows]
+        self._row_spans = spans
+        self._row_by_id = {
+            item_id: int(row_map[row]) for item_id, row in self._row_by_id.items()
+        }
+        self._weights_cache = None
+        logger.debug(
+            f"유사 템플릿 색인 정리: 무효 행 {dead_rows}건 제거 (전체 {len(self)}건)"
+        )
+
+    def _weights(self) -> np.ndarray:
+        """현재 문서 수 기준으로 행별 정규화한 TF-IDF 가중치 (원소별) 를 반환합니다."""
+        if self._weights_cache is None:
+            n_docs = len(self._row_by_id)
+            # smooth idf: log((1 + N) / (1 + df)) + 1
+            idf = np.log((1.0 + n_docs) / (1.0 + self._doc_freq.view)) + 1.0
+            weights = (self._tf.view * idf[self._cols.view]).astype(np.float32)
+            norms = np.sqrt(
+                np.bincount(
+                    self._rows.view,
+                    weights=weights * weights,
+                    minlength=len(self._items),
+                )
+            )
+            norms[norms == 0] = 1.0
+            self._weights_cache = weights / norms[self._rows.view].astype(np.float32)
+        return self._weights_cache
+
+    def similar(self, item_id: str, k: int = 5) -> Optional[List[Dict[str, Any]]]:
+        """
+        항목과 코사인 유사도가 높은 항목을 찾습니다.
+
+        Returns:
+            유사도 내림차순 항목 요약 목록 (score 포함), 색인에 없는 항목이면 None
+        """
+        with self._lock:
+            row = self._row_by_id.get(str(item_id))
+            if row is None:
+                return None
+
+            weights = self._weights()
+            rows, cols = self._rows.view, self._cols.view
+
+            # 질의 행의 가중치를 어휘 크기의 밀집 벡터로 펼친 뒤
+            # 원소별로 곱해 행별로 합산 (희소 행렬 x 벡터)
+            start, end = self._row_spans[row]
+            query = np.zeros(len(self._vocabulary), dtype=np.float32)
+            query[cols[start:end]] = weights[start:end]
+
+            scores = np.bincount(
+                rows, weights=weights * query[cols], minlength=len(self._items)
+            )
+            scores[~self._alive.view] = 0
+            scores[row] = 0
+
+            k = min(k, int(np.count_nonzero(scores)))
+            if k <= 0:
+                return []
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [
+                {**self._items[i], "score": round(float(scores[i]), 4)} for i in top
+            ]
+
+
+# 검색 결과 캐시와 함께 갱신되는 유사 템플릿 색인
+similarity_index = SimilarityIndex(
+    ngram_range=(Config.SIMILAR_NGRAM_MIN, Config.SIMILAR_NGRAM_MAX),
+    max_chars=Config.SIMILAR_MAX_CHARS,
+)
@@ -0,0 +1,170 @@
+"""
+추측 실행 관리 유틸리티
+사용자가 템플릿 선택을 마치기 전에 미리 시작한 분석 작업을 세션별로 추적합니다.
+세션마다 가장 최근 선택 하나만 실행하고 이전 선택의 작업은 취소하며,
+추측 실행에 쓴 비용을 사용자별 일일 한도 안으로 제한합니다.
+사용자가 실제로 분석을 요청하면 실행 중인 작업을 넘겨받아(승격) 취소되지 않게 합니다.
+"""
+
+import time
+import threading
+from datetime import date
+from typing import Dict, Optional, Tuple
+from config import Config
+from utils.logging import logger
+from utils.job_queue import job_manager, Job
+
+
+class _Speculation:
+    """세션의 추측 실행 상태"""
+
+    __slots__ = ("owner", "memo_key", "job", "promoted", "touched_at")
+
+    def __init__(self, owner: Optional[int]):
+        self.owner = owner
+        self.memo_key: Optional[str] = None
+        self.job: Optional[Job] = None
+        self.promoted = False
+        self.touched_at = time.time()
+
+
+class SpeculationManager:
+    """세션별 추측 분석 작업과 사용자별 비용 관리자 (프로세스 메모리)
+
+    비용 한도는 세션이 아니라 사용자 ID와 날짜 기준이므로 쿠키를 버려도 초기화되지 않습니다.
+    작업을 시작할 때 예상 비용을 먼저 차감(예약)하고, 분석이 끝나면 실제 비용으로 보정합니다.
+    """
+
+    def __init__(self, daily_budget_krw: float = 50.0, session_ttl: int = 3600):
+        """
+        Args:
+            daily_budget_krw: 사용자별 일일 추측 실행 비용 한도(KRW, 0이면 제한 없음)
+            session_ttl: 마지막 사용 후 세션 상태를 보관할 시간(초)
+        """
+        self.daily_budget_krw = daily_budget_krw
+        self.session_ttl = session_ttl
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, _Speculation] = {}
+        self._spent: Dict[Tuple[int, date], float] = {}
+
+    def _session(self, session_key: str, owner: Optional[int]) -> _Speculation:
+        state = self._sessions.get(session_key)
+        if state is None or state.owner != owner:
+            state = self._sessions[session_key] = _Speculation(owner)
+        state.touched_at = time.time()
+        return state
+
+    def _cleanup(self) -> None:
+        threshold = time.time() - self.session_ttl
+        expired = [
+            key
+            for key, state in self._sessions.items()
+            if state.touched_at < threshold
+            and (state.job is None or state.job.finished)
+        ]
+        for key in expired:
+            del self._sessions[key]
+        today = date.today()
+        for key in [key for key in self._spent if key[1] != today]:
+            del self._spent[key]
+
+    def running(
+        self, session_key: str, owner: Optional[int], memo_key: str
+    ) -> Optional[Job]:
+        """세션에서 같은 입력으로 실행 중인 추측 작업을 반환합니다."""
+        with self._lock:
+            state = self._sessions.get(session_key)
+            if state is None or state.owner != owner or state.memo_key != memo_key:
+                return None
+            if state.job is None or state.job.finished:
+                return None
+            return state.job
+
+    def abandon(self, session_key: str, owner: Optional[int]) -> bool:
+        """
+        세션의 이전 선택에 대한 추측 작업을 취소합니다. (승격된 작업은 유지)
+
+        Returns:
+            취소 요청 여부
+        """
+        with self._lock:
+            state = self._sessions.get(session_key)
+            if state is None or state.owner != owner:
+                return False
+            job, promoted = state.job, state.promoted
+            state.job, state.memo_key, state.promoted = None, None, False
+
+        if job is None or promoted or job.finished:
+            return False
+        logger.info(f"선택이 바뀌어 추측 분석 취소: 작업 ID={job.id}")
+        return job_manager.cancel(job.id)
+
+    def reserve(self, owner: int, cost_krw: float) -> bool:
+        """
+        사용자의 오늘 남은 한도 안이면 예상 비용을 미리 차감합니다.
+
+        Returns:
+            예약 성공 여부 (한도를 넘으면 False)
+        """
+        with self._lock:
+            key = (owner, date.today())
+            spent = self._spent.get(key, 0.0)
+            if self.daily_budget_krw > 0 and spent + cost_krw > self.daily_budget_krw:
+                return False
+            self._spent[key] = spent + cost_krw
+        return True
+
+    def start(
+        self, session_key: str, owner: Optional[int], memo_key: str, job: Job
+    ) -> None:
+        """세션의 현재 추측 작업으로 등록합니다."""
+        with self._lock:
+            self._cleanup()
+            state = self._session(session_key, owner)
+            state.memo_key, state.job, state.promoted = memo_key, job, False
+
+    def settle(self, owner: int, reserved_krw: float, cost_krw: float) -> None:
+        """예약한 예상 비용을 추측 작업이 실제로 사용한 비용으로 보정합니다."""
+        with self._lock:
+            key = (owner, date.today())
+            spent = max(0.0, self._spent.get(key, 0.0) + cost_krw - reserved_krw)
+            self._spent[key] = spent
+        logger.info(
+            f"추측 분석 비용: {cost_krw:.2f}원 (사용자={owner}, 오늘 누적 {spent:.2f}원 / "
+            f"한도 {self.daily_budget_krw:.0f}원)"
+        )
+
+    def promote(self, owner: Optional[int], memo_key: str) -> Optional[Job]:
+        """
+        사용자가 실제로 요청한 입력과 같은 추측 작업을 찾아 일반 작업으로 승격합니다.
+        승격된 작업은 선택이 바뀌어도 취소되지 않고, 이후 LLM 호출은 background 등급으로 실행됩니다.
+
+        Returns:
+            승격된 작업, 없으면 None
+        """
+        with self._lock:
+            for state in self._sessions.values():
+                job = state.job
+                if (
+                    state.owner == owner
+                    and state.memo_key == memo_key
+                    and job is not None
+                    and not job.finished
+                    and not job.cancel_requested
+                ):
+                    state.promoted = True
+                    job.priority = None
+                    logger.info(f"추측 분석 작업 승격: 작업 ID={job.id}")
+                    return job
+        return None
+
+
+# 추측 분석 관리자 (비활성화 시 None)
+speculation_manager = (
+    SpeculationManager(
+        daily_budget_krw=Config.SPECULATIVE_DAILY_BUDGET_KRW,
+        session_ttl=Config.SPECULATIVE_SESSION_TTL,
+    )
+    if Config.SPECULATIVE_ANALYSIS_ENABLED
+    else None
+)
@@ -5,7 +5,7 @@
 
 from functools import lru_cache
 import tiktoken
-from typing import Dict, Union, Optional, overload
+from typing import Dict, List, Union, Optional, overload
 from config import Config
 from utils.logging import logger
 
@@ -106,3 +106,126 @@ def calculate_token_cost(
             "cost_krw": 0,
             "model": model,
         }
+
+
+def build_cache_hit_token_info(
+    original_token_info: Dict[str, Union[int, float, str]],
+) -> Dict[str, Union[int, float, str, bool]]:
+    """
+    캐시 적중 시 반환할 토큰 사용량 정보를 생성합니다.
+    실제 사용량은 0이며, 원래 호출 비용은 절감액으로 기록됩니다.
+
+    Args:
+        original_token_info: 캐시된 응답을 처음 생성할 때의 토큰 사용량 정보
+
+    Returns:
+        절감 정보가 포함된 토큰 사용량 사전
+    """
+    return {
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "total_tokens": 0,
+        "cost_usd": 0,
+        "cost_krw": 0,
+        "model": original_token_info.get("model", "gpt-4o-mini"),
+        "cache_hit": True,
+        "saved_tokens": original_token_info.get("total_tokens", 0),
+        "saved_cost_usd": original_token_info.get("cost_usd", 0),
+        "saved_cost_krw": original_token_info.get("cost_krw", 0),
+    }
+
+
+def merge_token_infos(
+    token_infos: List[Dict[str, Union[int, float, str]]],
+) -> Dict[str, Union[int, float, str]]:
+    """
+    여러 API 호출의 토큰 사용량 정보를 하나로 합산합니다.
+
+    Args:
+        token_infos: 호출별 토큰 사용량 정보 목록
+
+    Returns:
+        합산된 토큰 사용량 정보 (호출 수와 캐시 적중 수 포함)
+    """
+    merged = {
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "total_tokens": 0,
+        "cost_usd": 0.0,
+        "cost_krw": 0.0,
+        "model": next(
+            (info["model"] for info in token_infos if info.get("model")),
+            "gpt-4o-mini",
+        ),
+        "calls": 0,
+        "cache_hits": 0,
+        "saved_tokens": 0,
+        "saved_cost_usd": 0.0,
+        "saved_cost_krw": 0.0,
+    }
+
+    for info in token_infos:
+        if not info or "error" in info:
+            continue
+        merged["calls"] += 1
+        for key in (
+            "input_tokens",
+            "output_tokens",
+            "total_tokens",
+            "cost_usd",
+            "cost_krw",
+            "saved_tokens",
+            "saved_cost_usd",
+            "saved_cost_krw",
+        ):
+            merged[key] += info.get(key, 0)
+        if info.get("cache_hit"):
+            merged["cache_hits"] += 1
+
+    for key in ("cost_usd", "saved_cost_usd"):
+        merged[key] = round(merged[key], 6)
+    for key in ("cost_krw", "saved_cost_krw"):
+        merged[key] = round(merged[key], 2)
+
+    return merged
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """모델의 tiktoken 인코딩을 반환합니다. 불러올 수 없으면 None을 반환합니다."""
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"토큰 인코딩 로드 실패, 글자 수로 추정합니다: {str(e)}")
+        return None
+
+
+def estimate_request_tokens(
+    messages: List[Dict[str, str]],
+    model: str = "gpt-4o-mini",
+    max_tokens: Optional[int] = None,
+) -> int:
+    """
+    API 호출 전에 요청이 사용할 토큰 수를 추정합니다. (입력 토큰 + 예상 출력 토큰)
+
+    Args:
+        messages: 메시지 리스트
+        model: 사용할 모델 이름
+        max_tokens: 최대 생성 토큰 수 (없으면 설정된 기본 예상값 사용)
+
+    Returns:
+        예상 토큰 수
+    """
+    encoding = _get_encoding(model)
+
+    def count(text: str) -> int:
+        # 인코딩을 불러올 수 없으면 글자 수로 보수적으로 추정 (한글은 글자당 약 1토큰)
+        return len(encoding.encode(text)) if encoding else len(text)
+
+    # 메시지마다 역할/구분자 토큰이 약 4개씩 추가됨
+    prompt_tokens = sum(count(message.get("content") or "") + 4 for message in messages)
+    completion_tokens = max_tokens or Config.OPENAI_DEFAULT_COMPLETION_TOKENS
+    return prompt_tokens + completion_tokens
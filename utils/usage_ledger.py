@@ -0,0 +1,381 @@
+"""
+토큰 사용량 장부
+OpenAI 호출별 사용량을 메모리에 모았다가 백그라운드 스레드에서 일괄 저장하고,
+사용자/일자/모델별 집계 테이블과 일일 예산 검사를 제공합니다.
+"""
+
+import os
+import time
+import atexit
+import threading
+import contextvars
+from datetime import datetime, date, timedelta
+from typing import Any, Dict, List, Optional
+from sqlalchemy import func, insert
+from sqlalchemy.dialects import sqlite, postgresql
+from config import Config, db
+from utils.logging import logger
+
+
+# 현재 요청/작업의 사용자 ID (비로그인 또는 알 수 없으면 None)
+# 작업 대기열과 비동기 클라이언트는 제출 시점의 컨텍스트를 복사하므로 하위 호출까지 전달됩니다.
+current_usage_owner: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar(
+    "current_usage_owner", default=None
+)
+
+# 집계 테이블에서 비로그인 사용량을 나타내는 사용자 ID
+ANONYMOUS_USER_ID = 0
+
+
+class BudgetExceededError(Exception):
+    """사용자의 일일 사용 예산을 초과했을 때 발생하는 예외"""
+
+    def __init__(self, user_id: int, spent_krw: float, limit_krw: float):
+        super().__init__(
+            f"일일 사용 예산을 초과했습니다. (사용: {spent_krw:.2f}원 / 한도: {limit_krw:.2f}원)"
+        )
+        self.user_id = user_id
+        self.spent_krw = spent_krw
+        self.limit_krw = limit_krw
+
+
+class UsageRecord(db.Model):
+    """OpenAI 호출별 사용량 기록"""
+
+    __tablename__ = "usage_records"
+    __table_args__ = (
+        db.Index("ix_usage_records_user_created", "user_id", "created_at"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, nullable=True)
+    model = db.Column(db.String(50), nullable=False)
+    input_tokens = db.Column(db.Integer, default=0)
+    output_tokens = db.Column(db.Integer, default=0)
+    cost_usd = db.Column(db.Float, default=0.0)
+    cost_krw = db.Column(db.Float, default=0.0)
+    created_at = db.Column(db.DateTime, nullable=False)
+
+
+class UsageDaily(db.Model):
+    """사용자/일자(UTC)/모델별 사용량 집계"""
+
+    __tablename__ = "usage_daily"
+
+    user_id = db.Column(db.Integer, primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    model = db.Column(db.String(50), primary_key=True)
+    requests = db.Column(db.Integer, default=0, nullable=False)
+    input_tokens = db.Column(db.Integer, default=0, nullable=False)
+    output_tokens = db.Column(db.Integer, default=0, nullable=False)
+    cost_usd = db.Column(db.Float, default=0.0, nullable=False)
+    cost_krw = db.Column(db.Float, default=0.0, nullable=False)
+
+
+class UsageBudget(db.Model):
+    """사용자별 일일 예산 (없으면 USAGE_DAILY_BUDGET_KRW 기본값 적용)"""
+
+    __tablename__ = "usage_budgets"
+
+    user_id = db.Column(db.Integer, primary_key=True)
+    daily_limit_krw = db.Column(db.Float, nullable=False)
+
+
+class UsageLedger:
+    """메모리 버퍼 + 백그라운드 일괄 저장 방식의 사용량 장부"""
+
+    def __init__(
+        self,
+        flush_interval: float = 5.0,
+        batch_size: int = 200,
+        max_buffer: int = 10000,
+        default_budget_krw: float = 0.0,
+        total_cache_ttl: float = 30.0,
+    ):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_buffer = max_buffer
+        self.default_budget_krw = default_budget_krw
+        self.total_cache_ttl = total_cache_ttl
+
+        self._app = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buffer: List[Dict[str, Any]] = []
+        self._flushing: List[Dict[str, Any]] = []
+        # (사용자 ID, 일자) -> [누적 비용(KRW), 조회 시각]
+        self._totals: Dict[tuple, List[float]] = {}
+        # 사용자 ID -> (일일 한도, 조회 시각)
+        self._budgets: Dict[int, tuple] = {}
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = None
+
+    def init_app(self, app) -> None:
+        """저장에 사용할 Flask 앱을 등록합니다."""
+        self._app = app
+        atexit.register(self.flush)
+
+    def _ensure_thread(self) -> None:
+        """저장 스레드를 시작합니다. fork된 워커 프로세스에서는 새로 시작합니다."""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._flush_loop, name="usage-ledger", daemon=True
+            )
+            self._thread.start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"사용량 저장 실패: {str(e)}")
+
+    def record(self, token_info: Dict[str, Any], user_id: Optional[int] = None) -> None:
+        """
+        호출 사용량을 버퍼에 추가합니다. 데이터베이스 저장은 백그라운드에서 수행됩니다.
+
+        Args:
+            token_info: calculate_token_cost 결과
+            user_id: 사용자 ID (None이면 current_usage_owner 사용)
+        """
+        if token_info.get("cache_hit"):
+            return
+
+        if user_id is None:
+            user_id = current_usage_owner.get()
+        entry = {
+            "user_id": user_id,
+            "model": token_info.get("model") or Config.OPENAI_MODEL,
+            "input_tokens": int(token_info.get("input_tokens", 0)),
+            "output_tokens": int(token_info.get("output_tokens", 0)),
+            "cost_usd": float(token_info.get("cost_usd", 0)),
+            "cost_krw": float(token_info.get("cost_krw", 0)),
+            "created_at": datetime.utcnow(),
+        }
+
+        with self._lock:
+            if len(self._buffer) >= self.max_buffer:
+                # 데이터베이스 장애가 길어져도 메모리 사용량은 제한
+                self._buffer.pop(0)
+                logger.warning("사용량 버퍼가 가득 차 가장 오래된 기록을 버립니다.")
+            self._buffer.append(entry)
+            total = self._totals.get(self._total_key(user_id, entry["created_at"]))
+            if total is not None:
+                total[0] += entry["cost_krw"]
+            should_wake = len(self._buffer) >= self.batch_size
+
+        self._ensure_thread()
+        if should_wake:
+            self._wakeup.set()
+
+    @staticmethod
+    def _total_key(user_id: Optional[int], created_at: datetime) -> tuple:
+        return (user_id or ANONYMOUS_USER_ID, created_at.date())
+
+    def flush(self) -> int:
+        """
+        버퍼의 사용량을 기록 테이블과 일일 집계 테이블에 일괄 저장합니다.
+
+        Returns:
+            저장한 기록 수
+        """
+        if self._app is None:
+            return 0
+
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+                self._flushing = batch
+            if not batch:
+                return 0
+
+            try:
+                with self._app.app_context():
+                    self._write(batch)
+            except Exception:
+                # 다음 주기에 다시 저장하도록 버퍼 앞에 되돌림
+                with self._lock:
+                    self._buffer[:0] = batch[: self.max_buffer - len(self._buffer)]
+                raise
+            finally:
+                with self._lock:
+                    self._flushing = []
+
+        logger.debug(f"사용량 {len(batch)}건 저장 완료")
+        return len(batch)
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        rollups: Dict[tuple, Dict[str, Any]] = {}
+        for entry in batch:
+            user_id, day = self._total_key(entry["user_id"], entry["created_at"])
+            key = (user_id, day, entry["model"])
+            rollup = rollups.setdefault(
+                key,
+                {
+                    "user_id": user_id,
+                    "day": day,
+                    "model": entry["model"],
+                    "requests": 0,
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "cost_usd": 0.0,
+                    "cost_krw": 0.0,
+                },
+            )
+            rollup["requests"] += 1
+            for field in ("input_tokens", "output_tokens", "cost_usd", "cost_krw"):
+                rollup[field] += entry[field]
+
+        db.session.execute(insert(UsageRecord), batch)
+        self._upsert_rollups(list(rollups.values()))
+        db.session.commit()
+
+    def _upsert_rollups(self, rows: List[Dict[str, Any]]) -> None:
+        """일일 집계를 증분 갱신합니다. 여러 프로세스가 동시에 저장해도 합계가 유지됩니다."""
+        fields = ("requests", "input_tokens", "output_tokens", "cost_usd", "cost_krw")
+        dialect = db.session.get_bind().dialect.name
+
+        if dialect in ("sqlite", "postgresql"):
+            dialect_module = sqlite if dialect == "sqlite" else postgresql
+            statement = dialect_module.insert(UsageDaily)
+            statement = statement.on_conflict_do_update(
+                index_elements=["user_id", "day", "model"],
+                set_={
+                    field: getattr(UsageDaily, field)
+                    + getattr(statement.excluded, field)
+                    for field in fields
+                },
+            )
+            db.session.execute(statement, rows)
+            return
+
+        for row in rows:
+            updated = UsageDaily.query.filter_by(
+                user_id=row["user_id"], day=row["day"], model=row["model"]
+            ).update(
+                {
+                    getattr(UsageDaily, field): getattr(UsageDaily, field) + row[field]
+                    for field in fields
+                }
+            )
+            if not updated:
+                db.session.add(UsageDaily(**row))
+
+    def running_total(self, user_id: int, day: Optional[date] = None) -> float:
+        """
+        사용자의 일일 누적 비용(KRW)을 반환합니다.
+        저장된 집계와 아직 저장되지 않은 버퍼를 합산하고, total_cache_ttl 동안 캐시합니다.
+        """
+        day = day or datetime.utcnow().date()
+        key = (user_id or ANONYMOUS_USER_ID, day)
+        now = time.time()
+
+        with self._lock:
+            cached = self._totals.get(key)
+            if cached is not None and now - cached[1] < self.total_cache_ttl:
+                return cached[0]
+
+        stored = (
+            db.session.query(func.coalesce(func.sum(UsageDaily.cost_krw), 0.0))
+            .filter(UsageDaily.user_id == key[0], UsageDaily.day == day)
+            .scalar()
+        )
+        with self._lock:
+            pending = sum(
+                entry["cost_krw"]
+                for entry in self._buffer + self._flushing
+                if self._total_key(entry["user_id"], entry["created_at"]) == key
+            )
+            self._totals[key] = [float(stored) + pending, now]
+            return self._totals[key][0]
+
+    def daily_budget(self, user_id: int) -> float:
+        """사용자의 일일 예산(KRW)을 반환합니다. 0이면 제한이 없습니다."""
+        now = time.time()
+        cached = self._budgets.get(user_id)
+        if cached is not None and now - cached[1] < self.total_cache_ttl:
+            return cached[0]
+
+        budget = db.session.get(UsageBudget, user_id)
+        limit = budget.daily_limit_krw if budget else self.default_budget_krw
+        self._budgets[user_id] = (limit, now)
+        return limit
+
+    def check_budget(self, user_id: Optional[int] = None) -> None:
+        """
+        OpenAI 호출 전에 사용자의 일일 예산을 확인합니다.
+        예산 조회는 앱 컨텍스트가 있을 때만 수행하며, 초과 시 BudgetExceededError를 발생시킵니다.
+        """
+        if user_id is None:
+            user_id = current_usage_owner.get()
+        if user_id is None or self._app is None:
+            return
+
+        with self._app.app_context():
+            limit = self.daily_budget(user_id)
+            if limit <= 0:
+                return
+            spent = self.running_total(user_id)
+
+        if spent >= limit:
+            logger.warning(
+                f"일일 예산 초과로 호출 거부: 사용자={user_id}, "
+                f"사용={spent:.2f}원, 한도={limit:.2f}원"
+            )
+            raise BudgetExceededError(user_id, spent, limit)
+
+    def summary(self, user_id: int, days: int = 30) -> Dict[str, Any]:
+        """사용자의 최근 일별 사용량 집계와 오늘의 예산 현황을 반환합니다."""
+        today = datetime.utcnow().date()
+        rows = (
+            UsageDaily.query.filter(
+                UsageDaily.user_id == user_id,
+                UsageDaily.day > today - timedelta(days=days),
+            )
+            .order_by(UsageDaily.day.desc(), UsageDaily.model)
+            .all()
+        )
+        limit = self.daily_budget(user_id)
+        spent = self.running_total(user_id, today)
+        return {
+            "today": {
+                "day": today.isoformat(),
+                "cost_krw": round(spent, 2),
+                "budget_krw": limit or None,
+                "remaining_krw": round(max(limit - spent, 0.0), 2) if limit else None,
+            },
+            "daily": [
+                {
+                    "day": row.day.isoformat(),
+                    "model": row.model,
+                    "requests": row.requests,
+                    "input_tokens": row.input_tokens,
+                    "output_tokens": row.output_tokens,
+                    "cost_usd": round(row.cost_usd, 6),
+                    "cost_krw": round(row.cost_krw, 2),
+                }
+                for row in rows
+            ],
+        }
+
+
+# 싱글톤 사용량 장부 (비활성화 시 None)
+usage_ledger = (
+    UsageLedger(
+        flush_interval=Config.USAGE_FLUSH_INTERVAL,
+        batch_size=Config.USAGE_FLUSH_BATCH_SIZE,
+        max_buffer=Config.USAGE_MAX_BUFFER,
+        default_budget_krw=Config.USAGE_DAILY_BUDGET_KRW,
+        total_cache_ttl=Config.USAGE_TOTAL_CACHE_TTL,
+    )
+    if Config.USAGE_LEDGER_ENABLED
+    else None
+)
@@ -0,0 +1,65 @@
+"""
+사용자 캐시
+로그인 세션의 사용자 조회(load_user)를 위한 프로세스별 TTL 캐시를 제공합니다.
+ORM 객체 대신 컬럼 값 스냅샷을 저장하여 요청 간에 세션 상태를 공유하지 않습니다.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+from config import Config
+
+
+class UserCache:
+    """사용자 ID별 컬럼 값 스냅샷을 보관하는 TTL + LRU 캐시"""
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """캐시된 스냅샷을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            data, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return data
+
+    def set(self, user_id: int, data: Dict[str, Any]) -> None:
+        """스냅샷을 저장합니다."""
+        with self._lock:
+            self._entries[user_id] = (data, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """사용자 정보가 변경되었을 때 스냅샷을 삭제합니다."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def invalidate_many(self, user_ids: Iterable[int]) -> None:
+        """여러 사용자의 스냅샷을 삭제합니다."""
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# 싱글톤 사용자 캐시 (USER_CACHE_TTL이 0이면 비활성화)
+user_cache = (
+    UserCache(Config.USER_CACHE_TTL, Config.USER_CACHE_MAX_ENTRIES)
+    if Config.USER_CACHE_TTL > 0
+    else None
+)
@@ -0,0 +1,143 @@
+"""
+지연 기록(write-behind) 유틸리티
+자주 바뀌지만 즉시 저장할 필요가 없는 컬럼 값(예: 마지막 로그인 시각)을
+기본 키별로 메모리에서 병합했다가 백그라운드 스레드에서 일괄 UPDATE합니다.
+"""
+
+import os
+import atexit
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+from sqlalchemy import update
+from config import Config, db
+from utils.logging import logger
+
+
+class WriteBehindUpdater:
+    """기본 키별 최신 값만 유지하다가 주기적으로 일괄 저장하는 지연 기록기"""
+
+    def __init__(self, flush_interval: float = 5.0, max_pending: int = 1000):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._app = None
+        self._model = None
+        self._on_flush: Optional[Callable[[Iterable[Any]], None]] = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # 기본 키 -> 변경할 컬럼 값 (같은 키의 값은 마지막 값으로 병합)
+        self._pending: Dict[Any, Dict[str, Any]] = {}
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = None
+
+    def init_app(
+        self,
+        app,
+        model,
+        on_flush: Optional[Callable[[Iterable[Any]], None]] = None,
+    ) -> None:
+        """
+        저장에 사용할 Flask 앱과 모델을 등록합니다.
+
+        Args:
+            app: Flask 앱
+            model: 갱신할 모델 (기본 키 컬럼은 id)
+            on_flush: 저장 후 갱신된 기본 키 목록을 받는 콜백 (캐시 무효화 등)
+        """
+        self._app = app
+        self._model = model
+        self._on_flush = on_flush
+        atexit.register(self.flush)
+
+    def record(self, pk: Any, **values: Any) -> bool:
+        """
+        변경할 값을 기록합니다. 저장은 백그라운드에서 수행됩니다.
+
+        Returns:
+            기록 여부 (init_app 전이면 False, 호출자가 직접 저장해야 함)
+        """
+        if self._app is None:
+            return False
+
+        with self._lock:
+            self._pending.setdefault(pk, {}).update(values)
+            should_wake = len(self._pending) >= self.max_pending
+
+        self._ensure_thread()
+        if should_wake:
+            self._wakeup.set()
+        return True
+
+    def _ensure_thread(self) -> None:
+        """저장 스레드를 시작합니다. fork된 워커 프로세스에서는 새로 시작합니다."""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._flush_loop, name="write-behind", daemon=True
+            )
+            self._thread.start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"지연 기록 저장 실패: {str(e)}")
+
+    def flush(self) -> int:
+        """
+        대기 중인 변경을 일괄 저장합니다.
+
+        Returns:
+            갱신한 행 수
+        """
+        if self._app is None:
+            return 0
+
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+
+            # 같은 컬럼 조합끼리 묶어 executemany로 갱신
+            groups: Dict[tuple, list] = {}
+            for pk, values in pending.items():
+                groups.setdefault(tuple(sorted(values)), []).append(
+                    {"id": pk, **values}
+                )
+
+            try:
+                with self._app.app_context():
+                    for rows in groups.values():
+                        db.session.execute(update(self._model), rows)
+                    db.session.commit()
+            except Exception:
+                # 저장하지 못한 값은 그 사이 새로 기록된 값을 덮어쓰지 않도록 되돌림
+                with self._lock:
+                    for pk, values in pending.items():
+                        self._pending[pk] = {**values, **self._pending.get(pk, {})}
+                raise
+
+        if self._on_flush:
+            self._on_flush(pending.keys())
+        logger.debug(f"지연 기록 {len(pending)}건 저장 완료")
+        return len(pending)
+
+
+# 마지막 로그인 시각 지연 기록기 (비활성화 시 None, 즉시 저장)
+last_login_writer = (
+    WriteBehindUpdater(
+        flush_interval=Config.LAST_LOGIN_FLUSH_INTERVAL,
+        max_pending=Config.LAST_LOGIN_MAX_PENDING,
+    )
+    if Config.LAST_LOGIN_WRITE_BEHIND
+    else None
+)
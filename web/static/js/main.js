@@ -219,12 +219,16 @@ document.addEventListener('DOMContentLoaded', function() {
             const result = await response.json();
             
             // 성공 메시지
-            alert(`템플릿 분석 완료: ${result.template_count}개 템플릿이 ${result.output_file} 파일에 저장되었습니다.`);
+            let message = `템플릿 분석 완료: ${result.template_count}개 템플릿 데이터가 준비되었습니다.`;
+            if (result.redundant_templates && result.redundant_templates.length > 0) {
+                message += `\n거의 같은 템플릿 ${result.redundant_templates.length}개는 한 번만 반영합니다.`;
+            }
+            alert(message);
             
             // NLP 분석 시작 확인
             if (confirm('수집된 템플릿 데이터를 자연어 처리(NLP) 기법으로 분석하시겠습니까?\n문서 구조, 어조, 핵심 키워드를 추출하고 결과는 JSON으로 저장됩니다.')) {
                 // 템플릿 내용 분석 API 호출
-                await analyzeTemplateContent(result.output_file);
+                await analyzeTemplateContent(result.artifact_id);
             }
             
             // 분석 완료 후 보고서 입력창에 포커스 설정
@@ -248,7 +252,7 @@ document.addEventListener('DOMContentLoaded', function() {
     });
     
     // 템플릿 내용 분석 함수
-    async function analyzeTemplateContent(jsonlFile) {
+    async function analyzeTemplateContent(artifactId) {
         try {
             const response = await fetch('/api/drafts/analyze-content', {
                 method: 'POST',
@@ -256,7 +260,7 @@ document.addEventListener('DOMContentLoaded', function() {
                     'Content-Type': 'application/json',
                 },
                 body: JSON.stringify({
-                    jsonl_file: jsonlFile
+                    artifact_id: artifactId
                 }),
             });
             
@@ -278,13 +282,18 @@ document.addEventListener('DOMContentLoaded', function() {
                 throw new Error(errorMessage);
             }
             
-            const result = await response.json();
+            // 분석은 백그라운드 작업으로 실행되므로 작업 완료까지 진행률을 표시
+            // (같은 템플릿을 이미 분석했으면 저장된 결과가 바로 반환됨)
+            const job = await response.json();
+            const result = job.cached ? job.result : await waitForJob(job, (status) => {
+                analyzeTemplates.innerHTML = `<i class="fas fa-spinner fa-spin mr-2"></i>분석 중... ${status.progress}%`;
+            });
             
             // 성공 메시지
             alert(`템플릿 내용 분석 완료: 결과가 ${result.output_file} 파일에 저장되었습니다.`);
             
-            // 분석 결과 파일을 가져와서 모달에 표시
-            await fetchAndDisplayAnalysisResult(result.output_file);
+            // 분석 결과를 화면에 표시
+            displayAnalysisResult(result.analysis);
             
         } catch (error) {
             console.error('템플릿 내용 분석 중 오류:', error);
@@ -293,76 +302,52 @@ document.addEventListener('DOMContentLoaded', function() {
     }
 
     /**
-     * 템플릿 분석 결과 파일을 가져와서 모달에 표시하는 함수
-     * @param {string} analysisFilePath - 분석 결과 파일 경로
+     * 백그라운드 작업이 끝날 때까지 상태를 확인하고 결과를 반환하는 함수
+     * @param {Object} job - 작업 제출 응답 (status_url, result_url 포함)
+     * @param {Function} onProgress - 상태 갱신 시 호출되는 콜백
+     * @returns {Promise<Object>} - 작업 결과
      */
-    async function fetchAndDisplayAnalysisResult(analysisFilePath) {
-        try {
-            // 파일 이름에서 경로 부분 제거 (Windows 경로도 처리)
-            let fileName = analysisFilePath.split('/').pop();
-            // Windows 경로인 경우 추가 처리 (드라이브 문자와 : 제거)
-            if (fileName.includes('\\') || fileName.includes(':')) {
-                fileName = fileName.split('\\').pop(); // 백슬래시로 분리
-                fileName = fileName.replace(/^[a-zA-Z]:/, ''); // 'c:' 같은 드라이브 문자 제거
+    async function waitForJob(job, onProgress) {
+        let delay = 500;
+        const maxDelay = 3000;
+        
+        while (true) {
+            const statusResponse = await fetch(job.status_url);
+            if (!statusResponse.ok) {
+                throw new Error(`작업 상태를 가져올 수 없습니다: ${statusResponse.status}`);
             }
             
-            // 로그 출력
-            console.log(`분석 결과 파일 가져오기: ${fileName}`);
-            
-            // 분석 결과를 가져오기 위한 재시도 로직
-            let analysisData = null;
-            let attempts = 0;
-            const maxAttempts = 5; // 최대 5번 시도
-            const initialDelay = 500; // 첫 시도는 0.5초 후
+            const status = await statusResponse.json();
+            if (onProgress) onProgress(status);
             
-            // 재시도 함수
-            const fetchWithRetry = async (attempt) => {
-                try {
-                    // 재시도 시 지연 시간 증가 (백오프 전략)
-                    const delay = initialDelay * Math.pow(1.5, attempt);
-                    
-                    if (attempt > 0) {
-                        console.log(`분석 결과 파일 가져오기 ${attempt}번째 시도 (${delay}ms 지연)...`);
-                    }
-                    
-                    // 지정된 시간만큼 대기
-                    await new Promise(resolve => setTimeout(resolve, delay));
-                    
-                    const response = await fetch(`/api/drafts/analysis/${fileName}`);
-                    
-                    if (!response.ok) {
-                        if (response.status === 404 && attempt < maxAttempts - 1) {
-                            // 파일을 찾을 수 없는 경우 다시 시도
-                            return null;
-                        }
-                        throw new Error(`분석 결과 파일을 가져올 수 없습니다: ${response.status}`);
-                    }
-                    
-                    return await response.json();
-                } catch (error) {
-                    if (attempt < maxAttempts - 1) {
-                        // 아직 재시도 가능한 경우
-                        console.error(`분석 결과 가져오기 실패 (시도 ${attempt + 1}/${maxAttempts}): ${error.message}`);
-                        return null;
-                    }
-                    throw error; // 최대 시도 횟수 초과 시 에러 던지기
+            if (status.status === 'succeeded') {
+                const resultResponse = await fetch(job.result_url);
+                const resultJson = await resultResponse.json();
+                if (!resultResponse.ok) {
+                    throw new Error(resultJson.error || `작업 결과를 가져올 수 없습니다: ${resultResponse.status}`);
                 }
-            };
+                return resultJson.result;
+            }
             
-            // 처음부터 maxAttempts까지 시도
-            for (attempts = 0; attempts < maxAttempts; attempts++) {
-                analysisData = await fetchWithRetry(attempts);
-                if (analysisData) {
-                    // 성공적으로 데이터를 가져오면 반복 중단
-                    break;
-                }
+            if (status.status === 'failed') {
+                throw new Error(status.error || '작업이 실패했습니다.');
             }
             
-            // 모든 시도 실패 시
-            if (!analysisData) {
-                throw new Error(`${maxAttempts}번의 시도 후에도 분석 결과 파일을 가져올 수 없습니다.`);
+            if (status.status === 'cancelled') {
+                throw new Error('작업이 취소되었습니다.');
             }
             
+            await new Promise(resolve => setTimeout(resolve, delay));
+            delay = Math.min(delay * 1.5, maxDelay);
+        }
+    }
+
+    /**
+     * 템플릿 분석 결과를 화면에 표시하는 함수
+     * @param {Object} analysisData - 분석 결과 데이터
+     */
+    function displayAnalysisResult(analysisData) {
+        try {
             // 분석 결과 섹션 요소 참조
             const analysisSection = document.getElementById('template-analysis-section');
             const analysisContent = document.getElementById('template-analysis-content');
@@ -511,60 +496,31 @@ document.addEventListener('DOMContentLoaded', function() {
 
         // 보고서 내용 표시
         const reportContent = document.createElement('div');
+        reportContent.id = 'resultReportContent';
         reportContent.className = 'mb-6 p-4 bg-gray-50 dark:bg-gray-700 rounded-md whitespace-pre-wrap text-gray-800 dark:text-gray-100';
         reportContent.style.maxHeight = '50vh';
         reportContent.style.overflow = 'auto';
         reportContent.style.fontFamily = 'Pretendard, sans-serif';
-        reportContent.textContent = result.report.content || '보고서 내용이 없습니다.';
+        reportContent.textContent = result.report.content || (result.streaming ? '' : '보고서 내용이 없습니다.');
         modalContent.appendChild(reportContent);
 
         // 파일 정보 표시 (있는 경우)
-        if (result.resultFile) {
-            const fileSection = document.createElement('div');
-            fileSection.className = 'mb-6 p-4 bg-blue-50 dark:bg-blue-900/20 rounded-md';
-            
-            fileSection.innerHTML = `
-                <div class="flex justify-between items-center">
-                    <div>
-                        <h3 class="text-lg font-semibold text-gray-800 dark:text-gray-100">저장된 파일</h3>
-                        <p class="text-gray-600 dark:text-gray-300 text-sm">${result.resultFile}</p>
-                    </div>
-                    <button id="downloadReportBtn" class="px-3 py-1 bg-blue-600 text-white rounded hover:bg-blue-700 transition-colors flex items-center">
-                        <i class="fas fa-download mr-2"></i>다운로드
-                    </button>
-                </div>
-            `;
-            
-            modalContent.appendChild(fileSection);
+        const fileSection = document.createElement('div');
+        fileSection.id = 'resultFileSection';
+        fileSection.className = 'mb-6 p-4 bg-blue-50 dark:bg-blue-900/20 rounded-md';
+        if (result.artifact_id) {
+            fileSection.innerHTML = renderResultFile(result.resultFile);
+        } else {
+            fileSection.classList.add('hidden');
         }
+        modalContent.appendChild(fileSection);
 
         // 토큰 사용량 섹션
         const tokenSection = document.createElement('div');
+        tokenSection.id = 'resultTokenSection';
         tokenSection.className = 'mb-6';
-        
-        const tokenInfo = result.report.token_usage || {};
-        
-        tokenSection.innerHTML = `
-            <h3 class="text-lg font-semibold text-gray-800 dark:text-gray-100 mb-2">토큰 사용량</h3>
-            <div class="grid grid-cols-2 gap-4 p-3 bg-gray-100 dark:bg-gray-700 rounded-md">
-                <div>
-                    <p class="text-sm text-gray-600 dark:text-gray-300">입력 토큰</p>
-                    <p class="text-gray-800 dark:text-gray-100">${tokenInfo.input_tokens || 0}</p>
-                </div>
-                <div>
-                    <p class="text-sm text-gray-600 dark:text-gray-300">출력 토큰</p>
-                    <p class="text-gray-800 dark:text-gray-100">${tokenInfo.output_tokens || 0}</p>
-                </div>
-                <div>
-                    <p class="text-sm text-gray-600 dark:text-gray-300">총 토큰</p>
-                    <p class="text-gray-800 dark:text-gray-100">${tokenInfo.total_tokens || 0}</p>
-                </div>
-                <div>
-                    <p class="text-sm text-gray-600 dark:text-gray-300">비용</p>
-                    <p class="text-gray-800 dark:text-gray-100">${tokenInfo.cost ? tokenInfo.cost.toFixed(2) + '원' : '0원'}</p>
-                </div>
-            </div>
-        `;
+        tokenSection.innerHTML = renderTokenUsage(result.token_info || result.report.token_usage || {})
+            + renderRedundantTemplates(result.redundant_templates);
         
         modalContent.appendChild(tokenSection);
 
@@ -576,7 +532,7 @@ document.addEventListener('DOMContentLoaded', function() {
         copyButton.className = 'px-4 py-2 bg-gray-200 dark:bg-gray-600 text-gray-800 dark:text-white rounded hover:bg-gray-300 dark:hover:bg-gray-500 transition-colors';
         copyButton.textContent = '내용 복사';
         copyButton.onclick = () => {
-            navigator.clipboard.writeText(result.report.content || '')
+            navigator.clipboard.writeText(reportContent.textContent || '')
                 .then(() => {
                     copyButton.textContent = '복사됨!';
                     setTimeout(() => {
@@ -613,15 +569,8 @@ document.addEventListener('DOMContentLoaded', function() {
         });
 
         // 다운로드 버튼 이벤트 리스너 추가
-        if (result.resultFile) {
-            setTimeout(() => {
-                const downloadBtn = document.getElementById('downloadReportBtn');
-                if (downloadBtn) {
-                    downloadBtn.addEventListener('click', () => {
-                        window.location.href = `/download/${result.resultFile}`;
-                    });
-                }
-            }, 0);
+        if (result.artifact_id) {
+            setTimeout(() => bindDownloadButton(result.download_url), 0);
         }
 
         // 모달 표시 애니메이션
@@ -631,6 +580,142 @@ document.addEventListener('DOMContentLoaded', function() {
         }, 10);
     }
     
+    /**
+     * 토큰 사용량 HTML을 생성하는 함수
+     * @param {Object} tokenInfo - 토큰 사용량 정보
+     * @returns {string} - 토큰 사용량 섹션 HTML
+     */
+    function renderTokenUsage(tokenInfo) {
+        const cost = tokenInfo.cost_krw ?? tokenInfo.cost;
+        return `
+            <h3 class="text-lg font-semibold text-gray-800 dark:text-gray-100 mb-2">토큰 사용량</h3>
+            <div class="grid grid-cols-2 gap-4 p-3 bg-gray-100 dark:bg-gray-700 rounded-md">
+                <div>
+                    <p class="text-sm text-gray-600 dark:text-gray-300">입력 토큰</p>
+                    <p class="text-gray-800 dark:text-gray-100">${tokenInfo.input_tokens || 0}</p>
+                </div>
+                <div>
+                    <p class="text-sm text-gray-600 dark:text-gray-300">출력 토큰</p>
+                    <p class="text-gray-800 dark:text-gray-100">${tokenInfo.output_tokens || 0}</p>
+                </div>
+                <div>
+                    <p class="text-sm text-gray-600 dark:text-gray-300">총 토큰</p>
+                    <p class="text-gray-800 dark:text-gray-100">${tokenInfo.total_tokens || 0}</p>
+                </div>
+                <div>
+                    <p class="text-sm text-gray-600 dark:text-gray-300">비용</p>
+                    <p class="text-gray-800 dark:text-gray-100">${cost ? cost.toFixed(2) + '원' : '0원'}</p>
+                </div>
+            </div>
+        `;
+    }
+
+    /**
+     * 유사 중복으로 프롬프트에서 제외된 템플릿 안내 HTML을 생성하는 함수
+     * @param {Array} redundantTemplates - [{id, title, duplicate_of}] 목록
+     * @returns {string} - 안내 HTML (제외된 템플릿이 없으면 빈 문자열)
+     */
+    function renderRedundantTemplates(redundantTemplates) {
+        if (!redundantTemplates || redundantTemplates.length === 0) return '';
+        const titles = redundantTemplates.map(item => item.title || item.id).join(', ');
+        return `
+            <p class="mt-2 text-sm text-gray-600 dark:text-gray-300">
+                <i class="fas fa-info-circle mr-1"></i>거의 같은 템플릿 ${redundantTemplates.length}개는 한 번만 반영했습니다: ${titles}
+            </p>
+        `;
+    }
+
+    /**
+     * 저장된 파일 정보 HTML을 생성하는 함수
+     * @param {string} resultFile - 저장된 결과 파일명
+     * @returns {string} - 파일 정보 섹션 HTML
+     */
+    function renderResultFile(resultFile) {
+        return `
+            <div class="flex justify-between items-center">
+                <div>
+                    <h3 class="text-lg font-semibold text-gray-800 dark:text-gray-100">저장된 파일</h3>
+                    <p class="text-gray-600 dark:text-gray-300 text-sm">${resultFile}</p>
+                </div>
+                <button id="downloadReportBtn" class="px-3 py-1 bg-blue-600 text-white rounded hover:bg-blue-700 transition-colors flex items-center">
+                    <i class="fas fa-download mr-2"></i>다운로드
+                </button>
+            </div>
+        `;
+    }
+
+    /**
+     * 다운로드 버튼에 이벤트를 연결하는 함수
+     * @param {string} downloadUrl - 저장된 결과 다운로드 URL
+     */
+    function bindDownloadButton(downloadUrl) {
+        const downloadBtn = document.getElementById('downloadReportBtn');
+        if (downloadBtn) {
+            downloadBtn.addEventListener('click', () => {
+                window.location.href = downloadUrl;
+            });
+        }
+    }
+
+    /**
+     * 스트리밍이 끝난 보고서 모달을 최종 결과로 갱신하는 함수
+     * @param {Object} result - done 이벤트로 받은 결과 객체
+     */
+    function finalizeGeneratedReport(result) {
+        const reportContent = document.getElementById('resultReportContent');
+        if (reportContent) {
+            reportContent.textContent = result.report.content || '보고서 내용이 없습니다.';
+        }
+
+        const tokenSection = document.getElementById('resultTokenSection');
+        if (tokenSection) {
+            tokenSection.innerHTML = renderTokenUsage(result.token_info || {})
+                + renderRedundantTemplates(result.redundant_templates);
+        }
+
+        const fileSection = document.getElementById('resultFileSection');
+        if (fileSection && result.artifact_id) {
+            fileSection.innerHTML = renderResultFile(result.resultFile);
+            fileSection.classList.remove('hidden');
+            bindDownloadButton(result.download_url);
+        }
+    }
+
+    /**
+     * SSE 응답 스트림을 읽어 이벤트 단위로 콜백을 호출하는 함수
+     * @param {Response} response - fetch 응답 객체
+     * @param {Function} onEvent - (이벤트명, 데이터) 콜백
+     */
+    async function readEventStream(response, onEvent) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder('utf-8');
+        let buffer = '';
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+
+            buffer += decoder.decode(value, { stream: true });
+            const messages = buffer.split('\n\n');
+            buffer = messages.pop();
+
+            messages.forEach(message => {
+                let eventName = 'message';
+                const dataLines = [];
+                message.split('\n').forEach(line => {
+                    if (line.startsWith('event:')) {
+                        eventName = line.slice(6).trim();
+                    } else if (line.startsWith('data:')) {
+                        dataLines.push(line.slice(5).trim());
+                    }
+                });
+                if (dataLines.length > 0) {
+                    onEvent(eventName, JSON.parse(dataLines.join('\n')));
+                }
+            });
+        }
+    }
+
     /**
      * 결과 모달 닫기 함수
      */
@@ -681,10 +766,12 @@ document.addEventListener('DOMContentLoaded', function() {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
+                    'Accept': 'text/event-stream',
                 },
                 body: JSON.stringify({
                     template_ids: templateIds,
-                    user_input: userInput
+                    user_input: userInput,
+                    stream: true
                 }),
             });
             
@@ -706,13 +793,37 @@ document.addEventListener('DOMContentLoaded', function() {
                 throw new Error(errorMessage);
             }
             
-            const result = await response.json();
+            // 첫 토큰이 도착하면 결과 모달을 열고 이후 토큰을 이어 붙임
+            let streamStarted = false;
+            let streamError = null;
             
-            // 보고서 생성 결과 처리 및 표시
-            displayGeneratedReport(result);
+            await readEventStream(response, (eventName, payload) => {
+                if (eventName === 'delta') {
+                    if (!streamStarted) {
+                        streamStarted = true;
+                        closeReportModalWithAnimation();
+                        displayGeneratedReport({ report: { content: '' }, streaming: true });
+                    }
+                    const reportContent = document.getElementById('resultReportContent');
+                    if (reportContent) {
+                        reportContent.textContent += payload.content;
+                        reportContent.scrollTop = reportContent.scrollHeight;
+                    }
+                } else if (eventName === 'done') {
+                    if (!streamStarted) {
+                        closeReportModalWithAnimation();
+                        displayGeneratedReport(payload);
+                    } else {
+                        finalizeGeneratedReport(payload);
+                    }
+                } else if (eventName === 'error') {
+                    streamError = payload.error;
+                }
+            });
             
-            // 모달 닫기
-            closeReportModalWithAnimation();
+            if (streamError) {
+                throw new Error(streamError);
+            }
             
         } catch (error) {
             console.error('보고서 생성 중 오류:', error);
@@ -2,6 +2,13 @@
 let selectedTemplates = [];
 let selectedTemplate = null;
 
+// 템플릿 미리 분석 요청 상태 (선택이 멈춘 뒤 대기 시간, 마지막으로 보낸 선택)
+const SPECULATION_DELAY_MS = 1200;
+let speculationTimer = null;
+let lastSpeculatedSelection = '';
+// 로그인하지 않아 미리 분석을 사용할 수 없으면 더 이상 요청하지 않음
+let speculationUnavailable = false;
+
 /**
  * 템플릿 렌더링 함수
  * @param {Array} templates - 템플릿 데이터 배열
@@ -51,7 +58,10 @@ function renderTemplates(templates) {
         cardElement.innerHTML = `
             <div class="p-4 flex flex-col h-full">
                 <div class="flex justify-between items-start mb-2">
-                    <span class="badge badge-primary theme-transition">${template.docType || '문서'}</span>
+                    <div class="flex items-center space-x-1">
+                        <span class="badge badge-primary theme-transition">${template.docType || '문서'}</span>
+                        ${template.similarCount ? `<span class="badge theme-transition text-muted-foreground" title="거의 같은 문서를 하나로 묶었습니다">유사 문서 ${template.similarCount}건</span>` : ''}
+                    </div>
                     <div class="flex items-center space-x-2">
                         <label class="flex items-center cursor-pointer">
                             <input type="checkbox" class="template-checkbox sr-only" data-template-id="${template.id}" ${isSelected ? 'checked' : ''}>
@@ -156,6 +166,47 @@ function addSelectedTemplate(template) {
     
     // UI 업데이트
     updateSelectedTemplatesUI();
+    loadSimilarTemplates(template);
+}
+
+/**
+ * 선택한 템플릿과 비슷한 템플릿 추천 표시 함수
+ * @param {Object} template - 기준 템플릿 객체
+ */
+async function loadSimilarTemplates(template) {
+    const container = document.getElementById('similar-templates-container');
+    const list = document.getElementById('similar-templates');
+    if (!container || !list) return;
+
+    try {
+        const response = await fetch(`/api/templates/${encodeURIComponent(template.id)}/similar?k=5`);
+        if (!response.ok) {
+            throw new Error(`추천 로드 실패: ${response.status}`);
+        }
+        const data = await response.json();
+        // 이미 선택한 템플릿은 제외
+        const items = (data.items || []).filter(
+            item => !selectedTemplates.some(selected => selected.id === item.id)
+        );
+
+        list.innerHTML = '';
+        items.forEach(item => {
+            const chip = document.createElement('button');
+            chip.type = 'button';
+            chip.className = 'bg-muted px-3 py-1 rounded-full text-xs text-card-foreground hover:bg-primary/10 transition-colors theme-transition';
+            chip.title = item.description || '';
+            chip.innerHTML = `<i class="fas fa-plus mr-1"></i>${item.title || '제목 없음'}`;
+            chip.addEventListener('click', function() {
+                addSelectedTemplate(item);
+                chip.remove();
+            });
+            list.appendChild(chip);
+        });
+        container.classList.toggle('hidden', items.length === 0);
+    } catch (error) {
+        console.error('비슷한 템플릿 로드 오류:', error);
+        container.classList.add('hidden');
+    }
 }
 
 /**
@@ -233,6 +284,43 @@ function updateSelectedTemplatesUI() {
         // 보고서 생성 버튼 비활성화
         generateReportBtn.disabled = true;
     }
+
+    scheduleSpeculativeAnalysis();
+}
+
+/**
+ * 템플릿 선택이 잠시 멈추면 선택한 템플릿의 분석을 서버에서 미리 시작하는 함수
+ * 선택이 바뀌면 서버가 이전 선택의 분석을 취소하고, 선택을 모두 해제하면 취소만 요청합니다.
+ */
+function scheduleSpeculativeAnalysis() {
+    if (speculationUnavailable) return;
+    clearTimeout(speculationTimer);
+    speculationTimer = setTimeout(async () => {
+        const templateIds = selectedTemplates.map(template => template.id);
+        const selectionKey = templateIds.join(',');
+        if (selectionKey === lastSpeculatedSelection) return;
+        lastSpeculatedSelection = selectionKey;
+
+        try {
+            const response = await fetch('/api/drafts/speculate', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({
+                    template_ids: templateIds
+                }),
+                redirect: 'manual',
+            });
+            // 로그인 페이지로 이동하라는 응답이면 미리 분석 중지
+            if (response.type === 'opaqueredirect' || response.status === 401) {
+                speculationUnavailable = true;
+            }
+        } catch (error) {
+            // 미리 분석은 선택 사항이므로 실패해도 무시
+            console.debug('템플릿 미리 분석 요청 실패:', error);
+        }
+    }, SPECULATION_DELAY_MS);
 }
 
 /**